@@ -123,11 +123,22 @@ def create_agent_configs(phase: int = 1) -> List[Dict[str, Any]]:
     # Import tools based on phase
     from .tools import (
         NumeraiDataTool,
+        FeatureMetadataTool,
         ScratchpadTool,
         KVTool,
         ModelTrainingTool,
+        ModelEvaluationTool,
+        NeutralizationTool,
+        EnsembleTool,
+        HyperparameterSweepTool,
+        TrainingJobsTool,
+        TrainingStatusTool,
+        TrainingResultTool,
+        PredictionTool,
         SubmissionSimulatorTool,
+        StakeRiskTool,
         BusinessSimTool,
+        RiskMetricsTool,
         VectorMemoryTool,
     )
     
@@ -140,17 +151,29 @@ def create_agent_configs(phase: int = 1) -> List[Dict[str, Any]]:
     # ModelAgent configuration
     model_tools = [
         ModelTrainingTool(),
+        ModelEvaluationTool(),
+        HyperparameterSweepTool(),
+        TrainingJobsTool(),
+        TrainingStatusTool(),
+        TrainingResultTool(),
         KVTool(),
     ]
     
     # SubmissionAgent configuration
     submission_tools = [
+        PredictionTool(),
         SubmissionSimulatorTool(),
+        StakeRiskTool(),
     ]
     
     # Add advanced tools based on phase
     if phase >= 2:
-        submission_tools.append(BusinessSimTool())
+        data_tools.append(FeatureMetadataTool())
+        model_tools.append(NeutralizationTool())
+        submission_tools.extend([BusinessSimTool(), RiskMetricsTool()])
+    
+    if phase >= 3:
+        model_tools.append(EnsembleTool())
     
     if phase >= 4:
         data_tools.append(VectorMemoryTool())
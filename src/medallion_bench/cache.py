@@ -0,0 +1,283 @@
+"""Process-wide cache of loaded dataset slices shared by concurrent samples.
+
+Every sample of a task reads the same splits, so projected arrays are
+materialized once per process and handed out as read-only, reference-counted
+views. Entries are keyed by ``(dataset, rows, features, seed)`` and evicted
+least-recently-used first once the byte budget is exceeded; entries with live
+views are never evicted. Slices are loaded outside the cache lock, so a slow
+miss never blocks other samples' hits; samples missing on the same slice wait
+for the one load in progress. Arrays derived from a slice (such as factorizations)
+can be cached on its entry and share its lifetime and budget.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .store import EraStore
+
+CACHE_BYTES_ENV = "MEDALLION_BENCH_CACHE_BYTES"
+DEFAULT_CACHE_BYTES = 4 * 1024 ** 3
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class DatasetView:
+    """Read-only arrays for one cached dataset slice.
+
+    Holds a reference on its cache entry until :meth:`release` is called
+    (or the ``with`` block exits).
+    """
+
+    def __init__(
+        self,
+        cache: "DatasetCache",
+        key: CacheKey,
+        arrays: Dict[str, np.ndarray],
+        hit: bool,
+    ):
+        self._cache = cache
+        self.key = key
+        self.hit = hit
+        self._arrays = arrays
+        self._released = False
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays
+
+    @property
+    def X(self) -> np.ndarray:
+        """``(rows, features)`` uint8 feature codes."""
+        return self._arrays["X"]
+
+    @property
+    def y(self) -> np.ndarray:
+        """``(rows,)`` float32 main target."""
+        return self._arrays["y"]
+
+    @property
+    def eras(self) -> np.ndarray:
+        """``(rows,)`` int32 era labels."""
+        return self._arrays["eras"]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the underlying cache entry."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def derived(self, name: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Array computed from this slice, cached on its entry.
+
+        Args:
+            name: Name of the derived array (e.g. ``'qr'``)
+            compute: Builds the array on first use
+
+        Returns:
+            The cached read-only array
+        """
+        return self._cache._derived(self.key, name, compute)
+
+    def release(self) -> None:
+        """Drop this view's reference on the cache entry."""
+        if not self._released:
+            self._released = True
+            self._cache._release(self.key)
+
+    def __enter__(self) -> "DatasetView":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+class _Entry:
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.nbytes = sum(array.nbytes for array in arrays.values())
+        self.refs = 0
+
+
+class DatasetCache:
+    """LRU cache of dataset arrays under a byte budget."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Byte budget for unreferenced entries
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._loading: Dict[CacheKey, "Future[None]"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently held across all entries."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(
+        self,
+        era_store: EraStore,
+        rows: slice,
+        features: Optional[Sequence[str]] = None,
+        seed: int = 42,
+    ) -> DatasetView:
+        """Get a read-only view of a dataset slice, loading it on a miss.
+
+        Args:
+            era_store: Store to load from on a miss
+            rows: Contiguous row slice (e.g. from ``EraStore.era_rows``)
+            features: Feature names to project (default: all)
+            seed: Data seed the store was generated with
+
+        Returns:
+            DatasetView: Referenced view; call ``release()`` when done
+        """
+        key = (
+            era_store.dataset,
+            rows.start,
+            rows.stop,
+            None if features is None else tuple(features),
+            seed,
+            str(era_store.path),
+        )
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    entry.refs += 1
+                    return DatasetView(self, key, entry.arrays, True)
+                loading = self._loading.get(key)
+                if loading is None:
+                    self.misses += 1
+                    loading = self._loading[key] = Future()
+                    break
+            # Another sample is loading this slice; use its result (or error).
+            loading.result()
+
+        try:
+            entry = _Entry(_load_arrays(era_store, rows, features))
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            loading.set_exception(e)
+            raise
+        with self._lock:
+            entry.refs += 1
+            self._entries[key] = entry
+            del self._loading[key]
+            self._evict()
+        loading.set_result(None)
+        return DatasetView(self, key, entry.arrays, False)
+
+    def clear(self) -> None:
+        """Drop all unreferenced entries and reset counters."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.refs == 0]:
+                del self._entries[key]
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> str:
+        """One-line hit/miss summary for tool output."""
+        return (
+            f"{self.hits} hits, {self.misses} misses, {len(self)} entries, "
+            f"{self.nbytes / 1e6:.1f} of {self.max_bytes / 1e6:.0f} MB"
+        )
+
+    def _derived(
+        self,
+        key: CacheKey,
+        name: str,
+        compute: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        with self._lock:
+            entry = self._entries[key]
+            array = entry.arrays.get(name)
+        if array is not None:
+            return array
+
+        # Computed outside the lock; a concurrent duplicate is discarded.
+        array = compute()
+        array.setflags(write=False)
+        with self._lock:
+            array = entry.arrays.setdefault(name, array)
+            entry.nbytes = sum(a.nbytes for a in entry.arrays.values())
+            self._evict()
+        return array
+
+    def _release(self, key: CacheKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs -= 1
+                self._evict()
+
+    def _evict(self) -> None:
+        total = self.nbytes
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry.refs == 0:
+                del self._entries[key]
+                total -= entry.nbytes
+                self.evictions += 1
+
+
+def _load_arrays(
+    era_store: EraStore,
+    rows: slice,
+    features: Optional[Sequence[str]],
+) -> Dict[str, np.ndarray]:
+    """Materialize a dataset slice as read-only in-memory arrays."""
+    arrays = {
+        "X": np.array(era_store.features(features, rows), order="F"),
+        "y": np.array(era_store.target(rows)),
+        "eras": np.array(era_store.eras(rows)),
+    }
+    for array in arrays.values():
+        array.setflags(write=False)
+    return arrays
+
+
+_cache: Optional[DatasetCache] = None
+_cache_lock = threading.Lock()
+
+
+def dataset_cache() -> DatasetCache:
+    """The process-wide dataset cache.
+
+    The byte budget comes from ``$MEDALLION_BENCH_CACHE_BYTES`` (default
+    4 GiB) unless set with :func:`configure_cache`.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_bytes = int(os.environ.get(CACHE_BYTES_ENV, DEFAULT_CACHE_BYTES))
+            _cache = DatasetCache(max_bytes)
+        return _cache
+
+
+def configure_cache(max_bytes: int) -> DatasetCache:
+    """Set the byte budget of the process-wide cache."""
+    cache = dataset_cache()
+    with cache._lock:
+        cache.max_bytes = max_bytes
+        cache._evict()
+    return cache
@@ -0,0 +1,132 @@
+"""Era-wise purged cross-validation.
+
+Folds are contiguous blocks of eras. Numerai targets span several eras, so
+eras just before a test block (``purge``) and just after it (``embargo``)
+are dropped from that fold's training set to keep overlapping targets from
+leaking into the score. Each fold is an independent job that runs in a pool
+worker and returns the per-era correlation of its test eras.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .evaluation import evaluate_predictions, score_summary
+from .gram import fit_gram_ridge, gram_eligible, load_era_grams
+from .jobs import training_targets
+from .store import EraStore, dataset_path
+from .training import fit_model
+
+Fold = Tuple[np.ndarray, np.ndarray]
+
+
+def era_folds(
+    n_eras: int,
+    n_folds: int,
+    purge: int = 0,
+    embargo: int = 0,
+) -> List[Fold]:
+    """Split era positions into contiguous test blocks with purged training sets.
+
+    Args:
+        n_eras: Number of eras
+        n_folds: Number of folds (at least 2, at most ``n_eras``)
+        purge: Eras dropped from training immediately before each test block
+        embargo: Eras dropped from training immediately after each test block
+
+    Returns:
+        ``(train_positions, test_positions)`` per fold
+
+    Raises:
+        ValueError: If the fold count or windows leave a fold without data
+    """
+    if not 2 <= n_folds <= n_eras:
+        raise ValueError(
+            f"cv_folds must be between 2 and {n_eras} (the number of eras)"
+        )
+    if purge < 0 or embargo < 0:
+        raise ValueError("purge and embargo must be non-negative")
+
+    positions = np.arange(n_eras)
+    folds = []
+    for test in np.array_split(positions, n_folds):
+        excluded = (positions >= test[0] - purge) & (positions <= test[-1] + embargo)
+        train = positions[~excluded]
+        if len(train) == 0:
+            raise ValueError("purge and embargo leave a fold with no training eras")
+        folds.append((train, test))
+    return folds
+
+
+def run_cv_fold(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Fit on one fold's training eras and score its test eras; runs in a worker.
+
+    Args:
+        request: Training request (see ``jobs.run_training_job``) plus
+            ``train_eras`` and ``test_eras`` era positions of the split
+
+    Returns:
+        Dict with the fold's ``test_eras`` labels, ``per_era`` correlation
+        and the number of training eras and rows
+    """
+    era_store = EraStore(
+        dataset_path(
+            "training", seed=request["data_seed"], data_dir=request["data_dir"]
+        )
+    )
+    index = era_store.era_index
+    train, test = request["train_eras"], request["test_eras"]
+    features = request["features"]
+
+    targets = request.get("targets")
+    if gram_eligible(request["model_type"], request["hyperparameters"], targets):
+        model, _ = fit_gram_ridge(
+            load_era_grams(era_store),
+            era_store.feature_index(features),
+            train,
+            request["hyperparameters"],
+            n_threads=request.get("n_threads") or 1,
+        )
+    else:
+        rows = np.concatenate([np.arange(index[i, 1], index[i, 2]) for i in train])
+        model = fit_model(
+            request["model_type"],
+            np.asarray(era_store.features(features, rows)),
+            training_targets(era_store, targets, rows),
+            request["hyperparameters"],
+            seed=request["seed"],
+            n_threads=request.get("n_threads"),
+        )
+
+    test_rows = slice(int(index[test[0], 1]), int(index[test[-1], 2]))
+    result = evaluate_predictions(
+        model.predict(np.asarray(era_store.features(features, test_rows))),
+        era_store.target(test_rows),
+        era_store.eras(test_rows),
+    )
+    return {
+        "test_eras": result["eras"].tolist(),
+        "per_era": result["per_era"].tolist(),
+        "train_eras": len(train),
+        "train_rows": int(np.sum(index[train, 2] - index[train, 1])),
+    }
+
+
+def cv_summary(folds: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate fold results.
+
+    Args:
+        folds: Outputs of :func:`run_cv_fold`, in fold order
+
+    Returns:
+        Dict with ``per_fold`` arrays of per-era correlation, per-fold
+        summaries in ``fold_summaries``, and the summary of all
+        out-of-fold eras pooled (``mean``, ``std``, ``sharpe``,
+        ``max_drawdown``)
+    """
+    per_fold = [np.asarray(fold["per_era"]) for fold in folds]
+    return {
+        "per_fold": per_fold,
+        "fold_summaries": [score_summary(per_era) for per_era in per_fold],
+        **score_summary(np.concatenate(per_fold)),
+    }
@@ -1,6 +1,6 @@
 """Numerai dataset handling for MedallionBench."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from inspect_ai.dataset import Sample
 
@@ -100,6 +100,39 @@ def _get_data_config(round_num: int, phase: int) -> Dict[str, Any]:
     return config
 
 
+def allowed_era_range(
+    data_config: Dict[str, Any],
+    dataset: str,
+    eras: Sequence[int],
+) -> Optional[Tuple[int, int]]:
+    """Inclusive era window a round may read from a dataset split.
+
+    Maps a phase-gated data config onto a store's era index:
+    - Training: the first half of the training eras as a basic sample,
+      all training eras once feature metadata is available (Phase 2+)
+    - Validation and tournament: all eras of the split when enabled
+    
+    Args:
+        data_config: Round data config from ``_get_data_config``
+        dataset: Dataset split ('training', 'validation', 'tournament')
+        eras: Eras present in the split, in order
+        
+    Returns:
+        ``(first, last)`` era, or None if the split is not available
+    """
+    flags = {
+        "training": "training_data",
+        "validation": "validation_data",
+        "tournament": "tournament_data",
+    }
+    if not eras or not data_config.get(flags.get(dataset, ""), False):
+        return None
+    
+    if dataset == "training" and not data_config["feature_metadata"]:
+        return eras[0], eras[max(len(eras) // 2 - 1, 0)]
+    return eras[0], eras[-1]
+
+
 def _create_round_prompt(round_num: int, data_config: Dict[str, Any]) -> str:
     """Create the prompt for a tournament round."""
     prompt = f"""# Numerai Tournament Round {round_num}
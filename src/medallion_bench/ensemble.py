@@ -0,0 +1,254 @@
+"""Vectorized blending of stored model predictions.
+
+Members are stacked into one ``(N, rows)`` float32 matrix of era-sorted
+predictions. Rank blending ranks every member within every era with a single
+argsort (each ``(member, era)`` pair is treated as its own era) and averages
+the ranks by weight, so the blend is one ``(N,) @ (N, rows)`` product.
+
+Weight search scores thousands of candidate weight vectors without forming a
+single blend: the Pearson correlation of ``w @ R`` with the target in an era
+only depends on the era's ``N × N`` covariance of the members and their
+covariance with the target, which are computed once. The best candidates are
+then rescored exactly with Numerai correlation.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .evaluation import era_rank, numerai_corr, score_summary
+
+BLEND_METHODS = ("rank", "raw")
+SEARCH_OBJECTIVES = ("corr", "sharpe")
+
+
+def stack_predictions(members: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack equal-length prediction vectors into an ``(N, rows)`` float32 matrix."""
+    matrix = np.empty((len(members), len(members[0])), dtype=np.float32)
+    for i, member in enumerate(members):
+        matrix[i] = member
+    return matrix
+
+
+def era_rank_matrix(predictions: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-era percentile ranks of every member, in one argsort.
+
+    Args:
+        predictions: ``(N, rows)`` era-sorted predictions
+        offsets: Era offsets of the rows (see ``evaluation.era_offsets``)
+
+    Returns:
+        ``(N, rows)`` float32 ranks in ``(0, 1)``, ties averaged
+    """
+    n_members, n_rows = predictions.shape
+    # Rescale each member to [0, 1] so members on different scales share
+    # the sort key's resolution.
+    lo = predictions.min(axis=1, keepdims=True)
+    span = predictions.max(axis=1, keepdims=True) - lo
+    scaled = np.divide(
+        predictions - lo, span, out=np.zeros(predictions.shape), where=span > 0
+    )
+    member_offsets = np.append(
+        (offsets[:-1][None, :] + n_rows * np.arange(n_members)[:, None]).ravel(),
+        n_members * n_rows,
+    )
+    ranks = era_rank(scaled.ravel(), member_offsets)
+    return ranks.reshape(n_members, n_rows).astype(np.float32)
+
+
+def blend(
+    predictions: np.ndarray,
+    weights: np.ndarray,
+    offsets: np.ndarray,
+    method: str = "rank",
+) -> np.ndarray:
+    """Weighted blend of ``(N, rows)`` predictions.
+
+    Args:
+        predictions: ``(N, rows)`` era-sorted predictions
+        weights: ``(N,)`` non-negative weights (normalized here)
+        offsets: Era offsets of the rows
+        method: ``'rank'`` averages per-era ranks, ``'raw'`` the predictions
+
+    Returns:
+        ``(rows,)`` float32 blend
+
+    Raises:
+        ValueError: On an unknown method or invalid weights
+    """
+    weights = _normalized(weights, len(predictions))
+    matrix = _blend_matrix(predictions, offsets, method)
+    return np.asarray(weights.astype(np.float32) @ matrix, dtype=np.float32)
+
+
+def candidate_weights(
+    n_members: int,
+    n_candidates: int = 512,
+    seed: int = 42,
+) -> np.ndarray:
+    """Equal weights, each member alone, and random points of the simplex.
+
+    Returns:
+        ``(K, N)`` weight vectors summing to one
+    """
+    rng = np.random.default_rng(seed)
+    return np.vstack([
+        np.full((1, n_members), 1.0 / n_members),
+        np.eye(n_members),
+        rng.dirichlet(np.ones(n_members), size=max(n_candidates, 0)),
+    ])
+
+
+def era_moments(
+    matrix: np.ndarray,
+    target: np.ndarray,
+    offsets: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Per-era covariances of the members and of members with the target.
+
+    One ``(N, n) @ (n, N)`` product per era.
+
+    Returns:
+        Dict with ``cov`` (n_eras, N, N), ``cov_y`` (n_eras, N) and
+        ``var_y`` (n_eras,)
+    """
+    n_members = len(matrix)
+    n_eras = len(offsets) - 1
+    cov = np.empty((n_eras, n_members, n_members))
+    cov_y = np.empty((n_eras, n_members))
+    var_y = np.empty(n_eras)
+    for e, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+        m = matrix[:, start:stop].astype(np.float64)
+        m -= m.mean(axis=1, keepdims=True)
+        y = np.asarray(target[start:stop], dtype=np.float64)
+        y = y - y.mean()
+        n = stop - start
+        cov[e] = m @ m.T / n
+        cov_y[e] = m @ y / n
+        var_y[e] = y @ y / n
+    return {"cov": cov, "cov_y": cov_y, "var_y": var_y}
+
+
+def candidate_pearson(
+    moments: Dict[str, np.ndarray],
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Per-era Pearson correlation of each weighted blend with the target.
+
+    Args:
+        moments: Output of :func:`era_moments`
+        weights: ``(K, N)`` candidate weights
+
+    Returns:
+        ``(K, n_eras)`` correlations
+    """
+    num = weights @ moments["cov_y"].T
+    var = np.einsum("kn,enm,km->ke", weights, moments["cov"], weights)
+    denom = np.sqrt(np.maximum(var, 0.0) * np.maximum(moments["var_y"], 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom > 0, num / denom, 0.0)
+
+
+def search_weights(
+    predictions: np.ndarray,
+    target: np.ndarray,
+    offsets: np.ndarray,
+    method: str = "rank",
+    objective: str = "corr",
+    n_candidates: int = 512,
+    top_k: int = 8,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """Search blend weights that maximize per-era correlation or Sharpe.
+
+    Every candidate is scored in closed form by the Pearson correlation of
+    the blend with the transformed target; the ``top_k`` best are rescored
+    with Numerai correlation and the best of those is returned.
+
+    Args:
+        predictions: ``(N, rows)`` era-sorted predictions
+        target: ``(rows,)`` target
+        offsets: Era offsets of the rows
+        method: Blend method (see :func:`blend`)
+        objective: ``'corr'`` (mean per era) or ``'sharpe'``
+        n_candidates: Random simplex points to try
+        top_k: Candidates rescored exactly
+        seed: Sampling seed
+
+    Returns:
+        Dict with ``weights`` (N,), ``per_era`` Numerai correlation of the
+        chosen blend and ``candidates`` (number scored)
+
+    Raises:
+        ValueError: On an unknown method or objective, or if ``top_k`` is
+            less than 1
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+    if objective not in SEARCH_OBJECTIVES:
+        raise ValueError(
+            f"Unknown objective: {objective}. "
+            f"Choose from {', '.join(SEARCH_OBJECTIVES)}"
+        )
+    matrix = _blend_matrix(predictions, offsets, method)
+
+    centered = np.asarray(target, dtype=np.float64) - 0.5
+    target_p = np.sign(centered) * np.abs(centered) ** 1.5
+    weights = candidate_weights(len(predictions), n_candidates, seed)
+    proxy = candidate_pearson(era_moments(matrix, target_p, offsets), weights)
+
+    best, best_per_era, best_score = -1, np.zeros(0), -np.inf
+    for k in np.argsort(-_objective(proxy, objective))[:top_k]:
+        per_era = numerai_corr(weights[k].astype(np.float32) @ matrix, target, offsets)
+        score = _objective(per_era[None, :], objective)[0]
+        if best < 0 or score > best_score:
+            best, best_per_era, best_score = int(k), per_era, score
+    return {
+        "weights": weights[best],
+        "per_era": best_per_era,
+        "candidates": len(weights),
+    }
+
+
+def member_summaries(
+    predictions: np.ndarray,
+    target: np.ndarray,
+    offsets: np.ndarray,
+) -> List[Dict[str, float]]:
+    """Score summary of each member's Numerai correlation."""
+    return [
+        score_summary(numerai_corr(member, target, offsets)) for member in predictions
+    ]
+
+
+def _blend_matrix(
+    predictions: np.ndarray,
+    offsets: np.ndarray,
+    method: str,
+) -> np.ndarray:
+    """Matrix the blend weights apply to: per-era ranks or raw predictions."""
+    if method == "rank":
+        return era_rank_matrix(predictions, offsets)
+    if method == "raw":
+        return predictions
+    raise ValueError(
+        f"Unknown blend method: {method}. Choose from {', '.join(BLEND_METHODS)}"
+    )
+
+
+def _objective(per_era: np.ndarray, objective: str) -> np.ndarray:
+    """Objective of ``(K, n_eras)`` per-era scores."""
+    mean = np.asarray(per_era.mean(axis=1))
+    if objective == "corr" or per_era.shape[1] < 2:
+        return mean
+    std = per_era.std(axis=1, ddof=1)
+    return np.where(std > 0, mean / np.where(std > 0, std, 1.0), 0.0)
+
+
+def _normalized(weights: Any, n_members: int) -> np.ndarray:
+    values = np.asarray(weights, dtype=np.float64)
+    if values.shape != (n_members,):
+        raise ValueError(f"Expected {n_members} weights, got {values.size}")
+    if np.any(values < 0) or values.sum() <= 0:
+        raise ValueError("Weights must be non-negative with a positive sum")
+    return values / float(values.sum())
@@ -0,0 +1,261 @@
+"""Vectorized per-era evaluation of Numerai predictions.
+
+Rows are era-sorted, so eras are described by an offsets array (row where
+each era starts, plus the total row count) rather than by grouping. Ranking
+every era takes one ``np.lexsort`` by era and then prediction, and per-era
+reductions use ``np.add.reduceat`` over the offsets.
+
+Feature exposure is one matrix product per era. Neutralization projects
+predictions off the span of a feature set using a per-era orthonormal basis
+(pivoted QR of the era-centered features); the bases of all eras are stacked
+into one ``(rows, k)`` array so it can be cached and applied to any number of
+prediction vectors and proportions without re-solving least squares.
+"""
+
+from typing import Dict, TypedDict
+
+import numpy as np
+from scipy.linalg import qr
+from scipy.special import ndtri
+
+from .store import dequantize
+
+
+def era_offsets(eras: np.ndarray) -> np.ndarray:
+    """Start row of each era in era-sorted ``eras``, plus ``len(eras)``."""
+    eras = np.asarray(eras)
+    if len(eras) == 0:
+        return np.zeros(1, dtype=np.int64)
+    starts = np.flatnonzero(np.diff(eras, prepend=eras[0] - 1))
+    return np.append(starts, len(eras)).astype(np.int64)
+
+
+def era_rank(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Percentile rank of ``values`` within each era, ties averaged.
+
+    Args:
+        values: ``(rows,)`` era-sorted values
+        offsets: Era offsets from :func:`era_offsets`
+
+    Returns:
+        ``(rows,)`` float64 ranks in ``(0, 1)``: ``(average rank + 0.5) / n``
+    """
+    n_rows = len(values)
+    sizes = np.diff(offsets)
+    era_pos = np.repeat(np.arange(len(sizes)), sizes)
+
+    # One sort orders every era at once: by era position, then by value.
+    # Sorting keeps every era in its own block of positions, so sorted
+    # position ``i`` still belongs to era ``era_pos[i]``.
+    v = np.asarray(values, dtype=np.float64)
+    order = np.lexsort((v, era_pos))
+
+    # Runs of equal values within an era are ties; their ranks are averaged.
+    sorted_v = v[order]
+    new_run = np.ones(n_rows, dtype=bool)
+    new_run[1:] = (sorted_v[1:] != sorted_v[:-1]) | (np.diff(era_pos) != 0)
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, n_rows))
+    mean_pos = np.repeat(run_starts + (run_lengths - 1) / 2.0, run_lengths)
+
+    ranks = np.empty(n_rows)
+    ranks[order] = (mean_pos - offsets[:-1][era_pos] + 0.5) / sizes[era_pos]
+    return ranks
+
+
+def per_era_pearson(a: np.ndarray, b: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Pearson correlation of ``a`` and ``b`` within each era."""
+    starts = offsets[:-1]
+    sizes = np.diff(offsets).astype(np.float64)
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    mean_a = np.add.reduceat(a, starts) / sizes
+    mean_b = np.add.reduceat(b, starts) / sizes
+    cov = np.add.reduceat(a * b, starts) / sizes - mean_a * mean_b
+    var_a = np.add.reduceat(a * a, starts) / sizes - mean_a ** 2
+    var_b = np.add.reduceat(b * b, starts) / sizes - mean_b ** 2
+    denom = np.sqrt(np.maximum(var_a, 0) * np.maximum(var_b, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom > 0, cov / denom, 0.0)
+
+
+def numerai_corr(
+    predictions: np.ndarray,
+    target: np.ndarray,
+    offsets: np.ndarray,
+) -> np.ndarray:
+    """Per-era Numerai correlation.
+
+    Predictions are ranked and gaussianized within each era, the target is
+    centered, and both are raised to the 1.5 power (sign preserved) before
+    taking the Pearson correlation, as in Numerai's scoring.
+
+    Args:
+        predictions: ``(rows,)`` era-sorted predictions
+        target: ``(rows,)`` era-sorted target in ``[0, 1]``
+        offsets: Era offsets from :func:`era_offsets`
+
+    Returns:
+        ``(n_eras,)`` correlation per era
+    """
+    gauss = ndtri(era_rank(predictions, offsets))
+    pred_p = np.sign(gauss) * np.abs(gauss) ** 1.5
+    centered = np.asarray(target, dtype=np.float64) - 0.5
+    target_p = np.sign(centered) * np.abs(centered) ** 1.5
+    return per_era_pearson(pred_p, target_p, offsets)
+
+
+def max_drawdown(per_era: np.ndarray) -> float:
+    """Largest peak-to-trough fall of the cumulative per-era score."""
+    if len(per_era) == 0:
+        return 0.0
+    cumulative = np.cumsum(per_era)
+    peak = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    return float(np.max(peak - cumulative))
+
+
+def score_summary(per_era: np.ndarray) -> Dict[str, float]:
+    """Mean, std, Sharpe and max drawdown of a per-era score series."""
+    mean = float(np.mean(per_era)) if len(per_era) else 0.0
+    std = float(np.std(per_era, ddof=1)) if len(per_era) > 1 else 0.0
+    return {
+        "mean": mean,
+        "std": std,
+        "sharpe": mean / std if std > 0 else 0.0,
+        "max_drawdown": max_drawdown(per_era),
+    }
+
+
+class EraScores(TypedDict):
+    """Per-era correlation of one prediction vector and its summary."""
+
+    eras: np.ndarray
+    per_era: np.ndarray
+    mean: float
+    std: float
+    sharpe: float
+    max_drawdown: float
+
+
+def evaluate_predictions(
+    predictions: np.ndarray,
+    target: np.ndarray,
+    eras: np.ndarray,
+) -> EraScores:
+    """Per-era Numerai correlation and its summary statistics.
+
+    Args:
+        predictions: ``(rows,)`` predictions in era-sorted row order
+        target: ``(rows,)`` target
+        eras: ``(rows,)`` era labels, non-decreasing
+
+    Returns:
+        ``eras`` and ``per_era`` arrays plus ``mean``, ``std``, ``sharpe``
+        and ``max_drawdown``
+    """
+    offsets = era_offsets(eras)
+    per_era = numerai_corr(predictions, target, offsets)
+    summary = score_summary(per_era)
+    return {
+        "eras": np.asarray(eras)[offsets[:-1]],
+        "per_era": per_era,
+        "mean": summary["mean"],
+        "std": summary["std"],
+        "sharpe": summary["sharpe"],
+        "max_drawdown": summary["max_drawdown"],
+    }
+
+
+def feature_exposure(
+    predictions: np.ndarray,
+    codes: np.ndarray,
+    offsets: np.ndarray,
+) -> np.ndarray:
+    """Per-era correlation of predictions with every feature.
+
+    Args:
+        predictions: ``(rows,)`` era-sorted predictions
+        codes: ``(rows, features)`` uint8 feature codes
+        offsets: Era offsets from :func:`era_offsets`
+
+    Returns:
+        ``(n_eras, features)`` float32 correlations (0 for constant columns)
+    """
+    exposures = np.zeros((len(offsets) - 1, codes.shape[1]), dtype=np.float32)
+    for i, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+        X = dequantize(codes[start:stop])
+        X -= X.mean(axis=0)
+        p = np.asarray(predictions[start:stop], dtype=np.float32)
+        p = p - p.mean()
+        denom = np.linalg.norm(X, axis=0) * np.linalg.norm(p)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exposures[i] = np.where(denom > 0, (X.T @ p) / denom, 0.0)
+    return exposures
+
+
+def exposure_summary(exposures: np.ndarray) -> Dict[str, float]:
+    """Mean over eras of the max and RMS absolute feature exposure."""
+    if exposures.size == 0:
+        return {"max_exposure": 0.0, "rms_exposure": 0.0}
+    return {
+        "max_exposure": float(np.abs(exposures).max(axis=1).mean()),
+        "rms_exposure": float(np.sqrt((exposures ** 2).mean(axis=1)).mean()),
+    }
+
+
+def era_basis(codes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Stacked per-era orthonormal bases of the era-centered features.
+
+    Each era's block is ``Q[:, :rank]`` of a column-pivoted QR, so constant or
+    collinear features are dropped; unused trailing columns are zero.
+
+    Args:
+        codes: ``(rows, features)`` uint8 feature codes
+        offsets: Era offsets from :func:`era_offsets`
+
+    Returns:
+        ``(rows, min(features, max era size))`` float32 basis
+    """
+    width = min(codes.shape[1], int(np.diff(offsets).max(initial=0)))
+    basis = np.zeros((len(codes), width), dtype=np.float32)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        X = dequantize(codes[start:stop], dtype=np.float64)
+        X -= X.mean(axis=0)
+        q, r, _ = qr(X, mode="economic", pivoting=True)
+        diag = np.abs(np.diag(r))
+        rank = int(np.sum(diag > diag.max(initial=0) * 1e-7)) if diag.size else 0
+        basis[start:stop, :rank] = q[:, :rank]
+    return basis
+
+
+def neutralize(
+    predictions: np.ndarray,
+    basis: np.ndarray,
+    offsets: np.ndarray,
+    proportion: float = 1.0,
+) -> np.ndarray:
+    """Remove ``proportion`` of each era's projection onto the feature span.
+
+    Args:
+        predictions: ``(rows,)`` era-sorted predictions
+        basis: Stacked bases from :func:`era_basis`
+        offsets: Era offsets the basis was built with
+        proportion: Fraction of the projection to remove (1 = fully neutral)
+
+    Returns:
+        ``(rows,)`` float32 neutralized predictions, scaled to unit std per era
+    """
+    p = np.asarray(predictions, dtype=np.float32)
+    out = np.empty_like(p)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        q = basis[start:stop]
+        out[start:stop] = p[start:stop] - proportion * (q @ (q.T @ p[start:stop]))
+
+    sizes = np.diff(offsets)
+    era_pos = np.repeat(np.arange(len(sizes)), sizes)
+    starts = offsets[:-1]
+    mean = np.add.reduceat(out, starts) / sizes
+    out -= mean[era_pos]
+    std = np.sqrt(np.add.reduceat(out * out, starts) / sizes)
+    out /= np.where(std > 0, std, 1.0)[era_pos]
+    return out
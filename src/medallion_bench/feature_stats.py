@@ -0,0 +1,124 @@
+"""Precomputed per-era feature statistics and feature-metadata index.
+
+Statistics are computed once per split in a single streaming pass over the
+era store (per-era sums via ``np.add.reduceat``) and cached next to the data
+as ``feature_stats.npz``, so feature-metadata requests never rescan rows.
+"""
+
+import os
+import re
+import uuid
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .store import EraStore, dequantize
+
+STATS_FILE = "feature_stats.npz"
+
+
+def feature_group(name: str) -> str:
+    """Group of a feature name, e.g. 'intelligence' for 'feature_intelligence12'."""
+    match = re.fullmatch(r"feature_([a-z_]+?)\d+", name)
+    return match.group(1) if match else "other"
+
+
+def compute_feature_stats(
+    era_store: EraStore,
+    eras_per_batch: int = 8,
+) -> Dict[str, np.ndarray]:
+    """Compute per-era feature statistics in one pass over the store.
+
+    Args:
+        era_store: Split to summarize
+        eras_per_batch: Eras dequantized at a time (bounds peak memory)
+
+    Returns:
+        Dict with ``eras`` (n_eras,), per-era ``mean``, ``std`` and
+        ``target_corr`` (n_eras, n_features), all float32
+    """
+    n_eras, n_features = len(era_store.era_index), era_store.n_features
+    mean = np.empty((n_eras, n_features), dtype=np.float32)
+    std = np.empty_like(mean)
+    corr = np.full_like(mean, np.nan)
+
+    done = 0
+    for codes, y, eras in era_store.iter_era_batches(eras_per_batch):
+        X = dequantize(codes)
+        starts = np.flatnonzero(np.diff(eras, prepend=eras[0] - 1))
+        counts = np.diff(np.append(starts, len(eras)))[:, None].astype(np.float32)
+        batch = slice(done, done + len(starts))
+
+        sum_x = np.add.reduceat(X, starts, axis=0)
+        sum_xx = np.add.reduceat(X * X, starts, axis=0)
+        mean[batch] = sum_x / counts
+        var_x = np.maximum(sum_xx / counts - mean[batch] ** 2, 0.0)
+        std[batch] = np.sqrt(var_x)
+
+        if not np.isnan(y).all():
+            y = y.astype(np.float32)
+            y_mean = np.add.reduceat(y, starts) / counts[:, 0]
+            y_var = np.add.reduceat(y * y, starts) / counts[:, 0] - y_mean ** 2
+            cov = np.add.reduceat(X * y[:, None], starts, axis=0) / counts
+            cov -= mean[batch] * y_mean[:, None]
+            denom = std[batch] * np.sqrt(np.maximum(y_var, 0.0))[:, None]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr[batch] = np.where(denom > 0, cov / denom, 0.0)
+        done += len(starts)
+
+    return {
+        "eras": era_store.era_index[:, 0].astype(np.int32),
+        "mean": mean,
+        "std": std,
+        "target_corr": corr,
+    }
+
+
+def load_feature_stats(era_store: EraStore) -> Dict[str, np.ndarray]:
+    """Cached feature statistics for a split, computing them on first use."""
+    path = era_store.path / STATS_FILE
+    if path.exists():
+        with np.load(path) as cached:
+            return {key: cached[key] for key in cached.files}
+
+    stats = compute_feature_stats(era_store)
+    tmp = path.with_name(f".{uuid.uuid4().hex[:8]}-{STATS_FILE}")
+    # Typed loosely: numpy's stubs let ``**`` arrays collide with allow_pickle.
+    arrays: Dict[str, Any] = stats
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+    return stats
+
+
+def feature_summary(
+    era_store: EraStore,
+    stats: Dict[str, np.ndarray],
+) -> List[Dict[str, object]]:
+    """Per-feature summary rows combining metadata and statistics.
+
+    Args:
+        era_store: Split the statistics were computed on
+        stats: Output of :func:`load_feature_stats`
+
+    Returns:
+        One dict per feature with name, group, mean, std, mean per-era
+        target correlation and its Sharpe across eras
+    """
+    corr = stats["target_corr"]
+    corr_mean = np.nanmean(corr, axis=0)
+    corr_std = np.nanstd(corr, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr_sharpe = np.where(corr_std > 0, corr_mean / corr_std, 0.0)
+    mean = stats["mean"].mean(axis=0)
+    std = stats["std"].mean(axis=0)
+    return [
+        {
+            "name": name,
+            "group": feature_group(name),
+            "mean": float(mean[i]),
+            "std": float(std[i]),
+            "corr": float(corr_mean[i]),
+            "corr_sharpe": float(corr_sharpe[i]),
+        }
+        for i, name in enumerate(era_store.feature_names)
+    ]
@@ -0,0 +1,281 @@
+"""Cached per-era Gram matrices for closed-form ridge fits.
+
+For every era the store's feature codes ``C`` give ``CᵀC`` and ``Cᵀy`` plus
+the row count and column sums. They are computed once per split in a single
+pass and kept on disk next to the data, memory-mapped on load. A ridge on any
+feature subset and any set of eras then only gathers and sums ``k × k``
+blocks and solves one small system; rows are never read, so each
+cross-validation fold only sums its own training eras' blocks.
+
+Everything is stored in the code domain (``C`` are the ``uint8`` codes), so
+``CᵀC`` and the column sums are exact integers; values are rescaled by
+``1 / 4`` when a fit needs them.
+
+Layout::
+
+    <split>/gram/
+        eras.npy  n.npy  x.npy  y.npy  yy.npy  xy.npy  xx.npy
+"""
+
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from scipy.linalg import solve
+
+from .store import MAIN_TARGET, N_FEATURE_BINS, EraStore
+from .training import TrainedModel, limit_threads, resolve_engine
+
+GRAM_DIR = "gram"
+GRAM_ARRAYS = ("eras", "n", "x", "y", "yy", "xy", "xx")
+GRAM_PARAMS = ("alpha",)
+
+_SCALE = 1.0 / (N_FEATURE_BINS - 1)
+
+EraSelection = Union[slice, Sequence[int], np.ndarray]
+
+
+def compute_era_grams(
+    era_store: EraStore,
+    directory: Union[str, Path],
+    eras_per_batch: int = 4,
+) -> None:
+    """Compute per-era Gram matrices in one pass over the store.
+
+    Arrays are written straight into ``.npy`` memory maps in ``directory``
+    so the ``(n_eras, F, F)`` block never has to fit in memory.
+
+    Args:
+        era_store: Split to summarize
+        directory: Existing directory to write the arrays into
+        eras_per_batch: Eras read at a time (bounds peak memory)
+
+    Writes ``eras`` and ``n`` (n_eras,), code sums ``x`` (n_eras, F), target
+    sums ``y`` and ``yy`` (n_eras,), ``xy`` = ``Cᵀy`` (n_eras, F) and ``xx``
+    = ``CᵀC`` (n_eras, F, F, int32).
+    """
+    n_eras, n_features = len(era_store.era_index), era_store.n_features
+    shapes = {
+        "eras": ((n_eras,), np.int32),
+        "n": ((n_eras,), np.int64),
+        "x": ((n_eras, n_features), np.int64),
+        "y": ((n_eras,), np.float64),
+        "yy": ((n_eras,), np.float64),
+        "xy": ((n_eras, n_features), np.float64),
+        "xx": ((n_eras, n_features, n_features), np.int32),
+    }
+    grams = {
+        name: open_memmap(Path(directory) / f"{name}.npy", "w+", dtype, shape)
+        for name, (shape, dtype) in shapes.items()
+    }
+    grams["eras"][:] = era_store.era_index[:, 0]
+
+    done = 0
+    for codes, y, eras in era_store.iter_era_batches(eras_per_batch):
+        starts = np.flatnonzero(np.diff(eras, prepend=eras[0] - 1))
+        for start, stop in zip(starts, np.append(starts[1:], len(eras))):
+            # float32 products of codes 0-4 are exact below 2**24 per entry.
+            C = codes[start:stop].astype(np.float32)
+            y_era = y[start:stop].astype(np.float64)
+            grams["n"][done] = stop - start
+            grams["x"][done] = codes[start:stop].sum(axis=0, dtype=np.int64)
+            grams["y"][done] = y_era.sum()
+            grams["yy"][done] = y_era @ y_era
+            grams["xy"][done] = C.T.astype(np.float64) @ y_era
+            grams["xx"][done] = C.T @ C
+            done += 1
+    for array in grams.values():
+        array.flush()
+
+
+def load_era_grams(era_store: EraStore) -> "EraGrams":
+    """Cached Gram matrices for a split, computing them on first use."""
+    path = era_store.path / GRAM_DIR
+    if not path.exists():
+        staging = era_store.path / f".{GRAM_DIR}-{uuid.uuid4().hex[:8]}"
+        staging.mkdir()
+        try:
+            compute_era_grams(era_store, staging)
+            try:
+                os.rename(staging, path)
+            except OSError:
+                if not path.exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    return EraGrams(
+        {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in GRAM_ARRAYS}
+    )
+
+
+def gram_eligible(
+    model_type: str,
+    hyperparameters: Dict[str, Any],
+    targets: Optional[Sequence[str]] = None,
+) -> bool:
+    """Whether a training request can be fitted from Gram matrices.
+
+    Gram matrices are cached against the main target only.
+    """
+    return (
+        resolve_engine(model_type) == "linear"
+        and set(hyperparameters) <= set(GRAM_PARAMS)
+        and (targets is None or list(targets) == [MAIN_TARGET])
+    )
+
+
+def has_era_grams(era_store: EraStore) -> bool:
+    """Whether Gram matrices are already cached for a split."""
+    return (era_store.path / GRAM_DIR).exists()
+
+
+def era_positions(era_store: EraStore, rows: slice) -> np.ndarray:
+    """Positions of the eras lying entirely within ``rows``."""
+    index = era_store.era_index
+    inside = (index[:, 1] >= rows.start) & (index[:, 2] <= rows.stop)
+    return np.flatnonzero(inside)
+
+
+class EraGrams:
+    """Per-era Gram matrices of one split."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.eras = np.asarray(arrays["eras"])
+
+    def totals(
+        self,
+        columns: np.ndarray,
+        eras: Optional[EraSelection] = None,
+    ) -> Dict[str, Any]:
+        """Sums over ``eras`` restricted to ``columns``, in the value domain.
+
+        Args:
+            columns: Feature column indices
+            eras: Era positions (default: all eras)
+
+        Returns:
+            Dict with ``n``, ``x`` (k,), ``y``, ``yy``, ``xy`` (k,) and
+            ``xx`` (k, k) as float64 (``x`` scaled to feature values)
+        """
+        positions = self._positions(eras)
+        columns = np.asarray(columns)
+        # Accumulate era by era: only k × k of each memory-mapped block is read.
+        xx = np.zeros((len(columns), len(columns)), dtype=np.int64)
+        block = np.ix_(columns, columns)
+        for position in positions:
+            xx += self.arrays["xx"][position][block]
+        return {
+            "n": float(self.arrays["n"][positions].sum()),
+            "x": self.arrays["x"][np.ix_(positions, columns)].sum(axis=0) * _SCALE,
+            "y": float(self.arrays["y"][positions].sum()),
+            "yy": float(self.arrays["yy"][positions].sum()),
+            "xy": self.arrays["xy"][np.ix_(positions, columns)].sum(axis=0) * _SCALE,
+            "xx": xx * _SCALE ** 2,
+        }
+
+    def fit_ridge(
+        self,
+        columns: np.ndarray,
+        alpha: float = 1.0,
+        eras: Optional[EraSelection] = None,
+    ) -> Tuple[np.ndarray, float]:
+        """Ridge coefficients with intercept, as ``sklearn.linear_model.Ridge``.
+
+        Args:
+            columns: Feature column indices
+            alpha: L2 penalty on the coefficients
+            eras: Era positions to fit on (default: all eras)
+
+        Returns:
+            ``(coef, intercept)``
+        """
+        t = self.totals(columns, eras)
+        return _solve_ridge(t, alpha)
+
+    def era_pearson(
+        self,
+        columns: np.ndarray,
+        coef: np.ndarray,
+        eras: Optional[EraSelection] = None,
+    ) -> np.ndarray:
+        """Per-era Pearson correlation of ``X @ coef`` with the target.
+
+        Computed from each era's blocks, so in-sample scores need no rows.
+        """
+        corrs = []
+        for position in self._positions(eras):
+            t = self.totals(columns, [position])
+            n = t["n"]
+            mean_x = t["x"] / n
+            cov_xx = t["xx"] / n - np.outer(mean_x, mean_x)
+            cov_xy = t["xy"] / n - mean_x * (t["y"] / n)
+            var_p = coef @ cov_xx @ coef
+            var_y = t["yy"] / n - (t["y"] / n) ** 2
+            denom = np.sqrt(max(var_p, 0.0) * max(var_y, 0.0))
+            corrs.append(coef @ cov_xy / denom if denom > 0 else 0.0)
+        return np.array(corrs)
+
+    def _positions(self, eras: Optional[EraSelection]) -> np.ndarray:
+        if eras is None:
+            return np.arange(len(self.eras))
+        if isinstance(eras, slice):
+            return np.arange(len(self.eras))[eras]
+        return np.asarray(eras, dtype=np.int64)
+
+
+def fit_gram_ridge(
+    grams: EraGrams,
+    columns: np.ndarray,
+    eras: EraSelection,
+    hyperparameters: Optional[Dict[str, Any]] = None,
+    n_threads: int = 1,
+) -> Tuple[TrainedModel, np.ndarray]:
+    """Fit a ``linear`` model from cached Gram matrices.
+
+    Equivalent to ``fit_model('linear', ...)`` on the same rows and
+    columns, but costs one ``k × k`` solve.
+
+    Args:
+        grams: Gram matrices of the training split
+        columns: Feature column indices
+        eras: Era positions to fit on
+        hyperparameters: Ridge hyperparameters (only ``alpha``)
+        n_threads: Thread limit for the solve
+
+    Returns:
+        ``(model, per_era_pearson)``: the fitted model and its in-sample
+        per-era Pearson correlation
+    """
+    from sklearn.linear_model import Ridge
+
+    params = {"alpha": 1.0, **(hyperparameters or {})}
+    start = time.perf_counter()
+    with limit_threads(n_threads):
+        coef, intercept = grams.fit_ridge(columns, params["alpha"], eras)
+    estimator = Ridge(**params)
+    estimator.coef_ = coef
+    estimator.intercept_ = intercept
+    estimator.n_features_in_ = len(coef)
+    train_seconds = time.perf_counter() - start
+    model = TrainedModel(
+        "linear", "linear", estimator, params, n_threads, train_seconds
+    )
+    return model, grams.era_pearson(columns, coef, eras)
+
+
+def _solve_ridge(t: Dict[str, Any], alpha: float) -> Tuple[np.ndarray, float]:
+    """Solve centered normal equations ``(XcᵀXc + αI) w = Xcᵀyc``."""
+    n = t["n"]
+    mean_x = t["x"] / n
+    mean_y = t["y"] / n
+    xx = t["xx"] - n * np.outer(mean_x, mean_x)
+    xy = t["xy"] - n * mean_x * mean_y
+    xx[np.diag_indices_from(xx)] += alpha
+    coef = solve(xx, xy, assume_a="pos")
+    return coef, float(mean_y - mean_x @ coef)
@@ -0,0 +1,332 @@
+"""Process-pool execution of training jobs.
+
+Fitting a model is CPU-bound and would block the event loop that every
+concurrent sample shares, so fits run in worker processes. Workers read the
+memory-mapped store directly and write results into the model registry;
+the parent only tracks futures. Jobs are identified by their content-
+addressed model id, so identical submissions share one job. Plain ridge
+requests are solved from cached per-era Gram matrices instead of rows, and
+requests with a ``base_model_id`` continue that model on the new eras only.
+Requests may name several ``targets`` to fit one multi-target model.
+
+Pool size and the per-worker memory cap come from
+``$MEDALLION_BENCH_POOL_WORKERS`` and ``$MEDALLION_BENCH_JOB_MEMORY_MB`` or
+:func:`configure_pool`.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .evaluation import evaluate_predictions
+from .gram import era_positions, fit_gram_ridge, gram_eligible, load_era_grams
+from .registry import model_registry
+from .store import MAIN_TARGET, EraStore, dataset_path
+from .training import TrainedModel, continue_model, fit_model
+
+POOL_WORKERS_ENV = "MEDALLION_BENCH_POOL_WORKERS"
+JOB_MEMORY_ENV = "MEDALLION_BENCH_JOB_MEMORY_MB"
+
+
+def run_training_job(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Fit and register one model; runs inside a pool worker.
+
+    Args:
+        request: Training request with ``model_id``, ``model_type``,
+            ``features``, ``hyperparameters``, ``seed``, ``data_seed``,
+            ``data_dir``, ``rows`` and ``n_threads``, optionally ``targets``
+            (default: the main target), plus ``base_model_id`` to continue
+            a registered model on ``rows``
+
+    Returns:
+        Registry metadata of the fitted model
+    """
+    registry = model_registry(request["data_seed"], request["data_dir"])
+    meta = registry.metadata(request["model_id"])
+    if meta is not None:
+        return meta
+
+    era_store = EraStore(
+        dataset_path(
+            "training", seed=request["data_seed"], data_dir=request["data_dir"]
+        )
+    )
+    rows = slice(*request["rows"])
+    first_era, last_era = era_store.eras(rows)[[0, -1]]
+    n_threads = request.get("n_threads")
+    targets = request.get("targets")
+    base_id = request.get("base_model_id")
+
+    lineage: Dict[str, Any] = {}
+    scores: Dict[str, Any] = {}
+    if base_id is None:
+        model, scores = _fit(
+            era_store, rows, request["features"], request["model_type"],
+            request["hyperparameters"], request["seed"], n_threads, targets,
+        )
+    else:
+        base_meta = registry.metadata(base_id)
+        if base_meta is None:
+            raise KeyError(f"Unknown model: {base_id}")
+        lineage = {
+            "base_model_id": base_id,
+            "lineage": base_meta.get("lineage", []) + [base_id],
+            "new_eras": [int(first_era), int(last_era)],
+        }
+        first_era = base_meta["eras"][0]
+        if base_meta["engine"] == "linear":
+            # Ridge has no incremental update; refit on base plus new eras,
+            # which from cached Gram matrices is still one k × k solve.
+            span = slice(era_store.era_rows(first_era, first_era).start, rows.stop)
+            model, scores = _fit(
+                era_store, span, request["features"], "linear", base_meta["params"],
+                request["seed"], n_threads, targets,
+            )
+        else:
+            X = np.asarray(era_store.features(request["features"], rows))
+            model = continue_model(
+                registry.load(base_id), X, training_targets(era_store, targets, rows),
+                request["hyperparameters"], n_threads,
+            )
+            scores = _train_scores(model, X, era_store, rows, targets)
+
+    meta = {
+        "model_type": request["model_type"],
+        "engine": model.engine,
+        "features": list(request["features"]),
+        "targets": list(targets or [MAIN_TARGET]),
+        "params": model.params,
+        "seed": request["seed"],
+        "data_seed": request["data_seed"],
+        "rows": list(request["rows"]),
+        "eras": [int(first_era), int(last_era)],
+        **scores,
+        "train_seconds": model.train_seconds,
+        "n_threads": model.n_threads,
+        "size_bytes": model.size_bytes,
+        **lineage,
+    }
+    registry.save(request["model_id"], model, meta)
+    return meta
+
+
+def training_targets(
+    era_store: EraStore,
+    targets: Optional[List[str]],
+    rows: Union[slice, np.ndarray],
+) -> np.ndarray:
+    """Target rows to fit: a vector for one target, a matrix for several.
+
+    Args:
+        era_store: Training split
+        targets: Target names (default: the main target)
+        rows: Training rows (a slice or an index array)
+
+    Returns:
+        ``(rows,)`` or ``(rows, n_targets)`` float32 targets
+    """
+    if targets is None:
+        return np.asarray(era_store.target(rows))
+    y = np.asarray(era_store.targets(targets, rows))
+    return y[:, 0] if y.shape[1] == 1 else y
+
+
+def _fit(
+    era_store: EraStore,
+    rows: slice,
+    features: List[str],
+    model_type: str,
+    hyperparameters: Dict[str, Any],
+    seed: int,
+    n_threads: Optional[int],
+    targets: Optional[List[str]] = None,
+) -> Tuple[TrainedModel, Dict[str, Any]]:
+    """Fit from scratch; returns the model and its in-sample scores."""
+    if gram_eligible(model_type, hyperparameters, targets):
+        # Closed-form ridge from cached per-era Gram matrices: no rows read.
+        model, per_era = fit_gram_ridge(
+            load_era_grams(era_store),
+            era_store.feature_index(features),
+            era_positions(era_store, rows),
+            hyperparameters,
+            n_threads=n_threads or 1,
+        )
+        return model, {"train_corr": float(per_era.mean()), "train_metric": "pearson"}
+
+    X = np.asarray(era_store.features(features, rows))
+    y = training_targets(era_store, targets, rows)
+    model = fit_model(model_type, X, y, hyperparameters, seed=seed, n_threads=n_threads)
+    return model, _train_scores(model, X, era_store, rows, targets)
+
+
+def _train_scores(
+    model: TrainedModel,
+    X: np.ndarray,
+    era_store: EraStore,
+    rows: slice,
+    targets: Optional[List[str]],
+) -> Dict[str, Any]:
+    """In-sample Numerai correlation with the main target (and per target)."""
+    eras = era_store.eras(rows)
+    predictions = model.predict_targets(X)
+    scores: Dict[str, Any] = {
+        "train_corr": evaluate_predictions(
+            predictions.mean(axis=1), era_store.target(rows), eras
+        )["mean"],
+        "train_metric": "numerai_corr",
+    }
+    if targets is not None and len(targets) > 1:
+        y = era_store.targets(targets, rows)
+        scores["target_corrs"] = {
+            name: evaluate_predictions(predictions[:, i], y[:, i], eras)["mean"]
+            for i, name in enumerate(targets)
+        }
+    return scores
+
+
+def _failed(job: Future) -> bool:
+    return job.done() and (job.cancelled() or job.exception() is not None)
+
+
+def _limit_memory(memory_mb: Optional[int]) -> None:
+    """Pool worker initializer capping the worker's data memory.
+
+    Uses ``RLIMIT_DATA`` (heap and private writable mappings) rather than
+    ``RLIMIT_AS``: the address space also counts the memory-mapped store
+    and BLAS/OpenMP thread pools, which would kill workers whose real
+    memory use is small.
+    """
+    if not memory_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+
+
+class TrainingPool:
+    """Process pool plus a table of submitted training jobs."""
+
+    def __init__(self, max_workers: int = 2, memory_mb: Optional[int] = None):
+        """Create a pool; worker processes start on first submission.
+
+        Args:
+            max_workers: Number of worker processes
+            memory_mb: Data-memory cap per worker in MB (default: none)
+        """
+        self.max_workers = max_workers
+        self.memory_mb = memory_mb
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, request: Dict[str, Any]) -> Future:
+        """Submit a training request, reusing a live job with the same id."""
+        job_id = request["model_id"]
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not _failed(job):
+                # A finished job is only reusable while its model is still
+                # registered (the data directory may have been replaced).
+                if not job.done() or job_id in model_registry(
+                    request["data_seed"], request["data_dir"]
+                ):
+                    return job
+            job = self._submit(run_training_job, request)
+            self._jobs[job_id] = job
+            return job
+
+    def run(
+        self,
+        func: Callable[[Dict[str, Any]], Any],
+        request: Dict[str, Any],
+    ) -> Future:
+        """Run ``func(request)`` in a worker without tracking it as a job.
+
+        For work a single tool call waits on, such as cross-validation folds.
+        ``func`` must be a picklable module-level function.
+        """
+        with self._lock:
+            return self._submit(func, request)
+
+    def get(self, job_id: str) -> Optional[Future]:
+        """Future of a submitted job, or None if unknown."""
+        return self._jobs.get(job_id)
+
+    def status(self, job_id: str) -> str:
+        """One of 'unknown', 'pending', 'running', 'done' or 'failed'."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return "unknown"
+        if not job.done():
+            return "running" if job.running() else "pending"
+        return "failed" if _failed(job) else "done"
+
+    def shutdown(self) -> None:
+        """Stop worker processes, cancelling pending jobs."""
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _submit(
+        self,
+        func: Callable[[Dict[str, Any]], Any],
+        request: Dict[str, Any],
+    ) -> Future:
+        try:
+            return self._pool().submit(func, request)
+        except BrokenProcessPool:
+            self._executor = None
+            return self._pool().submit(func, request)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_memory,
+                initargs=(self.memory_mb,),
+            )
+        return self._executor
+
+
+_pool: Optional[TrainingPool] = None
+_pool_lock = threading.Lock()
+
+
+def training_pool() -> TrainingPool:
+    """The process-wide training pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = int(os.environ.get(POOL_WORKERS_ENV, 2))
+            memory_mb = os.environ.get(JOB_MEMORY_ENV)
+            _pool = TrainingPool(workers, int(memory_mb) if memory_mb else None)
+        return _pool
+
+
+def configure_pool(max_workers: int, memory_mb: Optional[int] = None) -> TrainingPool:
+    """Replace the process-wide pool with one of the given size and cap."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = TrainingPool(max_workers, memory_mb)
+        return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    if _pool is not None:
+        _pool.shutdown()
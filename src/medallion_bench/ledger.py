@@ -0,0 +1,301 @@
+"""Array-backed bankroll ledger with online risk metrics.
+
+Each sample keeps one ledger of the rounds it staked on. Rounds are rows of
+one preallocated NumPy structured array whose capacity doubles when full, so
+recording a round is amortized O(1) and the history is always a contiguous
+view.
+
+Every row also carries the running statistics after that round: Welford's
+mean and sum of squared deviations of the per-round return on stake, the sum
+of squared losses (for downside deviation), the bankroll's peak and the
+deepest drawdown so far, and how long the bankroll has been under its peak.
+Risk metrics after any recorded round are therefore read from one row
+instead of rescanning the history.
+
+Rows also keep prefix sums of the return and its square, so the mean and
+Sharpe ratio of any window of rounds is a difference of two rows: rolling
+statistics for many window lengths are one broadcast over a
+``(windows, rounds)`` grid, and per-regime statistics are ``np.bincount``
+sums over the rounds.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+ROLLING_WINDOWS = (4, 13, 26)
+
+LEDGER_DTYPE = np.dtype([
+    ("round", np.int64),
+    ("stake", np.float64),
+    ("payout", np.float64),
+    ("bankroll", np.float64),
+    ("peak", np.float64),
+    ("max_drawdown", np.float64),
+    ("mean", np.float64),
+    ("m2", np.float64),
+    ("downside_sq", np.float64),
+    ("hits", np.int64),
+    ("sum_return", np.float64),
+    ("sum_sq_return", np.float64),
+    ("drawdown_rounds", np.int64),
+    ("max_drawdown_rounds", np.int64),
+])
+
+
+class BankrollLedger:
+    """Per-round stakes, payouts and running risk statistics of one sample."""
+
+    def __init__(self, initial_bankroll: Optional[float] = None, capacity: int = 16):
+        """Create an empty ledger.
+
+        Args:
+            initial_bankroll: Bankroll before the first round (default: the
+                first recorded stake)
+            capacity: Rows preallocated before the first growth
+        """
+        self.initial_bankroll = initial_bankroll
+        self._rows = np.zeros(max(capacity, 1), dtype=LEDGER_DTYPE)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def capacity(self) -> int:
+        """Rows allocated."""
+        return len(self._rows)
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "BankrollLedger":
+        """Rebuild a ledger from :meth:`state`, without replaying its rounds.
+
+        Args:
+            state: ``initial_bankroll`` and the ``rows`` recorded so far, each
+                a list of :data:`LEDGER_DTYPE` fields in order
+        """
+        rows = state["rows"]
+        ledger = cls(state["initial_bankroll"], capacity=len(rows))
+        if rows:
+            # Rows come back from JSON as lists; structured arrays need tuples.
+            ledger._rows = np.array(list(map(tuple, rows)), dtype=LEDGER_DTYPE)
+            ledger._n = len(rows)
+        return ledger
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serializable running state, for :meth:`from_state`."""
+        return {
+            "initial_bankroll": self.initial_bankroll,
+            "rows": [self.row(i) for i in range(self._n)],
+        }
+
+    def row(self, index: int = -1) -> List[Any]:
+        """One recorded row as plain Python values (default: the latest)."""
+        return list(self.history()[index].tolist())
+
+    def record(self, round_num: int, payout: float, stake: float) -> Dict[str, float]:
+        """Record one round's payout and update the running statistics.
+
+        Args:
+            round_num: Tournament round, greater than every recorded round
+            payout: NMR paid out (negative when burned)
+            stake: NMR staked on the round
+
+        Returns:
+            Metrics after this round (see :meth:`metrics`)
+
+        Raises:
+            ValueError: On a non-positive stake or an out-of-order round
+        """
+        if stake <= 0:
+            raise ValueError("stake must be positive")
+        if self._n and round_num <= self._rows[self._n - 1]["round"]:
+            raise ValueError(
+                f"Round {round_num} must come after round "
+                f"{self._rows[self._n - 1]['round']}"
+            )
+        if self._n == len(self._rows):
+            self._rows = np.concatenate([self._rows, np.zeros_like(self._rows)])
+
+        if self._n:
+            prev = self._rows[self._n - 1]
+        else:
+            if self.initial_bankroll is None:
+                self.initial_bankroll = stake
+            prev = np.zeros((), dtype=LEDGER_DTYPE)
+            prev["bankroll"] = prev["peak"] = self.initial_bankroll
+
+        # Welford's update of the mean and squared deviations of the return
+        n = self._n + 1
+        ret = payout / stake
+        delta = ret - prev["mean"]
+        mean = prev["mean"] + delta / n
+        bankroll = prev["bankroll"] + payout
+        peak = max(prev["peak"], bankroll)
+        drawdown = 1.0 - bankroll / peak if peak > 0 else 0.0
+        underwater = prev["drawdown_rounds"] + 1 if bankroll < peak else 0
+        self._rows[self._n] = (
+            round_num,
+            stake,
+            payout,
+            bankroll,
+            peak,
+            max(prev["max_drawdown"], drawdown),
+            mean,
+            prev["m2"] + delta * (ret - mean),
+            prev["downside_sq"] + min(ret, 0.0) ** 2,
+            prev["hits"] + (payout > 0),
+            prev["sum_return"] + ret,
+            prev["sum_sq_return"] + ret * ret,
+            underwater,
+            max(prev["max_drawdown_rounds"], underwater),
+        )
+        self._n = n
+        return self.metrics()
+
+    def metrics(self, round_num: Optional[int] = None) -> Dict[str, float]:
+        """Risk metrics after the latest round, or after ``round_num``.
+
+        Args:
+            round_num: Report as of the last recorded round at or before
+                this one (default: the latest)
+
+        Returns:
+            Dict with ``round``, ``rounds``, ``bankroll``, ``total_payout``,
+            ``peak``, ``drawdown`` (current fall from the peak),
+            ``max_drawdown``, ``drawdown_rounds`` and ``max_drawdown_rounds``
+            (rounds spent below the peak, currently and at most),
+            ``mean_return`` and ``std_return`` (per round, on stake),
+            ``sharpe``, ``sortino``, ``hit_rate`` and the last round's
+            ``stake``, ``payout`` and ``return``; empty if no round is
+            recorded by then
+        """
+        index = self._index(round_num)
+        if index < 0:
+            return {}
+        row = self._rows[index]
+        n = index + 1
+        std = float(np.sqrt(row["m2"] / (n - 1))) if n > 1 else 0.0
+        downside = float(np.sqrt(row["downside_sq"] / n))
+        mean = float(row["mean"])
+        return {
+            "round": int(row["round"]),
+            "rounds": n,
+            "bankroll": float(row["bankroll"]),
+            "total_payout": float(row["bankroll"] - self.initial_bankroll),
+            "peak": float(row["peak"]),
+            "drawdown": (
+                float(1.0 - row["bankroll"] / row["peak"]) if row["peak"] > 0 else 0.0
+            ),
+            "max_drawdown": float(row["max_drawdown"]),
+            "drawdown_rounds": int(row["drawdown_rounds"]),
+            "max_drawdown_rounds": int(row["max_drawdown_rounds"]),
+            "mean_return": mean,
+            "std_return": std,
+            "sharpe": mean / std if std > 0 else 0.0,
+            "sortino": mean / downside if downside > 0 else 0.0,
+            "hit_rate": float(row["hits"]) / n,
+            "stake": float(row["stake"]),
+            "payout": float(row["payout"]),
+            "return": float(row["payout"] / row["stake"]),
+        }
+
+    def rolling(
+        self,
+        windows: Sequence[int],
+        round_num: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Rolling mean and Sharpe ratio of the return for several windows.
+
+        Args:
+            windows: Window lengths in rounds (each at least 2)
+            round_num: Use the rounds recorded up to this one (default: all)
+
+        Returns:
+            Dict with ``windows`` (k,) and ``mean`` and ``sharpe``, each
+            ``(k, rounds)`` with the statistic of the window ending at every
+            round (NaN until a window is full)
+
+        Raises:
+            ValueError: If a window is shorter than two rounds
+        """
+        lengths = np.asarray(windows, dtype=np.int64).reshape(-1)
+        if np.any(lengths < 2):
+            raise ValueError("Rolling windows must be at least 2 rounds")
+        n = self._index(round_num) + 1
+        sums = np.concatenate([[0.0], self._rows["sum_return"][:n]])
+        squares = np.concatenate([[0.0], self._rows["sum_sq_return"][:n]])
+
+        end = np.arange(1, n + 1)[None, :]
+        start = end - lengths[:, None]
+        full = start >= 0
+        start = np.where(full, start, 0)
+        w = lengths[:, None].astype(np.float64)
+        mean = (sums[end] - sums[start]) / w
+        mean_sq = (squares[end] - squares[start]) / w
+        var = np.maximum((mean_sq - mean ** 2) * w / (w - 1), 0.0)
+        # Differences of prefix sums leave rounding noise where the window's
+        # returns are all equal; treat that as zero variance.
+        var[var <= 1e-9 * mean_sq] = 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(var > 0, mean / np.sqrt(var), 0.0)
+        return {
+            "windows": lengths,
+            "mean": np.where(full, mean, np.nan),
+            "sharpe": np.where(full, sharpe, np.nan),
+        }
+
+    def regime_breakdown(
+        self,
+        regimes: np.ndarray,
+        n_regimes: int,
+        round_num: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Return statistics of the rounds played in each regime.
+
+        Args:
+            regimes: Regime code of every recorded round (negative: unknown,
+                left out)
+            n_regimes: Number of regime codes
+            round_num: Use the rounds recorded up to this one (default: all)
+
+        Returns:
+            Dict of ``(n_regimes,)`` arrays: ``rounds``, ``mean_return``,
+            ``std_return``, ``sharpe``, ``hit_rate`` and ``total_payout``
+        """
+        rows = self._rows[:self._index(round_num) + 1]
+        codes = np.asarray(regimes)[:len(rows)]
+        known = codes >= 0
+        codes, rows = codes[known], rows[known]
+        returns = rows["payout"] / rows["stake"]
+
+        def total(weights: Optional[np.ndarray] = None) -> np.ndarray:
+            return np.bincount(codes, weights, minlength=n_regimes)[:n_regimes]
+
+        count = total()
+        safe = np.maximum(count, 1)
+        mean = total(returns) / safe
+        sq_dev = np.maximum(total(returns ** 2) - count * mean ** 2, 0.0)
+        var = sq_dev / np.maximum(count - 1, 1)
+        std = np.where(count > 1, np.sqrt(var), 0.0)
+        return {
+            "rounds": count.astype(np.int64),
+            "mean_return": mean,
+            "std_return": std,
+            "sharpe": np.where(std > 0, mean / np.where(std > 0, std, 1.0), 0.0),
+            "hit_rate": total((rows["payout"] > 0).astype(np.float64)) / safe,
+            "total_payout": total(rows["payout"]),
+        }
+
+    def history(self) -> np.ndarray:
+        """Read-only structured view of the recorded rows."""
+        view = self._rows[:self._n]
+        view.flags.writeable = False
+        return view
+
+    def _index(self, round_num: Optional[int]) -> int:
+        """Row of the last round at or before ``round_num`` (-1 if none)."""
+        if round_num is None:
+            return self._n - 1
+        rounds = self._rows["round"][:self._n]
+        return int(np.searchsorted(rounds, round_num, "right")) - 1
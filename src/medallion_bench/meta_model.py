@@ -0,0 +1,142 @@
+"""Synthetic meta-model and batched meta-model contribution (MMC).
+
+The meta-model's predictions for a split are generated once from the seeded
+data generator and stored next to the split's data. MMC follows Numerai's
+definition: predictions and meta-model are ranked and gaussianized within
+each era, the predictions are orthogonalized against the meta-model, and the
+covariance of what is left with the era-centered target is the contribution.
+
+Only the meta-model side needs the orthogonalization, so it is precomputed
+once per split as stacked per-era unit vectors ``u``. For gaussianized
+predictions ``g`` and centered target ``y`` in an era of ``n`` rows,
+``MMC = (g·y - (g·u)(u·y)) / n``: three per-era sums, taken for any number of
+models at once with ``np.add.reduceat``.
+"""
+
+import functools
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+from scipy.special import ndtri
+
+from .ensemble import era_rank_matrix
+from .evaluation import era_offsets, era_rank
+from .store import EraStore, dataset_path, default_data_dir
+from .synthetic import generate_meta_model
+
+META_MODEL_FILE = "meta_model.npy"
+
+
+def meta_model_predictions(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> np.ndarray:
+    """Synthetic meta-model predictions of a split, generated on first use.
+
+    Args:
+        dataset: Split name ('training', 'validation' or 'tournament')
+        seed: Data seed
+        data_dir: Data root (default: ``default_data_dir()``)
+
+    Returns:
+        Read-only ``(rows,)`` float32 memory map in the split's row order
+    """
+    path = dataset_path(dataset, seed=seed, data_dir=data_dir) / META_MODEL_FILE
+    if not path.exists():
+        meta_model = generate_meta_model(dataset, seed=seed, data_dir=data_dir)
+        tmp = path.with_name(f".{uuid.uuid4().hex[:8]}-{path.name}")
+        try:
+            np.save(tmp, meta_model)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    stored: np.ndarray = np.load(path, mmap_mode="r")
+    return stored
+
+
+def era_unit_vectors(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-era gaussianized, centered and unit-norm ``values``.
+
+    Args:
+        values: ``(rows,)`` era-sorted predictions
+        offsets: Era offsets from ``evaluation.era_offsets``
+
+    Returns:
+        ``(rows,)`` float64 vector whose block in every era has unit norm
+        (zero for constant eras)
+    """
+    starts, sizes = offsets[:-1], np.diff(offsets)
+    gauss = ndtri(era_rank(values, offsets))
+    gauss -= np.repeat(np.add.reduceat(gauss, starts) / sizes, sizes)
+    norms = np.sqrt(np.add.reduceat(gauss ** 2, starts))
+    unit: np.ndarray = gauss / np.repeat(np.where(norms > 0, norms, 1.0), sizes)
+    return unit
+
+
+def meta_model_basis(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> np.ndarray:
+    """Orthogonalization basis of the meta-model on a whole split.
+
+    Eras are normalized independently, so any whole-era row slice of the
+    result is the basis of those eras. Cached per process.
+
+    Returns:
+        Read-only ``(rows,)`` float64 output of :func:`era_unit_vectors`
+    """
+    return _meta_model_basis(dataset, seed, str(data_dir or default_data_dir()))
+
+
+@functools.lru_cache(maxsize=8)
+def _meta_model_basis(dataset: str, seed: int, data_dir: str) -> np.ndarray:
+    era_store = EraStore(dataset_path(dataset, seed=seed, data_dir=data_dir))
+    offsets = era_offsets(era_store.eras())
+    basis = era_unit_vectors(meta_model_predictions(dataset, seed, data_dir), offsets)
+    basis.setflags(write=False)
+    return basis
+
+
+def contribution_scores(
+    predictions: np.ndarray,
+    target: np.ndarray,
+    basis: np.ndarray,
+    offsets: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Per-era MMC and meta-model correlation of one or several models.
+
+    Args:
+        predictions: ``(rows,)`` or ``(K, rows)`` era-sorted predictions
+        target: ``(rows,)`` target
+        basis: ``(rows,)`` meta-model basis of the same rows (see
+            :func:`meta_model_basis`)
+        offsets: Era offsets of the rows
+
+    Returns:
+        Dict with ``mmc`` and ``meta_corr`` (Pearson correlation of the
+        gaussianized predictions with the meta-model), each ``(n_eras,)``
+        for one model or ``(K, n_eras)`` for several
+    """
+    predictions = np.asarray(predictions)
+    matrix = predictions.reshape(-1, predictions.shape[-1])
+    starts, sizes = offsets[:-1], np.diff(offsets)
+
+    gauss = ndtri(era_rank_matrix(matrix, offsets).astype(np.float64))
+    gauss -= np.repeat(np.add.reduceat(gauss, starts, axis=1) / sizes, sizes, axis=1)
+    y = np.asarray(target, dtype=np.float64)
+    y = y - np.repeat(np.add.reduceat(y, starts) / sizes, sizes)
+
+    g_y = np.add.reduceat(gauss * y, starts, axis=1)
+    g_u = np.add.reduceat(gauss * basis, starts, axis=1)
+    g_g = np.add.reduceat(gauss * gauss, starts, axis=1)
+    u_y = np.add.reduceat(basis * y, starts)
+    mmc = (g_y - g_u * u_y) / sizes
+    meta_corr = np.where(g_g > 0, g_u / np.sqrt(np.where(g_g > 0, g_g, 1.0)), 0.0)
+    if predictions.ndim == 1:
+        return {"mmc": mmc[0], "meta_corr": meta_corr[0]}
+    return {"mmc": mmc, "meta_corr": meta_corr}
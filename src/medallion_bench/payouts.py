@@ -0,0 +1,301 @@
+"""Historical payout simulation for tournament submissions.
+
+A submission is replayed over historical eras as if each era were a resolved
+round. Its per-era return on stake is Numerai's payout rule, the weighted sum
+``0.5 × CORR + 2 × MMC`` clipped to ±5% (the negative side is the burn cap),
+scaled by the fraction of the stake put at risk. Payouts compound into the
+stake, so the whole stake path is one ``cumprod`` over eras. Every function
+broadcasts over leading axes, so a grid of stakes or exposures is simulated
+in the same pass.
+
+Per-era scores do not depend on the stake, so they are computed once per
+model and split and cached; re-running a simulation with other stake
+settings only redoes the payout arithmetic.
+
+Stake risk is estimated by bootstrapping: blocks of consecutive historical
+era returns are resampled into many future stake paths. Paths are simulated
+in log space (log-stake is the running sum of ``log(1 + return)``) and
+advanced one round at a time across a whole chunk of paths and policies, so
+only each path's running level, peak, low and drawdown are held in memory.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .evaluation import era_offsets, numerai_corr
+from .meta_model import contribution_scores, meta_model_basis
+from .predictions import model_predictions
+from .store import EraStore, dataset_path, default_data_dir
+
+CORR_MULTIPLIER = 0.5
+MMC_MULTIPLIER = 2.0
+PAYOUT_CAP = 0.05
+RISK_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+CONFIDENCE_LEVELS = (0.1, 0.25, 0.5, 0.75, 1.0)
+# Running state of one chunk of bootstrapped paths (five float64 values per
+# path and policy); small chunks stay in cache.
+RISK_CHUNK_BYTES = 1024 ** 2
+MAX_BOOTSTRAP_PATHS = 1_000_000
+
+
+def round_returns(
+    corr: np.ndarray,
+    mmc: Optional[np.ndarray] = None,
+    confidence: Union[float, np.ndarray] = 1.0,
+    corr_multiplier: float = CORR_MULTIPLIER,
+    mmc_multiplier: float = MMC_MULTIPLIER,
+    cap: float = PAYOUT_CAP,
+) -> np.ndarray:
+    """Per-era return on stake.
+
+    Args:
+        corr: ``(..., n_eras)`` per-era CORR
+        mmc: ``(..., n_eras)`` per-era MMC (default: not scored)
+        confidence: Fraction of the stake at risk, broadcast against the
+            score arrays (e.g. ``(K, 1)`` for K settings)
+        corr_multiplier: Weight of CORR in the payout score
+        mmc_multiplier: Weight of MMC in the payout score
+        cap: Largest payout or burn per era, as a fraction of the stake
+
+    Returns:
+        ``confidence * clip(corr_multiplier * corr + mmc_multiplier * mmc,
+        -cap, cap)``
+    """
+    score = _payout_score(corr, mmc, corr_multiplier, mmc_multiplier)
+    clipped = np.clip(score, -cap, cap)
+    returns: np.ndarray = np.asarray(confidence, dtype=np.float64) * clipped
+    return returns
+
+
+def simulate_payouts(
+    corr: np.ndarray,
+    mmc: Optional[np.ndarray],
+    stake: Union[float, np.ndarray],
+    confidence: Union[float, np.ndarray] = 1.0,
+    cap: float = PAYOUT_CAP,
+) -> Dict[str, np.ndarray]:
+    """Replay per-era scores with compounding payouts.
+
+    Args:
+        corr: ``(..., n_eras)`` per-era CORR
+        mmc: ``(..., n_eras)`` per-era MMC, or None
+        stake: Initial stake in NMR (broadcast like ``confidence``)
+        confidence: Fraction of the stake at risk each era
+        cap: Payout and burn cap per era, as a fraction of the stake
+
+    Returns:
+        Dict of ``(..., n_eras)`` arrays: ``returns`` on stake,
+        ``payouts`` in NMR, ``stakes`` after each era, and the boolean
+        masks ``burn_capped`` and ``payout_capped``
+    """
+    score = _payout_score(corr, mmc)
+    returns = np.asarray(confidence, dtype=np.float64) * np.clip(score, -cap, cap)
+    growth = np.cumprod(1.0 + returns, axis=-1)
+    stake = np.asarray(stake, dtype=np.float64)
+    stakes = stake * growth
+    before = stake * np.concatenate(
+        [np.ones_like(growth[..., :1]), growth[..., :-1]], axis=-1
+    )
+    return {
+        "returns": returns,
+        "payouts": before * returns,
+        "stakes": stakes,
+        "burn_capped": score <= -cap,
+        "payout_capped": score >= cap,
+    }
+
+
+def payout_summary(simulation: Dict[str, np.ndarray], stake: float) -> Dict[str, float]:
+    """Totals and risk statistics of one simulated payout series.
+
+    Args:
+        simulation: Output of :func:`simulate_payouts` for one setting
+        stake: Initial stake in NMR
+
+    Returns:
+        Dict with ``total_payout``, ``final_stake``, ``total_return``,
+        ``mean_payout``, ``hit_rate``, ``best_payout``, ``worst_payout``,
+        ``max_drawdown`` (largest fall of the stake from its peak, as a
+        fraction of the peak), ``burn_capped`` and ``payout_capped``
+        (era counts)
+    """
+    payouts = simulation["payouts"]
+    path = np.concatenate([[stake], simulation["stakes"]])
+    peak = np.maximum.accumulate(path)
+    final = float(path[-1])
+    return {
+        "total_payout": final - stake,
+        "final_stake": final,
+        "total_return": final / stake - 1.0 if stake > 0 else 0.0,
+        "mean_payout": float(payouts.mean()) if len(payouts) else 0.0,
+        "hit_rate": float(np.mean(payouts > 0)) if len(payouts) else 0.0,
+        "best_payout": float(payouts.max()) if len(payouts) else 0.0,
+        "worst_payout": float(payouts.min()) if len(payouts) else 0.0,
+        "max_drawdown": float(np.max(1.0 - path / peak)) if stake > 0 else 0.0,
+        "burn_capped": int(simulation["burn_capped"].sum()),
+        "payout_capped": int(simulation["payout_capped"].sum()),
+    }
+
+
+def bootstrap_payouts(
+    corr: np.ndarray,
+    mmc: Optional[np.ndarray],
+    stake: float,
+    confidence: Union[float, Sequence[float]] = 1.0,
+    rounds: int = 52,
+    n_paths: int = 100_000,
+    ruin_level: float = 0.5,
+    block_rounds: int = 1,
+    seed: int = 42,
+    quantiles: Sequence[float] = RISK_QUANTILES,
+    cap: float = PAYOUT_CAP,
+    chunk_paths: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Monte-Carlo distribution of future stakes under one or more policies.
+
+    Each path strings together ``rounds`` historical era returns drawn as
+    circular blocks of ``block_rounds`` consecutive eras (keeping some of
+    the scores' autocorrelation). Every policy replays the same paths, so
+    their differences are not sampling noise.
+
+    Args:
+        corr: ``(n_eras,)`` historical per-era CORR
+        mmc: ``(n_eras,)`` historical per-era MMC, or None
+        stake: Initial stake in NMR
+        confidence: Fraction of the stake at risk per round, or a sequence
+            of fractions to compare
+        rounds: Rounds per path
+        n_paths: Number of bootstrapped paths
+        ruin_level: Ruin is the stake falling to this fraction of the
+            initial stake at any point of a path
+        block_rounds: Consecutive historical eras per resampled block
+        seed: Sampling seed
+        quantiles: Quantiles of final stake and drawdown to report
+        cap: Payout and burn cap per era, as a fraction of the stake
+        chunk_paths: Paths simulated per array operation (default: as
+            many as fit in ``RISK_CHUNK_BYTES``)
+
+    Returns:
+        Dict with ``final_stake`` and ``max_drawdown`` quantiles
+        (``(..., len(quantiles))``), ``mean_final_stake``,
+        ``loss_probability``, ``risk_of_ruin`` and ``growth_rate`` (mean
+        log growth per round), each with a leading policy axis when
+        ``confidence`` is a sequence
+
+    Raises:
+        ValueError: On empty histories or invalid simulation settings
+    """
+    confidence_levels = np.asarray(confidence, dtype=np.float64)
+    levels = confidence_levels.reshape(-1)
+    if len(corr) == 0:
+        raise ValueError("No historical eras to bootstrap")
+    if stake <= 0:
+        raise ValueError("stake must be positive")
+    if levels.size == 0 or np.any((levels < 0) | (levels > 1)):
+        raise ValueError("confidence levels must be between 0 and 1")
+    if rounds < 1 or block_rounds < 1:
+        raise ValueError("rounds and block_rounds must be at least 1")
+    if not 1 <= n_paths <= MAX_BOOTSTRAP_PATHS:
+        raise ValueError(f"n_paths must be between 1 and {MAX_BOOTSTRAP_PATHS:,}")
+    if not 0 < ruin_level < 1:
+        raise ValueError("ruin_level must be between 0 and 1")
+
+    # (n_eras, policies) log growth of every historical era under every policy
+    log_growth = np.ascontiguousarray(
+        np.log1p(round_returns(corr, mmc, levels[:, None], cap=cap)).T
+    )
+    n_eras, n_levels = log_growth.shape
+    n_blocks = -(-rounds // block_rounds)
+    chunk_paths = chunk_paths or max(1, RISK_CHUNK_BYTES // (40 * n_levels))
+
+    final_log = np.empty((n_paths, n_levels))
+    low_log = np.empty((n_paths, n_levels))
+    drawdown_log = np.empty((n_paths, n_levels))
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_paths, chunk_paths):
+        stop = min(start + chunk_paths, n_paths)
+        block_starts = rng.integers(0, n_eras, (n_blocks, stop - start))
+        level, peak, low, drawdown, gap = np.zeros((5, stop - start, n_levels))
+        for r in range(rounds):
+            block, offset = divmod(r, block_rounds)
+            level += log_growth[(block_starts[block] + offset) % n_eras]
+            np.maximum(peak, level, out=peak)
+            np.minimum(low, level, out=low)
+            np.subtract(peak, level, out=gap)
+            np.maximum(drawdown, gap, out=drawdown)
+        final_log[start:stop] = level
+        low_log[start:stop] = low
+        drawdown_log[start:stop] = drawdown
+
+    result = {
+        "final_stake": stake * np.exp(np.quantile(final_log, quantiles, axis=0).T),
+        "max_drawdown": 1.0 - np.exp(-np.quantile(drawdown_log, quantiles, axis=0).T),
+        "mean_final_stake": stake * np.exp(final_log).mean(axis=0),
+        "loss_probability": (final_log < 0).mean(axis=0),
+        "risk_of_ruin": (low_log <= np.log(ruin_level)).mean(axis=0),
+        "growth_rate": final_log.mean(axis=0) / rounds,
+    }
+    if confidence_levels.ndim == 0:
+        result = {name: value[0] for name, value in result.items()}
+    return result
+
+
+def _payout_score(
+    corr: np.ndarray,
+    mmc: Optional[np.ndarray],
+    corr_multiplier: float = CORR_MULTIPLIER,
+    mmc_multiplier: float = MMC_MULTIPLIER,
+) -> np.ndarray:
+    """Unclipped payout score ``corr_multiplier * corr + mmc_multiplier * mmc``."""
+    score = corr_multiplier * np.asarray(corr, dtype=np.float64)
+    if mmc is not None:
+        score = score + mmc_multiplier * np.asarray(mmc, dtype=np.float64)
+    return score
+
+
+def era_scores(
+    model_id: str,
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> Dict[str, Any]:
+    """Per-era scores of a model's stored predictions on a whole split.
+
+    Cached per process, so repeated simulations skip prediction and scoring.
+
+    Returns:
+        Dict with read-only ``eras`` labels and ``corr`` and ``mmc`` (against
+        the synthetic meta-model) per era
+
+    Raises:
+        KeyError: If the model is not registered
+    """
+    eras, corr, mmc = _era_scores(
+        model_id, dataset, seed, str(data_dir or default_data_dir())
+    )
+    return {"eras": eras, "corr": corr, "mmc": mmc}
+
+
+@functools.lru_cache(maxsize=256)
+def _era_scores(
+    model_id: str,
+    dataset: str,
+    seed: int,
+    data_dir: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    predictions = model_predictions(model_id, dataset, seed, data_dir)
+    era_store = EraStore(dataset_path(dataset, seed=seed, data_dir=data_dir))
+    eras = np.asarray(era_store.eras())
+    offsets = era_offsets(eras)
+    labels = eras[offsets[:-1]]
+    target = era_store.target()
+    corr = numerai_corr(predictions, target, offsets)
+    basis = meta_model_basis(dataset, seed, data_dir)
+    mmc = contribution_scores(predictions, target, basis, offsets)["mmc"]
+    for array in (labels, corr, mmc):
+        array.setflags(write=False)
+    return labels, corr, mmc
+
@@ -0,0 +1,226 @@
+"""Persistent float32 prediction store.
+
+Inference runs once per ``(model_id, dataset)``: predictions for every row of
+the split are written as a ``.npy`` file and later read back as a read-only
+memory map, so evaluation, ensembling and submission simulation slice them
+without re-running the model. The store is bounded by a disk quota and
+evicts the least recently read files first.
+
+Every split, live tournament rows included, is predicted the same way: rows
+are streamed in fixed-size chunks and each chunk's predictions are written
+straight into the memory-mapped output file, so peak memory depends on the
+chunk size and feature count, never on the number of rows.
+
+Layout::
+
+    <data_dir>/v<DATA_VERSION>/seed_<seed>/predictions/<model_id>/<dataset>.npy
+"""
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .registry import model_registry
+from .store import EraStore, dataset_path, seed_path
+
+PREDICTION_BYTES_ENV = "MEDALLION_BENCH_PREDICTION_BYTES"
+DEFAULT_PREDICTION_BYTES = 1024 ** 3
+PREDICTION_DTYPE = np.float32
+PREDICTION_CHUNK_ROWS = 32_768
+
+
+class PredictionStore:
+    """Directory of per-split model predictions under a byte quota."""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_bytes: int = DEFAULT_PREDICTION_BYTES,
+    ):
+        """Open (or create) a prediction store.
+
+        Args:
+            root: Store directory
+            max_bytes: Disk quota; least recently read files are evicted
+                once it is exceeded
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def path(self, model_id: str, dataset: str) -> Path:
+        """File holding the predictions of ``model_id`` on ``dataset``."""
+        return self.root / model_id / f"{dataset}.npy"
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self.path(*key).exists()
+
+    def get(self, model_id: str, dataset: str) -> Optional[np.ndarray]:
+        """Read-only memory map of stored predictions, or None if absent.
+
+        Reading marks the file as recently used for eviction.
+        """
+        path = self.path(model_id, dataset)
+        try:
+            os.utime(path)
+            predictions: np.ndarray = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        return predictions
+
+    def put(self, model_id: str, dataset: str, predictions: np.ndarray) -> np.ndarray:
+        """Store predictions for every row of a split, then enforce the quota.
+
+        Returns:
+            Read-only memory map of the stored predictions
+        """
+        return self.put_chunks(model_id, dataset, len(predictions), [predictions])
+
+    def put_chunks(
+        self,
+        model_id: str,
+        dataset: str,
+        n_rows: int,
+        chunks: Iterable[np.ndarray],
+    ) -> np.ndarray:
+        """Stream consecutive prediction chunks into the store.
+
+        Chunks are written into a memory-mapped staging file that is renamed
+        into place once complete, so readers never see a partial file.
+
+        Args:
+            model_id: Model the predictions come from
+            dataset: Split name
+            n_rows: Rows of the split (sum of the chunk lengths)
+            chunks: Consecutive ``(chunk_rows,)`` predictions
+
+        Returns:
+            Read-only memory map of the stored predictions
+
+        Raises:
+            ValueError: If the chunks do not add up to ``n_rows``
+        """
+        path = self.path(model_id, dataset)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{uuid.uuid4().hex[:8]}-{path.name}")
+        try:
+            out = open_memmap(tmp, "w+", PREDICTION_DTYPE, (n_rows,))
+            done = 0
+            for chunk in chunks:
+                out[done:done + len(chunk)] = chunk
+                done += len(chunk)
+            if done != n_rows:
+                raise ValueError(f"Expected {n_rows} predictions, got {done}")
+            out.flush()
+            del out
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.evict(keep=path)
+        stored: np.ndarray = np.load(path, mmap_mode="r")
+        return stored
+
+    def entries(self) -> List[Tuple[str, str, int]]:
+        """``(model_id, dataset, bytes)`` of stored files, least recently read first."""
+        files = [p for p in self.root.glob("*/*.npy") if not p.name.startswith(".")]
+        stats = []
+        for p in files:
+            try:
+                stats.append((p.stat(), p))
+            except FileNotFoundError:  # Evicted concurrently
+                continue
+        stats.sort(key=lambda item: item[0].st_mtime)
+        return [(p.parent.name, p.stem, st.st_size) for st, p in stats]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of stored predictions."""
+        return sum(size for _, _, size in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Delete least recently read files until within the quota.
+
+        Args:
+            keep: File never to evict (the one just written)
+
+        Returns:
+            Number of files evicted
+        """
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for model_id, dataset, size in entries:
+            if total <= self.max_bytes:
+                break
+            path = self.path(model_id, dataset)
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            if not any(path.parent.iterdir()):
+                shutil.rmtree(path.parent, ignore_errors=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+
+def prediction_store(
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> PredictionStore:
+    """Prediction store for the data generated for ``seed``.
+
+    The quota comes from ``$MEDALLION_BENCH_PREDICTION_BYTES`` (default
+    1 GiB).
+    """
+    max_bytes = int(os.environ.get(PREDICTION_BYTES_ENV, DEFAULT_PREDICTION_BYTES))
+    return PredictionStore(seed_path(seed, data_dir) / "predictions", max_bytes)
+
+
+def model_predictions(
+    model_id: str,
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+    chunk_rows: int = PREDICTION_CHUNK_ROWS,
+) -> np.ndarray:
+    """Predictions of a registered model on every row of a split.
+
+    Served from the prediction store; on a miss the model is run over the
+    split in chunks of ``chunk_rows`` rows, written straight to the store.
+
+    Args:
+        model_id: Registered model
+        dataset: Split name ('training', 'validation' or 'tournament')
+        seed: Data seed
+        data_dir: Data root (default: ``default_data_dir()``)
+        chunk_rows: Rows predicted at a time on a miss
+
+    Returns:
+        Read-only ``(rows,)`` float32 memory map in the split's row order
+
+    Raises:
+        KeyError: If the model is not registered
+    """
+    store = prediction_store(seed, data_dir)
+    predictions = store.get(model_id, dataset)
+    if predictions is not None:
+        return predictions
+
+    registry = model_registry(seed, data_dir)
+    meta = registry.metadata(model_id)
+    if meta is None:
+        raise KeyError(f"Unknown model: {model_id}")
+    model = registry.load(model_id)
+    features = meta["features"]
+    era_store = EraStore(dataset_path(dataset, seed=seed, data_dir=data_dir))
+    chunks = (
+        model.predict(
+            np.asarray(era_store.features(features, slice(start, start + chunk_rows)))
+        )
+        for start in range(0, era_store.n_rows, chunk_rows)
+    )
+    return store.put_chunks(model_id, dataset, era_store.n_rows, chunks)
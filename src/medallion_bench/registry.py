@@ -0,0 +1,166 @@
+"""Content-addressed model registry and training cache.
+
+A model's id is a hash of everything that determines the fit: model type,
+resolved engine, feature list, hyperparameters, seed, data seed and the
+training rows (plus the targets, when not just the main one). Identical
+training requests across rounds and samples map to the same id, so a repeat
+request is a metadata read instead of a refit.
+Models continued from an earlier one also hash the base model's id, and
+their metadata records the chain of models they descend from.
+
+Layout::
+
+    <data_dir>/v<DATA_VERSION>/seed_<seed>/models/<model_id>/
+        model.pkl     # pickled TrainedModel
+        meta.json     # training inputs and measured metrics
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .store import MAIN_TARGET, seed_path
+from .training import TrainedModel
+
+MODEL_FILE = "model.pkl"
+META_FILE = "meta.json"
+
+
+def model_id_for(
+    model_type: str,
+    engine: str,
+    features: Sequence[str],
+    hyperparameters: Dict[str, Any],
+    seed: int,
+    data_seed: int,
+    rows: slice,
+    base_model_id: Optional[str] = None,
+    targets: Optional[Sequence[str]] = None,
+) -> str:
+    """Stable content hash of a training request.
+
+    Args:
+        model_type: Requested model type
+        engine: Engine that fits it in this environment
+        features: Ordered feature names the model is trained on
+        hyperparameters: Hyperparameters as requested
+        seed: Model seed
+        data_seed: Seed of the generated dataset
+        rows: Training row slice of the dataset
+        base_model_id: Model continued by this training, if any
+        targets: Targets fitted, when not just the main ``'target'``
+
+    Returns:
+        Model id such as ``'hist_gbdt-3fa2c1d9e0ab'``
+    """
+    fields = {
+        "model_type": model_type,
+        "engine": engine,
+        "features": list(features),
+        "hyperparameters": hyperparameters,
+        "seed": seed,
+        "data_seed": data_seed,
+        "rows": [rows.start, rows.stop],
+    }
+    if base_model_id is not None:
+        fields["base_model_id"] = base_model_id
+    if targets is not None and list(targets) != [MAIN_TARGET]:
+        fields["targets"] = list(targets)
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:12]
+    return f"{model_type}-{digest}"
+
+
+class ModelRegistry:
+    """Directory of fitted models keyed by content-addressed id."""
+
+    def __init__(self, root: Union[str, Path]):
+        """Open (or create) a registry.
+
+        Args:
+            root: Registry directory
+        """
+        self.root = Path(root)
+
+    def __contains__(self, model_id: str) -> bool:
+        return (self.root / model_id / META_FILE).exists()
+
+    def metadata(self, model_id: str) -> Optional[Dict[str, Any]]:
+        """Training inputs and metrics for a model, or None if unknown."""
+        path = self.root / model_id / META_FILE
+        if not path.exists():
+            return None
+        with open(path) as f:
+            meta: Dict[str, Any] = json.load(f)
+        return meta
+
+    def load(self, model_id: str) -> TrainedModel:
+        """Load a fitted model.
+
+        Raises:
+            KeyError: If the model id is not registered
+        """
+        if model_id not in self:
+            raise KeyError(f"Unknown model: {model_id}")
+        with open(self.root / model_id / MODEL_FILE, "rb") as f:
+            model: TrainedModel = pickle.load(f)
+        return model
+
+    def save(
+        self,
+        model_id: str,
+        model: TrainedModel,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Register a fitted model.
+
+        Written to a staging directory and renamed into place, so readers
+        never observe a half-written entry and concurrent writers of the
+        same id simply keep the first one.
+        """
+        if model_id in self:
+            return
+        staging = self.root / f".{model_id}-{uuid.uuid4().hex[:8]}"
+        staging.mkdir(parents=True)
+        try:
+            with open(staging / MODEL_FILE, "wb") as f:
+                pickle.dump(model, f)
+            with open(staging / META_FILE, "w") as f:
+                json.dump({"model_id": model_id, **metadata}, f, default=str)
+            try:
+                os.rename(staging, self.root / model_id)
+            except OSError:
+                if model_id not in self:
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def lineage(self, model_id: str) -> List[str]:
+        """Ids of the models ``model_id`` was continued from, oldest first.
+
+        Raises:
+            KeyError: If the model id is not registered
+        """
+        meta = self.metadata(model_id)
+        if meta is None:
+            raise KeyError(f"Unknown model: {model_id}")
+        return list(meta.get("lineage", []))
+
+    def model_ids(self) -> List[str]:
+        """All registered model ids."""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / META_FILE).exists())
+
+
+def model_registry(
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> ModelRegistry:
+    """Registry of models trained on the data generated for ``seed``."""
+    return ModelRegistry(seed_path(seed, data_dir) / "models")
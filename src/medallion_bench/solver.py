@@ -2,17 +2,29 @@
 
 from typing import Dict, List, Optional
 
-from inspect_ai.solver import Solver, solver
+from inspect_ai.solver import Generate, Solver, TaskState, solver
 from inspect_ai.tool import Tool
+from inspect_ai.util import store
 
 from .agents import DataAgent, ModelAgent, SubmissionAgent
 from .tools import (
     BusinessSimTool,
+    EnsembleTool,
+    FeatureMetadataTool,
+    HyperparameterSweepTool,
     KVTool,
+    ModelEvaluationTool,
     ModelTrainingTool,
+    NeutralizationTool,
     NumeraiDataTool,
+    PredictionTool,
+    RiskMetricsTool,
     ScratchpadTool,
+    StakeRiskTool,
     SubmissionSimulatorTool,
+    TrainingJobsTool,
+    TrainingResultTool,
+    TrainingStatusTool,
     VectorMemoryTool,
 )
 
@@ -41,14 +53,32 @@ def medallion_solver(
     
     # TODO: Use multiagent-inspect patterns here
     # For now, create a basic solver with all tools
-    from inspect_ai.solver import basic_agent
+    from inspect_ai.solver import basic_agent, chain
     
-    return basic_agent(
-        tools=tools,
-        max_steps=max_steps,
+    # Run ahead of the agent so its default init (system prompt) is kept.
+    return chain(
+        sample_context(),
+        basic_agent(tools=tools, max_steps=max_steps),
     )
 
 
+@solver
+def sample_context() -> Solver:
+    """Expose the sample's round metadata to tools via the sample store.
+
+    Tools read ``seed``, ``round`` and ``data_config`` from ``store()`` so
+    that every round works against the data generated for its seed.
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        for key in ("seed", "round", "phase", "data_config"):
+            if key in state.metadata:
+                store().set(key, state.metadata[key])
+        return state
+
+    return solve
+
+
 def _get_phase_tools(phase: int) -> List[Tool]:
     """Get available tools based on evaluation phase."""
     # Core tools available in all phases
@@ -62,13 +92,29 @@ def _get_phase_tools(phase: int) -> List[Tool]:
     if phase >= 1:
         core_tools.extend([
             ModelTrainingTool(),
+            ModelEvaluationTool(),
+            HyperparameterSweepTool(),
+            TrainingJobsTool(),
+            TrainingStatusTool(),
+            TrainingResultTool(),
+            PredictionTool(),
             SubmissionSimulatorTool(),
+            StakeRiskTool(),
         ])
     
-    # Phase 2+: Advanced risk management
+    # Phase 2+: Feature metadata, neutralization and advanced risk management
     if phase >= 2:
         core_tools.extend([
+            FeatureMetadataTool(),
+            NeutralizationTool(),
             BusinessSimTool(),
+            RiskMetricsTool(),
+        ])
+    
+    # Phase 3+: Meta-model information and ensembles
+    if phase >= 3:
+        core_tools.extend([
+            EnsembleTool(),
         ])
     
     # Phase 4: Advanced memory tools
@@ -0,0 +1,514 @@
+"""Memory-mapped columnar era store for Numerai tournament data.
+
+Each dataset split lives in its own directory::
+
+    <data_dir>/v<DATA_VERSION>/seed_<seed>/<dataset>/
+        manifest.json       # shapes, dtypes, feature names, block layout
+        features_000.npy    # (block_size, n_rows) feature block
+        features_001.npy
+        ...
+        targets.npy         # (n_rows, n_targets) float32, 'target' first
+        era.npy             # (n_rows,) int32, non-decreasing
+        era_index.npy       # (n_eras, 3) int64: era, first row, end row
+
+Feature blocks are stored feature-major, so projecting a subset of features
+only touches the pages of the requested columns. Everything is opened with
+``np.load(mmap_mode="r")``; nothing is read until it is indexed.
+
+Dtype contract:
+
+- Features are ``uint8`` bin codes ``0..4`` (``FEATURE_DTYPE``) everywhere:
+  on disk, in loaded arrays, and as passed to training and evaluation.
+  Code ``k`` stands for the Numerai feature value ``k / 4``.
+- Code space is the working representation. Tree models split on codes
+  directly; only code that needs real-valued arithmetic (linear algebra,
+  correlations against features) calls :func:`dequantize`, and only on
+  the slice it is about to use.
+- Targets are ``float32`` in ``[0, 1]`` (``NaN`` on live rows); predictions
+  are ``float32``.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+FEATURE_DTYPE = np.dtype(np.uint8)
+N_FEATURE_BINS = 5
+MANIFEST_FILE = "manifest.json"
+DEFAULT_BLOCK_SIZE = 64
+DATA_DIR_ENV = "MEDALLION_BENCH_DATA_DIR"
+MAIN_TARGET = "target"
+# Bump whenever the generator or the on-disk layout changes, so data written
+# by an older version is regenerated instead of silently reused.
+DATA_VERSION = 2
+
+RowSelection = Optional[Union[slice, Sequence[int], np.ndarray]]
+EraBounds = Tuple[Optional[int], Optional[int]]
+EraBatch = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def default_data_dir() -> Path:
+    """Root directory for generated Numerai data.
+
+    Uses ``$MEDALLION_BENCH_DATA_DIR`` when set, otherwise
+    ``~/.cache/medallion_bench``.
+    """
+    env = os.environ.get(DATA_DIR_ENV)
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "medallion_bench"
+
+
+def seed_path(seed: int = 42, data_dir: Optional[Union[str, Path]] = None) -> Path:
+    """Directory holding all dataset splits generated for a seed."""
+    root = Path(data_dir) if data_dir is not None else default_data_dir()
+    return root / f"v{DATA_VERSION}" / f"seed_{seed}"
+
+
+def dataset_path(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Directory holding one dataset split for a given seed."""
+    return seed_path(seed, data_dir) / dataset
+
+
+def parse_era_range(era_range: Optional[str]) -> EraBounds:
+    """Parse an era range such as ``'1-120'``, ``'121'`` or ``'100-'``.
+
+    Args:
+        era_range: Inclusive era range (default: all eras)
+
+    Returns:
+        ``(first, last)`` era, with ``None`` for an open end
+
+    Raises:
+        ValueError: If the range is malformed or reversed
+    """
+    if era_range is None or not era_range.strip():
+        return None, None
+    text = era_range.strip()
+    try:
+        if "-" not in text:
+            return int(text), int(text)
+        first, last = (part.strip() for part in text.split("-", 1))
+        bounds = (int(first) if first else None, int(last) if last else None)
+    except ValueError:
+        raise ValueError(f"Invalid era range: {era_range!r}") from None
+    if bounds[0] is not None and bounds[1] is not None and bounds[0] > bounds[1]:
+        raise ValueError(f"Invalid era range: {era_range!r}")
+    return bounds
+
+
+def dequantize(codes: np.ndarray, dtype: Any = np.float32) -> np.ndarray:
+    """Convert ``uint8`` feature codes to Numerai values in ``[0, 1]``.
+
+    Args:
+        codes: Feature codes in ``0..N_FEATURE_BINS - 1``
+        dtype: Floating dtype of the result
+
+    Returns:
+        Array of the same shape with values ``codes / 4``
+    """
+    out = np.array(codes, dtype=dtype)
+    out *= 1.0 / (N_FEATURE_BINS - 1)
+    return out
+
+
+class EraStore:
+    """Read-only view over one on-disk dataset split.
+
+    Feature access is zero-copy whenever the requested columns are a
+    contiguous run inside a single block; otherwise only the projected
+    columns are gathered.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open an existing store.
+
+        Args:
+            path: Dataset directory containing ``manifest.json``
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest
+        """
+        self.path = Path(path)
+        manifest_path = self.path / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No era store at {self.path}")
+        with open(manifest_path) as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+
+        self.dataset: str = self.manifest["dataset"]
+        self.n_rows: int = self.manifest["n_rows"]
+        self.block_size: int = self.manifest["block_size"]
+        self.feature_names: List[str] = self.manifest["feature_names"]
+        self.feature_dtype = np.dtype(self.manifest["feature_dtype"])
+        self.target_names: List[str] = self.manifest["target_names"]
+        self._positions = {name: i for i, name in enumerate(self.feature_names)}
+        self._blocks: Dict[int, np.ndarray] = {}
+        self._targets: Optional[np.ndarray] = None
+        self._eras: Optional[np.ndarray] = None
+        self._era_index: Optional[np.ndarray] = None
+
+    @property
+    def n_features(self) -> int:
+        """Number of feature columns."""
+        return len(self.feature_names)
+
+    @property
+    def n_blocks(self) -> int:
+        """Number of feature block files."""
+        return -(-self.n_features // self.block_size)
+
+    def block(self, index: int) -> np.ndarray:
+        """Memory-mapped ``(block_size, n_rows)`` feature block."""
+        if index not in self._blocks:
+            self._blocks[index] = np.load(
+                self.path / f"features_{index:03d}.npy", mmap_mode="r"
+            )
+        return self._blocks[index]
+
+    def feature_index(self, features: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Resolve feature names to column positions.
+
+        Args:
+            features: Feature names (default: all features)
+
+        Returns:
+            Integer array of column positions
+
+        Raises:
+            KeyError: If a feature name is not in the store
+        """
+        if features is None:
+            return np.arange(self.n_features)
+        missing = [name for name in features if name not in self._positions]
+        if missing:
+            raise KeyError(f"Unknown features: {', '.join(missing[:5])}")
+        return np.array([self._positions[name] for name in features], dtype=np.intp)
+
+    def features(
+        self,
+        features: Optional[Sequence[str]] = None,
+        rows: RowSelection = None,
+    ) -> np.ndarray:
+        """Project feature columns into a ``(rows, features)`` array.
+
+        Args:
+            features: Feature names to load (default: all)
+            rows: Row slice or index array (default: all rows)
+
+        Returns:
+            Array of shape ``(n_selected_rows, n_selected_features)``. A
+            read-only memmap view when the projection is contiguous within
+            one block, otherwise a gathered copy of just those columns.
+        """
+        columns = self.feature_index(features)
+        row_sel = slice(None) if rows is None else rows
+        if len(columns) == 0:
+            return np.empty((self._row_count(row_sel), 0), dtype=self.feature_dtype)
+
+        block_ids = columns // self.block_size
+        offsets = columns % self.block_size
+        contiguous = bool(np.all(np.diff(columns) == 1))
+        if contiguous and block_ids[0] == block_ids[-1]:
+            start, stop = int(offsets[0]), int(offsets[-1]) + 1
+            view: np.ndarray = self.block(int(block_ids[0]))[start:stop, row_sel].T
+            return view
+
+        out = np.empty(
+            (self._row_count(row_sel), len(columns)),
+            dtype=self.feature_dtype,
+            order="F",
+        )
+        for block_id in np.unique(block_ids):
+            mask = block_ids == block_id
+            block = self.block(int(block_id))
+            if isinstance(row_sel, slice):
+                out[:, mask] = block[offsets[mask], row_sel].T
+            else:
+                out[:, mask] = block[np.ix_(offsets[mask], row_sel)].T
+        return out
+
+    def target(self, rows: RowSelection = None) -> np.ndarray:
+        """Main ``'target'`` column as a memory-mapped view."""
+        target = self._target_matrix()[:, 0]
+        return target if rows is None else target[rows]
+
+    def target_index(self, targets: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Resolve target names to column positions.
+
+        Args:
+            targets: Target names (default: all targets)
+
+        Raises:
+            KeyError: If a target name is not in the store
+        """
+        if targets is None:
+            return np.arange(len(self.target_names))
+        missing = [name for name in targets if name not in self.target_names]
+        if missing:
+            raise KeyError(f"Unknown targets: {', '.join(missing[:5])}")
+        return np.array(
+            [self.target_names.index(name) for name in targets], dtype=np.intp
+        )
+
+    def targets(
+        self,
+        targets: Optional[Sequence[str]] = None,
+        rows: RowSelection = None,
+    ) -> np.ndarray:
+        """Project target columns into a ``(rows, targets)`` array.
+
+        Args:
+            targets: Target names to load (default: all)
+            rows: Row slice or index array (default: all rows)
+
+        Returns:
+            A read-only memmap view when the columns are a contiguous run
+            (such as all targets), otherwise a gathered copy
+        """
+        columns = self.target_index(targets)
+        matrix = self._target_matrix()
+        row_sel = slice(None) if rows is None else rows
+        if len(columns) > 0 and bool(np.all(np.diff(columns) == 1)):
+            return matrix[row_sel, int(columns[0]):int(columns[-1]) + 1]
+        return matrix[row_sel][:, columns]
+
+    def eras(self, rows: RowSelection = None) -> np.ndarray:
+        """Memory-mapped era label for every row."""
+        if self._eras is None:
+            self._eras = np.load(self.path / "era.npy", mmap_mode="r")
+        return self._eras if rows is None else self._eras[rows]
+
+    @property
+    def era_index(self) -> np.ndarray:
+        """Persisted ``(n_eras, 3)`` table of era, first row and end row."""
+        if self._era_index is None:
+            self._era_index = np.load(self.path / "era_index.npy")
+        return self._era_index
+
+    @property
+    def era_list(self) -> List[int]:
+        """Eras present in this store, in row order."""
+        eras: List[int] = self.era_index[:, 0].tolist()
+        return eras
+
+    def era_rows(
+        self,
+        first: Optional[int] = None,
+        last: Optional[int] = None,
+    ) -> slice:
+        """Resolve an inclusive era range to a contiguous row slice.
+
+        Uses the persisted era index, so no row data is scanned.
+
+        Args:
+            first: First era (default: first era in the store)
+            last: Last era (default: last era in the store)
+
+        Returns:
+            Row slice; empty when no eras fall inside the range
+        """
+        index = self.era_index
+        lo = 0 if first is None else int(np.searchsorted(index[:, 0], first, "left"))
+        hi = (
+            len(index) if last is None
+            else int(np.searchsorted(index[:, 0], last, "right"))
+        )
+        if lo >= hi:
+            return slice(0, 0)
+        return slice(int(index[lo, 1]), int(index[hi - 1, 2]))
+
+    def iter_era_batches(
+        self,
+        eras_per_batch: int = 4,
+        features: Optional[Sequence[str]] = None,
+        rows: Optional[slice] = None,
+    ) -> Iterator[EraBatch]:
+        """Stream whole eras in fixed-size batches.
+
+        Each batch is read straight from the memory-mapped blocks, so peak
+        memory is bounded by ``eras_per_batch`` eras rather than the split.
+
+        Args:
+            eras_per_batch: Eras per yielded batch
+            features: Feature names to project (default: all)
+            rows: Contiguous row slice to stream (default: all rows)
+
+        Yields:
+            ``(X, y, era)`` arrays: uint8 codes, float32 target, int32 eras
+        """
+        if eras_per_batch < 1:
+            raise ValueError("eras_per_batch must be at least 1")
+        index = self.era_index
+        if rows is not None:
+            index = index[(index[:, 1] >= rows.start) & (index[:, 2] <= rows.stop)]
+        for i in range(0, len(index), eras_per_batch):
+            last = min(i + eras_per_batch, len(index)) - 1
+            batch = slice(int(index[i, 1]), int(index[last, 2]))
+            yield (
+                np.ascontiguousarray(self.features(features, batch)),
+                np.array(self.target(batch)),
+                np.array(self.eras(batch)),
+            )
+
+    def feature_nbytes(
+        self,
+        features: Optional[Sequence[str]] = None,
+        rows: RowSelection = None,
+    ) -> int:
+        """Bytes a projection of ``features`` over ``rows`` spans."""
+        count = self.n_features if features is None else len(features)
+        n_rows = self._row_count(slice(None) if rows is None else rows)
+        return count * n_rows * int(self.feature_dtype.itemsize)
+
+    def _target_matrix(self) -> np.ndarray:
+        if self._targets is None:
+            self._targets = np.load(self.path / "targets.npy", mmap_mode="r")
+        return self._targets
+
+    def _row_count(self, rows: Union[slice, Sequence[int], np.ndarray]) -> int:
+        if isinstance(rows, slice):
+            return len(range(*rows.indices(self.n_rows)))
+        return len(rows)
+
+
+class EraStoreWriter:
+    """Incrementally fill a new era store, one row chunk at a time.
+
+    The manifest is written by :meth:`close`, so a directory without a
+    manifest is an incomplete store and is never opened by readers.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        dataset: str,
+        feature_names: Sequence[str],
+        n_rows: int,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        target_names: Sequence[str] = (MAIN_TARGET,),
+    ):
+        """Allocate block files for a new store.
+
+        Args:
+            path: Dataset directory to create
+            dataset: Dataset split name (e.g. 'training')
+            feature_names: Ordered feature column names
+            n_rows: Total number of rows
+            block_size: Features per block file
+            target_names: Ordered target column names
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dataset = dataset
+        self.feature_names = list(feature_names)
+        self.n_rows = n_rows
+        self.feature_dtype = FEATURE_DTYPE
+        self.block_size = block_size
+        self.target_names = list(target_names)
+
+        n_features = len(self.feature_names)
+        self._blocks = [
+            np.lib.format.open_memmap(
+                self.path / f"features_{i:03d}.npy",
+                mode="w+",
+                dtype=self.feature_dtype,
+                shape=(min(block_size, n_features - start), n_rows),
+            )
+            for i, start in enumerate(range(0, n_features, block_size))
+        ]
+        self._targets = np.lib.format.open_memmap(
+            self.path / "targets.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(n_rows, len(self.target_names)),
+        )
+        self._eras = np.lib.format.open_memmap(
+            self.path / "era.npy", mode="w+", dtype=np.int32, shape=(n_rows,)
+        )
+
+    def write(
+        self,
+        start: int,
+        features: np.ndarray,
+        target: np.ndarray,
+        eras: np.ndarray,
+    ) -> None:
+        """Write a ``(chunk_rows, n_features)`` chunk starting at row ``start``.
+
+        ``target`` is either one column per target name or, for a single
+        target, a flat vector.
+
+        Raises:
+            ValueError: If features are not ``uint8`` codes
+        """
+        if features.dtype != FEATURE_DTYPE:
+            raise ValueError(
+                f"Features must be {FEATURE_DTYPE} codes, got {features.dtype}"
+            )
+        stop = start + features.shape[0]
+        for i, block in enumerate(self._blocks):
+            lo = i * self.block_size
+            block[:, start:stop] = features[:, lo:lo + block.shape[0]].T
+        self._targets[start:stop] = target.reshape(stop - start, -1)
+        self._eras[start:stop] = eras
+
+    def close(self, extra: Optional[Dict[str, Any]] = None) -> EraStore:
+        """Flush data, write the manifest and reopen the store read-only.
+
+        Args:
+            extra: Additional manifest entries
+
+        Returns:
+            EraStore: The completed store
+
+        Raises:
+            ValueError: If rows were not written in era order
+        """
+        for array in [*self._blocks, self._targets, self._eras]:
+            array.flush()
+        np.save(self.path / "era_index.npy", build_era_index(self._eras))
+        manifest = {
+            "dataset": self.dataset,
+            "n_rows": self.n_rows,
+            "block_size": self.block_size,
+            "feature_dtype": self.feature_dtype.str,
+            "feature_names": self.feature_names,
+            "target_names": self.target_names,
+        }
+        manifest.update(extra or {})
+        with open(self.path / MANIFEST_FILE, "w") as f:
+            json.dump(manifest, f)
+        self._blocks = []
+        return EraStore(self.path)
+
+
+def build_era_index(eras: np.ndarray) -> np.ndarray:
+    """Build the ``(n_eras, 3)`` era, first-row, end-row table.
+
+    Raises:
+        ValueError: If ``eras`` is not non-decreasing
+    """
+    if len(eras) == 0:
+        return np.empty((0, 3), dtype=np.int64)
+    if np.any(np.diff(eras) < 0):
+        raise ValueError("Rows must be written in era order")
+    starts = np.flatnonzero(np.diff(eras, prepend=eras[0] - 1))
+    ends = np.append(starts[1:], len(eras))
+    return np.stack([eras[starts], starts, ends], axis=1).astype(np.int64)
+
+
+def open_store(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> EraStore:
+    """Open the era store for a dataset split and seed."""
+    return EraStore(dataset_path(dataset, seed=seed, data_dir=data_dir))
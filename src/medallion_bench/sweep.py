@@ -0,0 +1,191 @@
+"""Successive-halving hyperparameter sweeps over era subsets.
+
+Configurations start on a small, evenly spaced subset of the training eras.
+After each rung only the best ``1 / eta`` are kept and retrained on ``eta``
+times as many eras, until the survivors use every era. All fits of a rung run
+concurrently on the training pool and are scored per era on a held-out block
+of the latest eras, separated from training by a purge window.
+"""
+
+import asyncio
+import math
+from typing import Any, Dict, List, Mapping, Sequence, Set, Tuple
+
+import numpy as np
+
+from .cv import run_cv_fold
+from .evaluation import score_summary
+from .jobs import training_pool
+
+Rung = Tuple[int, int]
+
+
+def sample_configs(
+    search_space: Mapping[str, Sequence[Any]],
+    n_configs: int,
+    seed: int = 42,
+) -> List[Dict[str, Any]]:
+    """Draw distinct configurations from a grid without replacement.
+
+    The grid is never built: flat grid indices are sampled and decoded into
+    one candidate per hyperparameter, so cost depends on ``n_configs`` only.
+
+    Args:
+        search_space: Candidate values per hyperparameter
+        n_configs: Number of configurations (the whole grid if smaller)
+        seed: Sampling seed
+
+    Returns:
+        Configurations in sampled order
+
+    Raises:
+        ValueError: If a hyperparameter's candidates are not a non-empty list
+    """
+    names = list(search_space)
+    for name in names:
+        if not isinstance(search_space[name], (list, tuple)):
+            raise ValueError(f"Candidate values for {name} must be a list")
+        if len(search_space[name]) == 0:
+            raise ValueError(f"No candidate values for {name}")
+    sizes = [len(search_space[name]) for name in names]
+    total = math.prod(sizes)
+    n_configs = min(n_configs, total)
+    rng = np.random.default_rng(seed)
+    if total <= np.iinfo(np.int64).max:
+        flat = rng.choice(total, n_configs, replace=False)
+        picks = [_grid_choices(int(i), sizes) for i in flat]
+    else:
+        # Grids beyond int64 indices: draw choices directly, skipping repeats.
+        seen: Set[Tuple[int, ...]] = set()
+        picks = []
+        while len(picks) < n_configs:
+            choices = tuple(int(rng.integers(size)) for size in sizes)
+            if choices not in seen:
+                seen.add(choices)
+                picks.append(choices)
+    return [
+        {name: search_space[name][i] for name, i in zip(names, choices)}
+        for choices in picks
+    ]
+
+
+def _grid_choices(flat: int, sizes: Sequence[int]) -> Tuple[int, ...]:
+    """Decode a flat grid index into one candidate index per hyperparameter."""
+    choices = []
+    for size in reversed(sizes):
+        flat, choice = divmod(flat, size)
+        choices.append(choice)
+    return tuple(reversed(choices))
+
+
+def halving_schedule(
+    n_configs: int,
+    n_eras: int,
+    eta: int = 3,
+    min_eras: int = 4,
+) -> List[Rung]:
+    """Configurations and training eras per rung.
+
+    Args:
+        n_configs: Configurations in the first rung
+        n_eras: Training eras available to the last rung
+        eta: Keep ``1 / eta`` of the configurations per rung
+        min_eras: Fewest training eras any rung uses
+
+    Returns:
+        ``(n_configs, n_eras)`` per rung; the last rung uses every era
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    rungs = int(math.log(max(n_configs, 1), eta) + 1e-9)
+    schedule = []
+    for k in range(rungs + 1):
+        configs = max(1, math.ceil(n_configs / eta ** k))
+        eras = max(min(min_eras, n_eras), round(n_eras * eta ** (k - rungs)))
+        schedule.append((configs, eras))
+    return schedule
+
+
+def holdout_split(
+    positions: np.ndarray,
+    purge: int = 4,
+    fraction: float = 0.2,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Hold out the latest eras for scoring, purging the eras before them.
+
+    Returns:
+        ``(train_positions, test_positions)``
+
+    Raises:
+        ValueError: If too few eras remain to train on
+    """
+    n_test = max(1, int(len(positions) * fraction))
+    train = positions[: max(0, len(positions) - n_test - purge)]
+    if len(train) < 2:
+        raise ValueError(
+            f"Too few eras ({len(positions)}) to sweep with a purge of {purge}"
+        )
+    return train, positions[len(positions) - n_test:]
+
+
+def era_subset(positions: np.ndarray, n_eras: int) -> np.ndarray:
+    """``n_eras`` era positions spread evenly over ``positions``."""
+    picks = np.unique(np.linspace(0, len(positions) - 1, n_eras).round().astype(int))
+    return positions.take(picks)
+
+
+async def successive_halving(
+    request: Dict[str, Any],
+    configs: List[Dict[str, Any]],
+    train_eras: np.ndarray,
+    test_eras: np.ndarray,
+    eta: int = 3,
+) -> List[Dict[str, Any]]:
+    """Run a successive-halving schedule on the training pool.
+
+    Args:
+        request: Base training request (see ``jobs.run_training_job``)
+        configs: Hyperparameter configurations to compare
+        train_eras: Era positions available for training
+        test_eras: Held-out era positions every fit is scored on
+        eta: Halving rate
+
+    Returns:
+        One row per configuration, best first: ``hyperparameters``,
+        ``rung`` and ``eras`` of its last fit, ``per_era`` held-out
+        correlation and its summary, or ``error`` if the fit failed
+    """
+    pool = training_pool()
+    rows: List[Dict[str, Any]] = [
+        {"hyperparameters": config, "rung": -1} for config in configs
+    ]
+    alive = list(range(len(rows)))
+    schedule = halving_schedule(len(configs), len(train_eras), eta)
+
+    for rung, (n_keep, n_eras) in enumerate(schedule):
+        alive = alive[:n_keep]
+        subset = era_subset(train_eras, n_eras)
+        results = await asyncio.gather(
+            *(
+                asyncio.wrap_future(pool.run(run_cv_fold, {
+                    **request,
+                    "hyperparameters": rows[i]["hyperparameters"],
+                    "train_eras": subset,
+                    "test_eras": test_eras,
+                }))
+                for i in alive
+            ),
+            return_exceptions=True,
+        )
+        for i, result in zip(alive, results):
+            rows[i].update(rung=rung, eras=len(subset))
+            if isinstance(result, BaseException):
+                rows[i].update(error=repr(result), mean=-np.inf)
+            else:
+                per_era = np.array(result["per_era"])
+                rows[i].update(per_era=result["per_era"], **score_summary(per_era))
+        alive = sorted(
+            (i for i in alive if "error" not in rows[i]), key=lambda i: -rows[i]["mean"]
+        )
+
+    return sorted(rows, key=lambda row: (-row["rung"], -row.get("mean", -np.inf)))
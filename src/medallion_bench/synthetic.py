@@ -0,0 +1,358 @@
+"""Seeded synthetic Numerai data generator.
+
+Rows are drawn from a latent factor model: every row (a stock) has a vector
+of latent factor exposures, features are noisy group-structured loadings of
+those factors quantized into five equal-frequency ``uint8`` codes, and
+targets are per-era rankings of a slowly drifting factor return plus noise.
+
+Generation runs one era at a time with a random stream derived from
+``(seed, era)``, so peak memory is one era of data and the output is
+byte-identical for a given seed regardless of chunking.
+
+The synthetic meta-model (the crowd's stake-weighted prediction) is derived
+from the same streams: it re-draws each era's factor exposures and scores
+them against the factor return resolved one era earlier, plus its own noise,
+so it is reproducible per seed without storing anything at generation time.
+
+Regime labels come from the same factor returns: an era's regime reflects how
+well its factor return lines up with the long-run average one.
+"""
+
+import math
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .store import EraStore, EraStoreWriter, dataset_path, seed_path
+
+FEATURE_GROUPS = [
+    "intelligence",
+    "charisma",
+    "strength",
+    "dexterity",
+    "constitution",
+    "wisdom",
+]
+TARGET_NAMES = [
+    "target",
+    "target_nomi_20",
+    "target_jerome_20",
+    "target_ralph_20",
+]
+# Share of each target's raw score taken from the main target's, giving
+# roughly this correlation with it, as between Numerai's auxiliary targets.
+TARGET_MAIN_WEIGHTS = (1.0, 0.8, 0.65, 0.5)
+
+# Feature latents are 0.6 * N(0, 1) factor signal plus uniform noise of
+# variance 0.64; uniform draws are ~3x cheaper than normal ones at this scale.
+SIGNAL_SCALE = 0.6
+NOISE_HALF_WIDTH = 0.8 * math.sqrt(3.0)
+# Regimes from most to least aligned with the long-run factor return, one
+# third of the eras each.
+REGIME_NAMES = ("stable", "drifting", "reversal")
+# The meta-model's noise relative to its (unit variance) factor signal.
+META_MODEL_NOISE = 1.0
+# Numerai target buckets: 5% / 20% / 50% / 20% / 5% of each era.
+TARGET_BIN_EDGES = np.array([0.05, 0.25, 0.75, 0.95])
+
+DEFAULT_SHAPE = {
+    "n_features": 1050,
+    "training_rows": 500_000,
+    "validation_rows": 100_000,
+    "live_rows": 5_000,
+    "training_eras": 120,
+    "validation_eras": 20,
+}
+
+
+def feature_names(n_features: int) -> List[str]:
+    """Numerai-style feature names, dealt round-robin into groups."""
+    counters = {group: 0 for group in FEATURE_GROUPS}
+    names = []
+    for i in range(n_features):
+        group = FEATURE_GROUPS[i % len(FEATURE_GROUPS)]
+        counters[group] += 1
+        names.append(f"feature_{group}{counters[group]}")
+    return names
+
+
+def split_eras(
+    training_eras: int = 120,
+    validation_eras: int = 20,
+) -> Dict[str, List[int]]:
+    """Era numbers belonging to each dataset split.
+
+    Training and validation eras are consecutive; the live tournament
+    slice is the single era after validation.
+    """
+    live_era = training_eras + validation_eras + 1
+    return {
+        "training": list(range(1, training_eras + 1)),
+        "validation": list(range(training_eras + 1, live_era)),
+        "tournament": [live_era],
+    }
+
+
+def generate_numerai_data(
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+    n_features: int = DEFAULT_SHAPE["n_features"],
+    training_rows: int = DEFAULT_SHAPE["training_rows"],
+    validation_rows: int = DEFAULT_SHAPE["validation_rows"],
+    live_rows: int = DEFAULT_SHAPE["live_rows"],
+    training_eras: int = DEFAULT_SHAPE["training_eras"],
+    validation_eras: int = DEFAULT_SHAPE["validation_eras"],
+    n_factors: int = 24,
+    signal: float = 0.1,
+) -> Path:
+    """Generate training, validation and live stores for one seed.
+
+    Data is written to a private staging directory and renamed into place,
+    so concurrent generators for the same seed never expose partial data.
+
+    Args:
+        seed: Data seed (matches ``Sample.metadata["seed"]``)
+        data_dir: Root data directory (default: :func:`default_data_dir`)
+        n_features: Number of feature columns
+        training_rows: Rows across all training eras
+        validation_rows: Rows across all validation eras
+        live_rows: Rows in the live tournament era
+        training_eras: Number of training eras
+        validation_eras: Number of validation eras
+        n_factors: Latent factor count
+        signal: Weight of the factor return in the targets
+
+    Returns:
+        Path: The ``v<DATA_VERSION>/seed_<seed>`` directory
+    """
+    final = seed_path(seed, data_dir)
+    staging = final.with_name(f".{final.name}-{uuid.uuid4().hex[:8]}")
+
+    eras_by_split = split_eras(training_eras, validation_eras)
+    rows_by_split = {
+        "training": training_rows,
+        "validation": validation_rows,
+        "tournament": live_rows,
+    }
+    loadings = _factor_loadings(seed, n_factors, n_features)
+    factor_returns = _factor_returns(seed, n_factors, eras_by_split["tournament"][0])
+    names = feature_names(n_features)
+
+    try:
+        for dataset, eras in eras_by_split.items():
+            era_sizes = _era_sizes(rows_by_split[dataset], len(eras))
+            writer = EraStoreWriter(
+                staging / dataset, dataset, names, rows_by_split[dataset],
+                target_names=TARGET_NAMES,
+            )
+            start = 0
+            for era, size in zip(eras, era_sizes):
+                X, y = _generate_era(
+                    seed, era, size, loadings, factor_returns[era - 1], signal,
+                    live=dataset == "tournament",
+                )
+                writer.write(start, X, y, np.full(size, era, dtype=np.int32))
+                start += size
+            writer.close(extra={"seed": seed, "n_factors": n_factors})
+        try:
+            os.rename(staging, final)
+        except OSError:
+            # Another worker finished the same seed first.
+            if not (final / "tournament" / "manifest.json").exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return final
+
+
+def ensure_numerai_data(
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+    **shape: int,
+) -> Path:
+    """Generate data for ``seed`` unless it already exists on disk."""
+    live = dataset_path("tournament", seed=seed, data_dir=data_dir)
+    if (live / "manifest.json").exists():
+        return seed_path(seed, data_dir)
+    return generate_numerai_data(seed=seed, data_dir=data_dir, **shape)
+
+
+def load_split(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> EraStore:
+    """Open a dataset split, generating the seed's data on first use."""
+    ensure_numerai_data(seed=seed, data_dir=data_dir)
+    return EraStore(dataset_path(dataset, seed=seed, data_dir=data_dir))
+
+
+def generate_meta_model(
+    dataset: str,
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> np.ndarray:
+    """Synthetic meta-model predictions for every row of a split.
+
+    Each era's factor exposures are re-drawn from the generator's stream
+    for that era and scored against the factor return of the previous era
+    (the crowd only knows resolved rounds), plus independent noise; values
+    are per-era percentile ranks like a submission.
+
+    Args:
+        dataset: Split name ('training', 'validation' or 'tournament')
+        seed: Data seed
+        data_dir: Root data directory (default: :func:`default_data_dir`)
+
+    Returns:
+        ``(rows,)`` float32 predictions in the split's row order
+    """
+    era_store = load_split(dataset, seed=seed, data_dir=data_dir)
+    n_factors = era_store.manifest.get("n_factors", 24)
+    # Factor returns are drawn era by era, so any horizon yields the same rows.
+    factor_returns = _factor_returns(seed, n_factors, max(era_store.era_list))
+    meta_model = np.empty(era_store.n_rows, dtype=np.float32)
+    for era, start, stop in era_store.era_index.tolist():
+        rng = np.random.default_rng([seed, 2, era])
+        exposures = rng.standard_normal((stop - start, n_factors), dtype=np.float32)
+        raw = exposures @ factor_returns[max(era - 2, 0)].astype(np.float32)
+        raw /= raw.std() + 1e-12
+        noise = np.random.default_rng([seed, 3, era]).standard_normal(stop - start)
+        raw += np.float32(META_MODEL_NOISE) * noise.astype(np.float32)
+        meta_model[start:stop] = (np.argsort(np.argsort(raw)) + 0.5) / (stop - start)
+    return meta_model
+
+
+def regime_labels(
+    seed: int = 42,
+    data_dir: Optional[Union[str, Path]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Market regime of every era of a seed's data.
+
+    Eras are ranked by the cosine similarity of their factor return with
+    the mean factor return over all eras; the most aligned third is
+    ``'stable'``, the middle third ``'drifting'`` and the rest
+    ``'reversal'``.
+
+    Returns:
+        ``(eras, codes)``: every era number, training through live, and
+        its index into ``REGIME_NAMES``
+    """
+    live = load_split("tournament", seed=seed, data_dir=data_dir)
+    n_eras = max(live.era_list)
+    factor_returns = _factor_returns(seed, live.manifest.get("n_factors", 24), n_eras)
+    mean = factor_returns.mean(axis=0)
+    alignment = factor_returns @ mean / (
+        np.linalg.norm(factor_returns, axis=1) * np.linalg.norm(mean) + 1e-12
+    )
+    order = np.argsort(-alignment, kind="stable")
+    codes = np.empty(n_eras, dtype=np.int64)
+    codes[order] = np.arange(n_eras) * len(REGIME_NAMES) // n_eras
+    return np.arange(1, n_eras + 1), codes
+
+
+def _era_sizes(n_rows: int, n_eras: int) -> List[int]:
+    """Split ``n_rows`` into ``n_eras`` near-equal era sizes."""
+    base, extra = divmod(n_rows, n_eras)
+    return [base + (1 if i < extra else 0) for i in range(n_eras)]
+
+
+def _factor_loadings(seed: int, n_factors: int, n_features: int) -> np.ndarray:
+    """Group-structured ``(n_factors, n_features)`` loadings.
+
+    Every feature's loadings have unit norm.
+    """
+    rng = np.random.default_rng([seed, 0])
+    loadings = rng.standard_normal((n_factors, n_features), dtype=np.float32)
+    # Each feature group leans on its own subset of factors.
+    groups = np.arange(n_features) % len(FEATURE_GROUPS)
+    owner = np.arange(n_factors) % len(FEATURE_GROUPS)
+    loadings *= np.where(owner[:, None] == groups[None, :], 1.0, 0.3).astype(np.float32)
+    loadings /= np.linalg.norm(loadings, axis=0, keepdims=True)
+    return loadings
+
+
+def _factor_returns(seed: int, n_factors: int, n_eras: int) -> np.ndarray:
+    """Persistent mean plus AR(1) drift per era, shape ``(n_eras, n_factors)``."""
+    rng = np.random.default_rng([seed, 1])
+    mean = rng.standard_normal(n_factors)
+    shocks = rng.standard_normal((n_eras, n_factors))
+    drift = np.empty_like(shocks)
+    drift[0] = shocks[0]
+    for era in range(1, n_eras):
+        drift[era] = 0.9 * drift[era - 1] + np.sqrt(1 - 0.9 ** 2) * shocks[era]
+    returns: np.ndarray = (0.8 * mean + 0.6 * drift) / np.sqrt(n_factors)
+    return returns
+
+
+def _generate_era(
+    seed: int,
+    era: int,
+    n_rows: int,
+    loadings: np.ndarray,
+    factor_return: np.ndarray,
+    signal: float,
+    live: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Features and targets for a single era."""
+    rng = np.random.default_rng([seed, 2, era])
+    n_factors, n_features = loadings.shape
+    exposures = rng.standard_normal((n_rows, n_factors), dtype=np.float32)
+
+    latent = rng.random((n_rows, n_features), dtype=np.float32)
+    latent -= np.float32(0.5)
+    latent *= np.float32(2 * NOISE_HALF_WIDTH)
+    latent += np.float32(SIGNAL_SCALE) * (exposures @ loadings)
+    codes = np.zeros((n_rows, n_features), dtype=np.uint8)
+    for edge in FEATURE_BIN_EDGES:
+        codes += latent > edge
+
+    targets = np.full((n_rows, len(TARGET_NAMES)), np.nan, dtype=np.float32)
+    if not live:
+        base = exposures @ factor_return.astype(np.float32)
+        base /= base.std() + 1e-12
+        main = signal * base + rng.standard_normal(n_rows, dtype=np.float32)
+        targets[:, 0] = _bucket_by_rank(main)
+        for k, weight in enumerate(TARGET_MAIN_WEIGHTS[1:], start=1):
+            tilt = rng.standard_normal(n_factors, dtype=np.float32) * np.float32(0.3)
+            own = signal * (base + exposures @ tilt / np.sqrt(n_factors))
+            own += rng.standard_normal(n_rows, dtype=np.float32)
+            raw = weight * main + np.sqrt(1 - weight ** 2) * own
+            targets[:, k] = _bucket_by_rank(raw)
+    return codes, targets
+
+
+def _latent_cdf(x: float) -> float:
+    """CDF of ``SIGNAL_SCALE * N(0, 1) + U(-NOISE_HALF_WIDTH, NOISE_HALF_WIDTH)``."""
+    def integral(t: float) -> float:
+        # Antiderivative of the standard normal CDF.
+        cdf = 0.5 * (1 + math.erf(t / math.sqrt(2)))
+        return t * cdf + math.exp(-t * t / 2) / math.sqrt(2 * math.pi)
+
+    a, sigma = NOISE_HALF_WIDTH, SIGNAL_SCALE
+    return sigma / (2 * a) * (integral((x + a) / sigma) - integral((x - a) / sigma))
+
+
+def _equal_frequency_edges(n_bins: int = 5) -> np.ndarray:
+    """Latent thresholds splitting features into equally populated bins."""
+    edges = []
+    for q in np.arange(1, n_bins) / n_bins:
+        lo, hi = -5.0, 5.0
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            lo, hi = (mid, hi) if _latent_cdf(mid) < q else (lo, mid)
+        edges.append((lo + hi) / 2)
+    return np.array(edges, dtype=np.float32)
+
+
+FEATURE_BIN_EDGES = _equal_frequency_edges()
+
+
+def _bucket_by_rank(values: np.ndarray) -> np.ndarray:
+    """Map values to Numerai's five target buckets by within-era rank."""
+    pct = (np.argsort(np.argsort(values)) + 0.5) / len(values)
+    return (np.searchsorted(TARGET_BIN_EDGES, pct) / 4.0).astype(np.float32)
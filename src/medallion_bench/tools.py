@@ -1,8 +1,195 @@
 """MedallionBench specialized tools."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import contextvars
+import functools
+import itertools
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
+import numpy as np
 from inspect_ai.tool import Tool, tool
+from inspect_ai.util import store
+
+from .cache import dataset_cache
+from .cv import cv_summary, era_folds, run_cv_fold
+from .dataset import allowed_era_range
+from .ensemble import (
+    BLEND_METHODS,
+    SEARCH_OBJECTIVES,
+    blend,
+    member_summaries,
+    search_weights,
+    stack_predictions,
+)
+from .evaluation import (
+    era_basis,
+    era_offsets,
+    evaluate_predictions,
+    exposure_summary,
+    feature_exposure,
+    neutralize,
+    numerai_corr,
+    score_summary,
+)
+from .feature_stats import feature_summary, load_feature_stats
+from .gram import era_positions, gram_eligible, has_era_grams, load_era_grams
+from .jobs import run_training_job, training_pool
+from .ledger import ROLLING_WINDOWS, BankrollLedger
+from .meta_model import contribution_scores, meta_model_basis
+from .payouts import (
+    CONFIDENCE_LEVELS,
+    CORR_MULTIPLIER,
+    MMC_MULTIPLIER,
+    PAYOUT_CAP,
+    bootstrap_payouts,
+    era_scores,
+    payout_summary,
+    simulate_payouts,
+)
+from .predictions import PREDICTION_CHUNK_ROWS, model_predictions, prediction_store
+from .registry import model_id_for, model_registry
+from .store import MAIN_TARGET, EraBatch, EraStore, default_data_dir, parse_era_range
+from .sweep import halving_schedule, holdout_split, sample_configs, successive_halving
+from .synthetic import REGIME_NAMES, load_split, regime_labels
+from .training import default_threads, resolve_engine
+
+DATASETS = ("training", "validation", "tournament")
+HISTORY_DATASETS = ("training", "validation")
+# Eras per batch when evaluating on the streamed history.
+HISTORY_BATCH_ERAS = 8
+# Risk of ruin a staking policy may carry to be recommended.
+RUIN_TOLERANCE = 0.01
+
+T = TypeVar("T")
+
+
+async def _in_executor(func: Callable[..., T], *args: Any) -> T:
+    """Run blocking work in the default executor with this sample's context.
+
+    ``run_in_executor`` alone does not carry context variables into the
+    worker thread, so ``store()`` would not be the sample's store there.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(context.run, func, *args))
+
+
+def _sample_seed() -> int:
+    """Data seed of the sample currently being evaluated."""
+    return int(store().get("seed", 42))
+
+
+def _meta_model_info() -> bool:
+    """Whether this round may see meta-model information such as MMC."""
+    data_config = store().get("data_config")
+    return data_config is None or data_config["meta_model_info"]
+
+
+def _bankroll_state() -> Dict[str, Any]:
+    """This sample's JSON-serializable ledger state, created on first use."""
+    state: Optional[Dict[str, Any]] = store().get("bankroll_ledger")
+    if state is None:
+        state = BankrollLedger().state()
+        store().set("bankroll_ledger", state)
+    return state
+
+
+def _bankroll_ledger() -> BankrollLedger:
+    """This sample's bankroll ledger, rebuilt from its stored state."""
+    return BankrollLedger.from_state(_bankroll_state())
+
+
+def _record_bankroll(round_num: int, payout: float, stake: float) -> Dict[str, float]:
+    """Record one round in this sample's ledger, appending its row to the store.
+
+    Raises:
+        ValueError: If the ledger rejects the round (nothing is stored)
+    """
+    state = _bankroll_state()
+    ledger = BankrollLedger.from_state(state)
+    metrics = ledger.record(round_num, payout, stake)
+    state["initial_bankroll"] = ledger.initial_bankroll
+    state["rows"].append(ledger.row())
+    return metrics
+
+
+def _round_rows(era_store: EraStore, era_range: Optional[str] = None) -> slice:
+    """Rows of ``era_store`` this round may read within ``era_range``.
+
+    Raises:
+        ValueError: If the range is malformed or the split is gated off
+    """
+    first, last = parse_era_range(era_range)
+    data_config = store().get("data_config")
+    if data_config is not None:
+        window = allowed_era_range(data_config, era_store.dataset, era_store.era_list)
+        if window is None:
+            raise ValueError(f"{era_store.dataset} data is not available this round")
+        first = window[0] if first is None else max(first, window[0])
+        last = window[1] if last is None else min(last, window[1])
+    return era_store.era_rows(first, last)
+
+
+def _describe_targets(era_store: EraStore, rows: slice) -> str:
+    """Summary of every target column of ``rows`` for the data tool."""
+    targets = np.asarray(era_store.targets(rows=rows), dtype=np.float64)
+    corr = np.atleast_2d(np.corrcoef(targets, rowvar=False))[0]
+    lines = [
+        f"- Targets: {len(era_store.target_names)} columns, one ({len(targets):,}, "
+        f"{targets.shape[1]}) float32 array (0-1 range); '{MAIN_TARGET}' is scored, "
+        "others can be fitted jointly via train_model(targets=...)"
+    ]
+    for i, name in enumerate(era_store.target_names):
+        lines.append(
+            f"  - {name}: mean {targets[:, i].mean():.3f}, "
+            f"corr with '{MAIN_TARGET}' {corr[i]:.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _describe_names(names: List[str], limit: int = 3) -> str:
+    """Abbreviate a long list of column names for tool output."""
+    if len(names) <= limit:
+        return ", ".join(names)
+    return f"{', '.join(names[:limit])}, ... ({len(names):,} total)"
+
+
+def _describe_split(
+    dataset: str,
+    era_range: Optional[str],
+    features: Optional[List[str]],
+) -> str:
+    """Data tool output for a split, read from the memory map.
+
+    Nothing is copied into memory; tools that use the arrays load them.
+
+    Raises:
+        KeyError: On unknown features
+        ValueError: On malformed or gated era ranges
+    """
+    era_store = load_split(dataset, seed=_sample_seed())
+    columns = era_store.feature_index(features)
+    rows = _round_rows(era_store, era_range)
+    n_rows = rows.stop - rows.start
+    if n_rows == 0:
+        return f"No {dataset} rows in era range {era_range}"
+    first_era, last_era = era_store.eras(rows)[[0, -1]]
+    names = [era_store.feature_names[i] for i in columns]
+    blocks = np.unique(columns // era_store.block_size)
+    nbytes = era_store.feature_nbytes(names, rows)
+    summary = (
+        f"✓ Loaded {dataset} dataset: {n_rows:,} rows × "
+        f"{len(names):,} features across eras {int(first_era)}-{int(last_era)}\n"
+        f"- Storage: memory-mapped, {len(blocks)} of {era_store.n_blocks} "
+        f"feature blocks, {nbytes / 1e6:.1f} MB mapped (nothing copied)\n"
+        f"- Encoding: {era_store.feature_dtype} codes 0-4 (value = code / 4)\n"
+        f"- Features: {_describe_names(names)}\n"
+    )
+    if dataset == "tournament":
+        summary += "- No target values (this is what you predict)"
+    else:
+        summary += _describe_targets(era_store, rows)
+    return summary
 
 
 @tool
@@ -31,19 +218,134 @@ def numerai_data_tool() -> Tool:
         Returns:
             String description of loaded data
         """
-        # MVP: Simple mock data response
-        if dataset == "training":
-            return f"✓ Loaded training dataset: 500,000 rows × 1,050 features across eras {era_range or '1-120'}\n- Target: 'target' (numerical, 0-1 range)\n- Features: feature_intelligence1-1050 (normalized)\n- Eras: 120 training eras available"
-        elif dataset == "validation":
-            return f"✓ Loaded validation dataset: 100,000 rows × 1,050 features across eras {era_range or '121-140'}\n- Same structure as training\n- Use for model validation and feature selection"
-        elif dataset == "tournament":
-            return f"✓ Loaded tournament dataset: 5,000 rows × 1,050 features\n- Live tournament data for predictions\n- No target values (this is what you predict)"
-        else:
+        if dataset not in DATASETS:
             return f"Unknown dataset type: {dataset}"
+        # Opening a split may generate the seed's data; keep the event loop free.
+        try:
+            return await _in_executor(_describe_split, dataset, era_range, features)
+        except FileNotFoundError as e:
+            return f"Dataset unavailable: {e}"
+        except KeyError as e:
+            return f"Error: {e.args[0]}"
+        except ValueError as e:
+            return f"Error: {e}"
     
     return load_numerai_data
 
 
+def iter_numerai_data(
+    dataset: str,
+    eras_per_batch: int = 4,
+    era_range: Optional[str] = None,
+    features: Optional[List[str]] = None,
+) -> Iterator[EraBatch]:
+    """Stream a dataset split as ``(X, y, era)`` batches of whole eras.
+
+    Out-of-core counterpart of ``load_numerai_data`` for training and
+    evaluation: memory is bounded by the batch size, not the split. The
+    round's era gating applies exactly as it does for loading, and is
+    resolved when this is called, so the batches can be consumed in
+    another thread.
+
+    Args:
+        dataset: Dataset type ('training', 'validation', 'tournament'), or
+            'history' for every era with targets (training then validation)
+            when historical tournaments are available
+        eras_per_batch: Eras per yielded batch
+        era_range: Era range to stream (e.g., '1-120')
+        features: Specific features to load (default: all)
+
+    Returns:
+        Iterator of ``(X, y, era)``: uint8 feature codes, float32 target,
+        int32 eras
+
+    Raises:
+        ValueError: If the dataset is unknown or not available this round
+    """
+    if dataset == "history":
+        data_config = store().get("data_config")
+        if data_config is not None and not data_config["historical_tournaments"]:
+            raise ValueError("Historical tournament data is not available this round")
+        splits = list(HISTORY_DATASETS)
+    elif dataset in DATASETS:
+        splits = [dataset]
+    else:
+        raise ValueError(f"Unknown dataset type: {dataset}")
+
+    seed = _sample_seed()
+    sources = []
+    for split in splits:
+        era_store = load_split(split, seed=seed)
+        sources.append((era_store, _round_rows(era_store, era_range)))
+    return itertools.chain.from_iterable(
+        era_store.iter_era_batches(eras_per_batch, features, rows)
+        for era_store, rows in sources
+    )
+
+
+def _feature_rows() -> Tuple[EraStore, List[Dict[str, Any]]]:
+    """Training split and per-feature summary rows, computing stats on a miss."""
+    era_store = load_split("training", seed=_sample_seed())
+    return era_store, feature_summary(era_store, load_feature_stats(era_store))
+
+
+@tool
+def feature_metadata_tool() -> Tool:
+    """Tool for precomputed feature metadata and statistics."""
+    
+    async def describe_features(
+        group: Optional[str] = None,
+        top_k: int = 10,
+    ) -> str:
+        """Describe feature groups and the most predictive features.
+        
+        Statistics (per-era mean/std and target correlation) are computed
+        once on the training data and cached, so this call is cheap.
+        
+        Args:
+            group: Restrict to one feature group (e.g., 'intelligence')
+            top_k: Number of top features to list by |correlation|
+            
+        Returns:
+            Feature groups and top features with correlation statistics
+        """
+        data_config = store().get("data_config")
+        if data_config is not None and not data_config["feature_metadata"]:
+            return "Error: feature metadata is not available this round"
+        
+        # Data and statistics are generated on first use; keep the event loop free.
+        era_store, rows = await _in_executor(_feature_rows)
+        
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(str(row["group"]), []).append(row)
+        if group is not None and group not in groups:
+            return f"Unknown feature group: {group}. Groups: {', '.join(groups)}"
+        
+        lines = [
+            f"✓ Feature metadata: {len(rows):,} features, "
+            f"{len(era_store.era_index)} training eras",
+            "",
+            "Groups (features, mean |corr|):",
+        ]
+        for name, members in groups.items():
+            mean_abs = np.mean([abs(m["corr"]) for m in members])
+            lines.append(f"- {name}: {len(members)}, {mean_abs:.4f}")
+        
+        candidates = groups[group] if group is not None else rows
+        top = sorted(candidates, key=lambda r: -abs(r["corr"]))[:top_k]
+        lines += ["", f"Top {len(top)} features by |mean era corr|:"]
+        for row in top:
+            lines.append(
+                f"- {row['name']} ({row['group']}): corr {row['corr']:+.4f}, "
+                f"sharpe {row['corr_sharpe']:+.2f}, mean {row['mean']:.3f}, "
+                f"std {row['std']:.3f}"
+            )
+        return "\n".join(lines)
+    
+    return describe_features
+
+
 @tool
 def scratchpad_tool() -> Tool:
     """Tool for persistent note-taking across rounds."""
@@ -121,106 +423,1062 @@ def kv_tool() -> Tool:
     return store_kv
 
 
+def _training_request(
+    model_type: str,
+    features: List[str],
+    hyperparameters: Dict[str, Any],
+    seed: int,
+    era_range: Optional[str],
+    base_model_id: Optional[str] = None,
+    targets: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Resolve a training call into a picklable, content-addressed request.
+
+    With ``base_model_id`` the request continues that model on the allowed
+    eras after the last one it was trained on.
+
+    Raises:
+        KeyError: On unknown features, targets or base models
+        ValueError: On unknown model types, gated or empty era ranges, or a
+            base model of another type, feature set or target set
+    """
+    data_seed = _sample_seed()
+    era_store = load_split("training", seed=data_seed)
+    base_meta = None
+    if base_model_id is not None:
+        base_meta = model_registry(data_seed).metadata(base_model_id)
+        if base_meta is None:
+            raise KeyError(f"Unknown model: {base_model_id}")
+        if model_type != base_meta["model_type"]:
+            raise ValueError(f"{base_model_id} is a {base_meta['model_type']} model")
+        features = features or base_meta["features"]
+        targets = targets or base_meta.get("targets")
+    columns = era_store.feature_index(features or None)
+    target_names = list(dict.fromkeys(targets or [MAIN_TARGET]))
+    era_store.target_index(target_names)
+    rows = _round_rows(era_store, era_range)
+    engine = resolve_engine(model_type)
+    names = [era_store.feature_names[i] for i in columns]
+    if base_meta is not None:
+        if names != base_meta["features"]:
+            raise ValueError(f"Features must match those of {base_model_id}")
+        if target_names != base_meta.get("targets", [MAIN_TARGET]):
+            raise ValueError(f"Targets must match those of {base_model_id}")
+        trained_through = era_store.era_rows(None, base_meta["eras"][1]).stop
+        rows = slice(max(rows.start, trained_through), max(rows.stop, trained_through))
+        if rows.stop == rows.start:
+            raise ValueError(
+                f"No new training eras after era {base_meta['eras'][1]} "
+                f"(the last era of {base_model_id})"
+            )
+    if rows.stop == rows.start:
+        raise ValueError(f"No training rows in era range {era_range}")
+    
+    request = {
+        "model_id": model_id_for(
+            model_type, engine, names, hyperparameters, seed, data_seed, rows,
+            base_model_id, target_names,
+        ),
+        "model_type": model_type,
+        "features": names,
+        "targets": target_names,
+        "hyperparameters": hyperparameters,
+        "seed": seed,
+        "data_seed": data_seed,
+        "data_dir": str(default_data_dir()),
+        "rows": (rows.start, rows.stop),
+        "n_threads": default_threads(),
+    }
+    if base_model_id is not None:
+        request["base_model_id"] = base_model_id
+    return request
+
+
+def _gram_split(request: Dict[str, Any]) -> Optional[EraStore]:
+    """Training split of a ridge request that can be fitted from Gram matrices.
+
+    Returns:
+        The split (check ``has_era_grams`` for its cache), or None if the
+        request cannot take the Gram path
+    """
+    if not gram_eligible(
+        request["model_type"], request["hyperparameters"], request["targets"]
+    ):
+        return None
+    return load_split("training", seed=request["data_seed"])
+
+
+def _cv_requests(
+    request: Dict[str, Any],
+    n_folds: int,
+    purge: int,
+    embargo: int,
+) -> List[Dict[str, Any]]:
+    """One fold request per era-wise fold of the request's training eras.
+
+    Raises:
+        ValueError: On invalid fold counts or windows
+    """
+    era_store = load_split("training", seed=request["data_seed"])
+    positions = era_positions(era_store, slice(*request["rows"]))
+    return [
+        {**request, "train_eras": positions[train], "test_eras": positions[test]}
+        for train, test in era_folds(len(positions), n_folds, purge, embargo)
+    ]
+
+
+def _format_cv(
+    request: Dict[str, Any],
+    folds: List[Dict[str, Any]],
+    purge: int,
+    embargo: int,
+) -> str:
+    """Tool output for a cross-validation run."""
+    summary = cv_summary(folds)
+    engine = resolve_engine(request["model_type"])
+    lines = [
+        "✓ Cross-Validation Complete",
+        f"Model: {request['model_type']} (engine: {engine})",
+        f"Features: {len(request['features'])} selected",
+        f"Folds: {len(folds)} contiguous era blocks, purge {purge} / embargo {embargo} "
+        "eras, run in parallel",
+        f"Hyperparameters: {request['hyperparameters']}",
+        "",
+        "Out-of-fold (all test eras):",
+        f"- Correlation (mean per era): {summary['mean']:.4f}",
+        f"- Std: {summary['std']:.4f}",
+        f"- Sharpe Ratio: {summary['sharpe']:.2f}",
+        f"- Max Drawdown: {summary['max_drawdown']:.4f}",
+        "",
+        "Per fold:",
+    ]
+    for i, (fold, stats) in enumerate(zip(folds, summary["fold_summaries"]), 1):
+        eras = fold["test_eras"]
+        lines.append(
+            f"- Fold {i}: eras {eras[0]}-{eras[-1]}, "
+            f"trained on {fold['train_eras']} eras "
+            f"({fold['train_rows']:,} rows): mean {stats['mean']:+.4f}, "
+            f"sharpe {stats['sharpe']:+.2f}"
+        )
+        lines.append("  per-era: " + ", ".join(f"{c:+.4f}" for c in fold["per_era"]))
+    return "\n".join(lines)
+
+
+def _format_training(model_id: str, meta: Dict[str, Any], cached: bool = False) -> str:
+    """Tool output for a registered model."""
+    engine = meta["engine"]
+    if engine != meta["model_type"]:
+        engine += f", {meta['model_type']} not installed"
+    first_era, last_era = meta["eras"]
+    metric = "Numerai"
+    if meta.get("train_metric") == "pearson":
+        metric = "Pearson, from Gram matrices"
+    n_rows = meta["rows"][1] - meta["rows"][0]
+    if "base_model_id" in meta:
+        new_first, new_last = meta["new_eras"]
+        data = (
+            f"{n_rows:,} new rows, eras {new_first}-{new_last}\n"
+            f"Continued From: {meta['base_model_id']} "
+            f"({len(meta['lineage'])} prior models, "
+            f"eras {first_era}-{last_era} in total)"
+        )
+    else:
+        data = f"{n_rows:,} rows, eras {first_era}-{last_era}"
+    targets = meta.get("targets", [MAIN_TARGET])
+    if len(targets) > 1:
+        target_corrs = meta.get("target_corrs", {})
+        per_target = ", ".join(
+            f"{name} {target_corrs[name]:.4f}" for name in target_corrs
+        )
+        data += (
+            f"\nTargets: {len(targets)} fitted jointly, predictions averaged"
+            f"\n- Training Correlation per target: {per_target}"
+        )
+    elif targets != [MAIN_TARGET]:
+        data += f"\nTarget: {targets[0]}"
+    hit = " (registry hit, not retrained)" if cached else ""
+    return f"""✓ Model Training Complete{hit}
+Model ID: {model_id}
+Model: {meta['model_type']} (engine: {engine})
+Features: {len(meta['features'])} selected
+Training Data: {data}
+Hyperparameters: {meta['params']}
+Seed: {meta['seed']}
+
+Performance:
+- Training Correlation ({metric}, mean per era): {meta['train_corr']:.4f}
+- Training Time: {meta['train_seconds']:.2f}s ({meta['n_threads']} threads)
+- Model Size: {meta['size_bytes'] / 1024:.1f}KB
+- Status: Ready for validation"""
+
+
 @tool
 def model_training_tool() -> Tool:
-    """Tool for training and evaluating models."""
+    """Tool for training models."""
     
     async def train_model(
         model_type: str,
         features: List[str],
         hyperparameters: Dict[str, Any],
         seed: int = 42,
+        era_range: Optional[str] = None,
+        cv_folds: int = 0,
+        purge_eras: int = 4,
+        embargo_eras: int = 4,
+        base_model_id: Optional[str] = None,
+        targets: Optional[List[str]] = None,
     ) -> str:
         """Train a model with specified configuration.
         
+        With ``cv_folds`` set, cross-validates instead: eras are split into
+        contiguous folds, each fold is trained on the other eras (minus the
+        purge/embargo windows around it) and scored per era, with all folds
+        running in parallel. No model is registered in this mode.
+        
+        With ``base_model_id`` set, continues that model using only the
+        eras after the last one it was trained on: boosted models add
+        ``max_iter`` trees (default 20), neural nets ``max_iter`` epochs,
+        and linear models are refit on all eras from cached statistics.
+        
+        With several ``targets``, one model is fitted on all of them from a
+        single read of the features; it predicts the mean of its per-target
+        predictions.
+        
         Args:
-            model_type: Type of model (e.g., 'xgboost', 'lightgbm', 'neural_net')
-            features: Feature columns to use
+            model_type: Type of model ('hist_gbdt', 'xgboost', 'lightgbm',
+                'linear', 'neural_net')
+            features: Feature columns to use (empty for all features)
             hyperparameters: Model hyperparameters
             seed: Random seed for reproducibility
+            era_range: Training era range (e.g., '1-60'; default: all allowed)
+            cv_folds: Number of era-wise cross-validation folds (0 to train once)
+            purge_eras: Eras before each test fold excluded from its training
+            embargo_eras: Eras after each test fold excluded from its training
+            base_model_id: Registered model to continue training from
+            targets: Target columns to fit (default: ['target'])
             
         Returns:
-            Training results and model performance
+            Training results and model performance, or per-fold per-era
+            cross-validation correlations
         """
-        # MVP: Simulate model training with realistic results
-        import random
-        random.seed(seed)
-        
-        # Simulate training time based on complexity
-        feature_count = len(features)
-        
-        # Mock performance metrics based on model type and features
-        if model_type == "xgboost":
-            base_score = 0.52 + random.uniform(-0.02, 0.02)
-            training_time = feature_count * 0.1
-        elif model_type == "lightgbm":
-            base_score = 0.51 + random.uniform(-0.02, 0.02)  
-            training_time = feature_count * 0.08
-        elif model_type == "neural_net":
-            base_score = 0.53 + random.uniform(-0.03, 0.03)
-            training_time = feature_count * 0.2
-        else:
-            base_score = 0.50 + random.uniform(-0.01, 0.01)
-            training_time = feature_count * 0.05
-            
-        correlation = base_score + random.uniform(-0.01, 0.01)
+        if cv_folds and base_model_id:
+            return "Error: cv_folds cannot be combined with base_model_id"
+        try:
+            # Opening the data may generate it; keep the event loop free.
+            request = await _in_executor(
+                _training_request, model_type, features, hyperparameters, seed,
+                era_range, base_model_id, targets,
+            )
+            if cv_folds:
+                fold_requests = await _in_executor(
+                    _cv_requests, request, cv_folds, purge_eras, embargo_eras
+                )
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        if cv_folds:
+            try:
+                gram_store = await _in_executor(_gram_split, request)
+                if gram_store is not None and not has_era_grams(gram_store):
+                    # Build once here rather than in every fold's worker.
+                    await _in_executor(load_era_grams, gram_store)
+                pool = training_pool()
+                folds = await asyncio.gather(*(
+                    asyncio.wrap_future(pool.run(run_cv_fold, fold))
+                    for fold in fold_requests
+                ))
+            except Exception as e:
+                return f"Error: cross-validation failed: {e!r}"
+            return _format_cv(request, folds, purge_eras, embargo_eras)
         
-        return f"""✓ Model Training Complete
-Model: {model_type}
-Features: {feature_count} selected
-Hyperparameters: {hyperparameters}
-Seed: {seed}
+        registry = model_registry(request["data_seed"])
+        meta = registry.metadata(request["model_id"])
+        if meta is not None:
+            return _format_training(request["model_id"], meta, cached=True)
+        
+        try:
+            gram_store = await _in_executor(_gram_split, request)
+            if gram_store is not None and has_era_grams(gram_store):
+                # A k × k solve on cached Gram matrices; no need for a worker.
+                trained = await _in_executor(run_training_job, request)
+            else:
+                # Fit in a worker process so other samples keep running meanwhile.
+                trained = await asyncio.wrap_future(training_pool().submit(request))
+        except Exception as e:
+            return f"Error: training failed: {e!r}"
+        return _format_training(request["model_id"], trained)
+    
+    # Return single function for MVP
+    return train_model
 
-Performance:
-- Training Correlation: {correlation:.4f}
-- Training Time: {training_time:.1f}s
-- Model Size: {feature_count * 8}KB
-- Status: Ready for validation"""
+
+def _evaluation_rows(
+    model_id: str,
+    dataset: str,
+    era_range: Optional[str],
+) -> Tuple[EraStore, slice, List[str]]:
+    """Split, rows and model features an evaluation call will score.
+
+    Raises:
+        KeyError: On unknown model ids
+        ValueError: On splits without targets, gated or empty era ranges
+    """
+    if dataset not in HISTORY_DATASETS:
+        raise ValueError(
+            f"Cannot evaluate on {dataset}: choose from {', '.join(HISTORY_DATASETS)}"
+        )
+    seed = _sample_seed()
+    meta = model_registry(seed).metadata(model_id)
+    if meta is None:
+        raise KeyError(f"Unknown model: {model_id}")
+    era_store = load_split(dataset, seed=seed)
+    rows = _round_rows(era_store, era_range)
+    if rows.stop == rows.start:
+        raise ValueError(f"No {dataset} rows in era range {era_range}")
+    return era_store, rows, meta["features"]
+
+
+def _evaluate(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    features: List[str],
+    seed: int,
+    meta_model: bool,
+) -> Dict[str, Any]:
+    """Score a registered model's stored predictions on ``rows`` per era.
+
+    With ``meta_model``, MMC and meta-model correlation are scored too.
+    """
+    predictions = model_predictions(model_id, era_store.dataset, seed)[rows]
+    cache = dataset_cache()
+    with cache.acquire(era_store, rows, features, seed=seed) as view:
+        offsets = era_offsets(view.eras)
+        result = {
+            "rows": len(predictions),
+            "cache": f"{'hit' if view.hit else 'miss'} ({cache.stats()})",
+            **evaluate_predictions(predictions, view.y, view.eras),
+            **exposure_summary(feature_exposure(predictions, view.X, offsets)),
+        }
+        if meta_model:
+            basis = meta_model_basis(era_store.dataset, seed)[rows]
+            scores = contribution_scores(predictions, view.y, basis, offsets)
+            result["mmc"] = score_summary(scores["mmc"])
+            result["meta_corr"] = float(scores["meta_corr"].mean())
+        return result
+
+
+def _evaluate_history(
+    model_id: str,
+    era_range: Optional[str],
+    meta_model: bool,
+) -> Dict[str, Any]:
+    """Score a registered model per era on the streamed history.
+
+    Training and validation eras are read a few at a time through
+    ``iter_numerai_data``, so memory is bounded by one batch rather than
+    both splits. Every score is per era, so batches are scored on their own
+    and the per-era series concatenated.
+
+    Raises:
+        KeyError: On unknown model ids
+        ValueError: If history is not available this round, or no era falls
+            in ``era_range``
+    """
+    seed = _sample_seed()
+    meta = model_registry(seed).metadata(model_id)
+    if meta is None:
+        raise KeyError(f"Unknown model: {model_id}")
+    batches = iter_numerai_data(
+        "history", HISTORY_BATCH_ERAS, era_range, meta["features"]
+    )
+    splits = [load_split(name, seed=seed) for name in HISTORY_DATASETS]
+    predictions: Dict[str, np.ndarray] = {}
+    n_rows, eras, scores_per_era, exposures, mmc, meta_corr = 0, [], [], [], [], []
+    for X, y, batch_eras in batches:
+        first, last = int(batch_eras[0]), int(batch_eras[-1])
+        era_store = next(split for split in splits if first in split.era_list)
+        if era_store.dataset not in predictions:
+            predictions[era_store.dataset] = model_predictions(
+                model_id, era_store.dataset, seed
+            )
+        rows = era_store.era_rows(first, last)
+        batch = np.asarray(predictions[era_store.dataset][rows])
+        offsets = era_offsets(batch_eras)
+        scores = evaluate_predictions(batch, y, batch_eras)
+        n_rows += len(batch)
+        eras.append(scores["eras"])
+        scores_per_era.append(scores["per_era"])
+        exposures.append(feature_exposure(batch, X, offsets))
+        if meta_model:
+            basis = meta_model_basis(era_store.dataset, seed)[rows]
+            contribution = contribution_scores(batch, y, basis, offsets)
+            mmc.append(contribution["mmc"])
+            meta_corr.append(contribution["meta_corr"])
+    if not n_rows:
+        raise ValueError(f"No history rows in era range {era_range}")
+
+    per_era = np.concatenate(scores_per_era)
+    result = {
+        "rows": n_rows,
+        "eras": np.concatenate(eras),
+        "per_era": per_era,
+        **score_summary(per_era),
+        **exposure_summary(np.concatenate(exposures)),
+    }
+    if meta_model:
+        result["mmc"] = score_summary(np.concatenate(mmc))
+        result["meta_corr"] = float(np.concatenate(meta_corr).mean())
+    return result
+
+
+def _neutralize(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    neutral_features: List[str],
+    proportion: float,
+    seed: int,
+) -> Dict[str, Any]:
+    """Score a model's predictions before and after neutralization."""
+    predictions = model_predictions(model_id, era_store.dataset, seed)[rows]
+    cache = dataset_cache()
+    with cache.acquire(era_store, rows, neutral_features, seed=seed) as view:
+        offsets = era_offsets(view.eras)
+        cached = "qr" in view
+        basis = view.derived("qr", lambda: era_basis(view.X, offsets))
+        neutral = neutralize(predictions, basis, offsets, proportion)
+        return {
+            "cached": cached,
+            "cache": f"{'hit' if view.hit else 'miss'} ({cache.stats()})",
+            "before": {
+                **evaluate_predictions(predictions, view.y, view.eras),
+                **exposure_summary(feature_exposure(predictions, view.X, offsets)),
+            },
+            "after": {
+                **evaluate_predictions(neutral, view.y, view.eras),
+                **exposure_summary(feature_exposure(neutral, view.X, offsets)),
+            },
+        }
+
+
+@tool
+def model_evaluation_tool() -> Tool:
+    """Tool for scoring trained models per era."""
     
     async def evaluate_model(
         model_id: str,
         dataset: str = "validation",
+        era_range: Optional[str] = None,
     ) -> str:
-        """Evaluate trained model.
+        """Evaluate a trained model with per-era Numerai correlation.
         
         Args:
             model_id: ID of trained model
-            dataset: Dataset to evaluate on
+            dataset: Dataset to evaluate on ('validation' or 'training'), or
+                'history' for both once historical tournaments are available
+            era_range: Era range to evaluate (e.g., '121-130'; default: all allowed)
             
         Returns:
-            Model evaluation metrics
+            Mean, Sharpe and max drawdown of per-era correlation, MMC once
+            meta-model information is available, plus the per-era series
         """
-        # MVP: Simulate model evaluation with realistic metrics
-        import random
-        
-        # Simulate evaluation based on dataset
-        if dataset == "validation":
-            correlation = 0.045 + random.uniform(-0.01, 0.01)
-            sharpe = 1.2 + random.uniform(-0.3, 0.3)
-            max_drawdown = random.uniform(0.05, 0.15)
-        elif dataset == "tournament":
-            correlation = 0.03 + random.uniform(-0.01, 0.01)  # Lower on live data
-            sharpe = 0.8 + random.uniform(-0.2, 0.2)
-            max_drawdown = random.uniform(0.08, 0.20)
+        if dataset == "history":
+            # Streamed a few eras at a time; never loads the whole history.
+            try:
+                result = await _in_executor(
+                    _evaluate_history, model_id, era_range, _meta_model_info()
+                )
+            except (KeyError, ValueError) as e:
+                return f"Error: {e.args[0]}"
         else:
-            correlation = 0.02 + random.uniform(-0.005, 0.005)
-            sharpe = 0.5 + random.uniform(-0.1, 0.1)
-            max_drawdown = random.uniform(0.10, 0.25)
+            try:
+                era_store, rows, features = await _in_executor(
+                    _evaluation_rows, model_id, dataset, era_range
+                )
+            except (KeyError, ValueError) as e:
+                return f"Error: {e.args[0]}"
             
+            # Predicting (on first use) and scoring are CPU-bound; keep the
+            # event loop free.
+            result = await _in_executor(
+                _evaluate, model_id, era_store, rows, features, _sample_seed(),
+                _meta_model_info(),
+            )
+        
+        correlation = result["mean"]
+        # History is streamed from disk and never goes through the cache.
+        cache_line = f"\nData Cache: {result['cache']}" if "cache" in result else ""
+        n_eras = len(result["eras"])
+        meta_lines = ""
+        if "mmc" in result:
+            meta_lines = (
+                f"\n- MMC (mean per era): {result['mmc']['mean']:.4f} "
+                f"(Sharpe {result['mmc']['sharpe']:.2f})"
+                f"\n- Meta-Model Correlation: {result['meta_corr']:.4f}"
+            )
+        per_era = ", ".join(
+            f"{int(era)}: {corr:+.4f}"
+            for era, corr in zip(result["eras"], result["per_era"])
+        )
         return f"""✓ Model Evaluation Results
 Model: {model_id}
-Dataset: {dataset}
+Dataset: {dataset} ({result['rows']:,} rows, {n_eras} eras){cache_line}
 
 Performance Metrics:
-- Correlation: {correlation:.4f}
-- Sharpe Ratio: {sharpe:.2f}
-- Max Drawdown: {max_drawdown:.2%}
-- Feature Exposure: 0.12
-- MMC (Mean): 0.002
-- Status: {'Strong' if correlation > 0.04 else 'Moderate' if correlation > 0.02 else 'Weak'}"""
+- Correlation (mean per era): {correlation:.4f}
+- Std: {result['std']:.4f}
+- Sharpe Ratio: {result['sharpe']:.2f}
+- Max Drawdown: {result['max_drawdown']:.4f}
+- Feature Exposure (max |corr|, mean per era): {result['max_exposure']:.4f}
+- Feature Exposure (RMS): {result['rms_exposure']:.4f}{meta_lines}
+- Status: {'Strong' if correlation > 0.04 else 'Moderate' if correlation > 0.02 else 'Weak'}
+
+Per-era correlation: {per_era}"""
     
-    # Return single function for MVP
-    return train_model
+    return evaluate_model
+
+
+@tool
+def neutralization_tool() -> Tool:
+    """Tool for feature-neutralizing model predictions."""
+    
+    async def neutralize_predictions(
+        model_id: str,
+        features: List[str],
+        proportion: float = 1.0,
+        dataset: str = "validation",
+        era_range: Optional[str] = None,
+    ) -> str:
+        """Neutralize a model's predictions against a feature set and rescore.
+        
+        Each era's predictions lose ``proportion`` of their projection onto
+        the chosen features. The per-era factorization is cached, so trying
+        several proportions for the same features is cheap.
+        
+        Args:
+            model_id: ID of trained model
+            features: Features to neutralize against (empty for the model's)
+            proportion: Fraction of the exposure to remove (0-1)
+            dataset: Dataset to evaluate on ('validation' or 'training')
+            era_range: Era range to evaluate (e.g., '121-130'; default: all allowed)
+            
+        Returns:
+            Correlation, Sharpe and feature exposure before and after
+        """
+        if not 0.0 <= proportion <= 1.0:
+            return "Error: proportion must be between 0 and 1"
+        try:
+            era_store, rows, model_features = await _in_executor(
+                _evaluation_rows, model_id, dataset, era_range
+            )
+            columns = era_store.feature_index(features or model_features)
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        neutral_features = [era_store.feature_names[i] for i in columns]
+        
+        result = await _in_executor(
+            _neutralize, model_id, era_store, rows, neutral_features,
+            proportion, _sample_seed(),
+        )
+        before, after = result["before"], result["after"]
+        removed = f"{proportion:.0%} of exposure removed"
+        return f"""✓ Neutralized {model_id} on {dataset} ({removed})
+Neutralized against: {_describe_names(neutral_features)}
+Factorization: {'cached' if result['cached'] else 'computed'}
+Data Cache: {result['cache']}
+
+Metric: before -> after
+- Correlation (mean per era): {before['mean']:.4f} -> {after['mean']:.4f}
+- Sharpe Ratio: {before['sharpe']:.2f} -> {after['sharpe']:.2f}
+- Max Drawdown: {before['max_drawdown']:.4f} -> {after['max_drawdown']:.4f}
+- Feature Exposure (max |corr|): {before['max_exposure']:.4f} -> \
+{after['max_exposure']:.4f}
+- Feature Exposure (RMS): {before['rms_exposure']:.4f} -> {after['rms_exposure']:.4f}"""
+    
+    return neutralize_predictions
+
+
+def _blend(
+    model_ids: List[str],
+    era_store: EraStore,
+    rows: slice,
+    weights: Optional[List[float]],
+    method: str,
+    objective: str,
+    n_candidates: int,
+    seed: int,
+    data_seed: int,
+) -> Dict[str, Any]:
+    """Blend stored predictions on ``rows``, searching weights if none are given."""
+    predictions = stack_predictions([
+        model_predictions(model_id, era_store.dataset, data_seed)[rows]
+        for model_id in model_ids
+    ])
+    target = np.asarray(era_store.target(rows))
+    eras = np.asarray(era_store.eras(rows))
+    offsets = era_offsets(eras)
+    if weights is None:
+        search = search_weights(
+            predictions, target, offsets, method, objective, n_candidates, seed=seed
+        )
+        blend_weights, per_era = search["weights"], search["per_era"]
+        candidates = search["candidates"]
+        blended = blend(predictions, blend_weights, offsets, method)
+    else:
+        blend_weights, candidates = np.asarray(weights) / np.sum(weights), 0
+        blended = blend(predictions, blend_weights, offsets, method)
+        per_era = numerai_corr(blended, target, offsets)
+    # MMC of every member and of the blend in one batched pass.
+    basis = meta_model_basis(era_store.dataset, data_seed)[rows]
+    mmc = contribution_scores(
+        np.vstack([predictions, blended[None, :]]), target, basis, offsets
+    )["mmc"].mean(axis=1)
+    return {
+        "rows": len(target),
+        "eras": np.unique(eras),
+        "weights": blend_weights,
+        "candidates": candidates,
+        "members": [
+            {**summary, "mmc": float(member_mmc)}
+            for summary, member_mmc in zip(
+                member_summaries(predictions, target, offsets), mmc
+            )
+        ],
+        "mmc": float(mmc[-1]),
+        **score_summary(per_era),
+    }
+
+
+@tool
+def ensemble_tool() -> Tool:
+    """Tool for blending trained models' predictions."""
+    
+    async def blend_predictions(
+        model_ids: List[str],
+        weights: Optional[List[float]] = None,
+        method: str = "rank",
+        objective: str = "corr",
+        dataset: str = "validation",
+        era_range: Optional[str] = None,
+        n_candidates: int = 512,
+        seed: int = 42,
+    ) -> str:
+        """Blend several trained models and score the ensemble per era.
+        
+        Without ``weights``, blend weights are searched on the scored eras:
+        hundreds of candidate weightings are compared at once and the best
+        is reported. Pass the found weights with another ``era_range`` to
+        check them out of sample.
+        
+        Args:
+            model_ids: IDs of trained models to blend (at least two)
+            weights: Weight per model (default: search for the best)
+            method: 'rank' (average per-era ranks) or 'raw' (average predictions)
+            objective: Search objective, 'corr' (mean per era) or 'sharpe'
+            dataset: Dataset to evaluate on ('validation' or 'training')
+            era_range: Era range to evaluate (e.g., '121-130'; default: all allowed)
+            n_candidates: Random weightings to try when searching
+            seed: Seed for the weight search
+            
+        Returns:
+            Member weights and scores, and the blend's correlation, Sharpe
+            and max drawdown
+        """
+        data_config = store().get("data_config")
+        if data_config is not None and not data_config["meta_model_info"]:
+            return "Error: ensembles are not available this round"
+        model_ids = list(dict.fromkeys(model_ids))
+        if len(model_ids) < 2:
+            return "Error: blend at least two distinct models"
+        if method not in BLEND_METHODS:
+            return (
+                f"Error: Unknown blend method: {method}. "
+                f"Choose from {', '.join(BLEND_METHODS)}"
+            )
+        if objective not in SEARCH_OBJECTIVES:
+            return (
+                f"Error: Unknown objective: {objective}. "
+                f"Choose from {', '.join(SEARCH_OBJECTIVES)}"
+            )
+        if weights is not None and (
+            len(weights) != len(model_ids) or min(weights) < 0 or sum(weights) <= 0
+        ):
+            return "Error: give one non-negative weight per model, with a positive sum"
+        try:
+            for model_id in model_ids:
+                era_store, rows, _ = await _in_executor(
+                    _evaluation_rows, model_id, dataset, era_range
+                )
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        result = await _in_executor(
+            _blend, model_ids, era_store, rows, weights, method, objective,
+            n_candidates, seed, _sample_seed(),
+        )
+        
+        eras = result["eras"]
+        source = (
+            f"weights searched over {result['candidates']} candidates ({objective})"
+            if weights is None else "given weights"
+        )
+        lines = [
+            f"✓ Ensemble of {len(model_ids)} models ({method} blend, {source})",
+            f"Dataset: {dataset} ({result['rows']:,} rows, eras {eras[0]}-{eras[-1]})",
+            "",
+            "Model | Weight | Corr | Sharpe | MMC",
+        ]
+        members = zip(model_ids, result["weights"], result["members"])
+        for model_id, weight, member in members:
+            lines.append(
+                f"{model_id} | {weight:.3f} | {member['mean']:.4f} "
+                f"| {member['sharpe']:.2f} | {member['mmc']:.4f}"
+            )
+        gain = result["mean"] - max(member["mean"] for member in result["members"])
+        lines += [
+            "",
+            "Blend Metrics:",
+            f"- Correlation (mean per era): {result['mean']:.4f} "
+            f"({gain:+.4f} vs best model)",
+            f"- Std: {result['std']:.4f}",
+            f"- Sharpe Ratio: {result['sharpe']:.2f}",
+            f"- Max Drawdown: {result['max_drawdown']:.4f}",
+            f"- MMC (mean per era): {result['mmc']:.4f}",
+        ]
+        if weights is None:
+            lines += ["", "Weights were searched on these eras; scores are in-sample."]
+        return "\n".join(lines)
+    
+    return blend_predictions
+
+
+def _format_sweep(
+    request: Dict[str, Any],
+    rows: List[Dict[str, Any]],
+    schedule: List[Tuple[int, int]],
+    eta: int,
+    test_eras: List[int],
+    purge: int,
+) -> str:
+    """Tool output for a hyperparameter sweep."""
+    rungs = " -> ".join(f"{n} x {eras} eras" for n, eras in schedule)
+    engine = resolve_engine(request["model_type"])
+    lines = [
+        "✓ Hyperparameter Sweep Complete",
+        f"Model: {request['model_type']} (engine: {engine})",
+        f"Features: {len(request['features'])} selected",
+        f"Schedule (successive halving, eta={eta}): {rungs}",
+        f"Scored on held-out eras {test_eras[0]}-{test_eras[-1]} (purge {purge} eras)",
+        "",
+        "Rank | Eras | Corr | Sharpe | Hyperparameters",
+    ]
+    for rank, row in enumerate(rows, 1):
+        if "error" in row:
+            lines.append(
+                f"{rank} | {row['eras']} | failed | - "
+                f"| {row['hyperparameters']}: {row['error']}"
+            )
+        else:
+            lines.append(
+                f"{rank} | {row['eras']} | {row['mean']:.4f} | {row['sharpe']:.2f} "
+                f"| {row['hyperparameters']}"
+            )
+    if "error" not in rows[0]:
+        lines += [
+            "",
+            f"Best: {rows[0]['hyperparameters']} "
+            "(train it with train_model to register it)",
+        ]
+    return "\n".join(lines)
+
+
+@tool
+def hyperparameter_sweep_tool() -> Tool:
+    """Tool for successive-halving hyperparameter sweeps."""
+    
+    async def sweep_hyperparameters(
+        model_type: str,
+        features: List[str],
+        search_space: Dict[str, List[Any]],
+        budget: int = 9,
+        eta: int = 3,
+        seed: int = 42,
+        era_range: Optional[str] = None,
+        purge_eras: int = 4,
+    ) -> str:
+        """Search hyperparameters in one call with successive halving.
+        
+        Samples ``budget`` configurations from the search space and trains
+        them all on a small subset of eras; the best 1/eta move on to eta
+        times as many eras, until the survivors use every training era.
+        Fits run in parallel and are scored per era on the latest allowed
+        training eras, which are held out.
+        
+        Args:
+            model_type: Type of model ('hist_gbdt', 'xgboost', 'lightgbm',
+                'linear', 'neural_net')
+            features: Feature columns to use (empty for all features)
+            search_space: Candidate values per hyperparameter, e.g.
+                {"max_iter": [50, 100, 200], "learning_rate": [0.02, 0.05]}
+            budget: Number of configurations to try
+            eta: Halving rate (keep 1/eta of configurations per rung)
+            seed: Random seed for sampling and training
+            era_range: Training era range (e.g., '1-60'; default: all allowed)
+            purge_eras: Eras between the training eras and the held-out eras
+            
+        Returns:
+            Ranked table of configurations with held-out correlation and Sharpe
+        """
+        if budget < 1:
+            return "Error: budget must be at least 1"
+        try:
+            request = await _in_executor(
+                _training_request, model_type, features, {}, seed, era_range
+            )
+            configs = sample_configs(search_space, budget, seed)
+            era_store = await _in_executor(
+                load_split, "training", request["data_seed"]
+            )
+            positions = era_positions(era_store, slice(*request["rows"]))
+            train_eras, test_eras = holdout_split(positions, purge_eras)
+            schedule = halving_schedule(len(configs), len(train_eras), eta)
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        try:
+            if gram_eligible(model_type, {}) and not has_era_grams(era_store):
+                await _in_executor(load_era_grams, era_store)
+            rows = await successive_halving(
+                request, configs, train_eras, test_eras, eta
+            )
+        except Exception as e:
+            return f"Error: sweep failed: {e!r}"
+        test_labels = era_store.era_index[test_eras, 0].tolist()
+        return _format_sweep(request, rows, schedule, eta, test_labels, purge_eras)
+    
+    return sweep_hyperparameters
+
+
+@tool
+def training_jobs_tool() -> Tool:
+    """Tool for starting model trainings in the background."""
+    
+    async def submit_training(
+        model_type: str,
+        features: List[str],
+        hyperparameters: Dict[str, Any],
+        seed: int = 42,
+        era_range: Optional[str] = None,
+        base_model_id: Optional[str] = None,
+        targets: Optional[List[str]] = None,
+    ) -> str:
+        """Start training a model without waiting for it to finish.
+        
+        Submit several configurations, then poll them with
+        training_status and collect them with training_result.
+        
+        Args:
+            model_type: Type of model ('hist_gbdt', 'xgboost', 'lightgbm',
+                'linear', 'neural_net')
+            features: Feature columns to use (empty for all features)
+            hyperparameters: Model hyperparameters
+            seed: Random seed for reproducibility
+            era_range: Training era range (e.g., '1-60'; default: all allowed)
+            base_model_id: Registered model to continue on the new eras only
+            targets: Target columns to fit (default: ['target'])
+            
+        Returns:
+            Job ID (equal to the model ID the training will produce)
+        """
+        try:
+            request = await _in_executor(
+                _training_request, model_type, features, hyperparameters, seed,
+                era_range, base_model_id, targets,
+            )
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        job_id = request["model_id"]
+        if job_id in model_registry(request["data_seed"]):
+            return f"✓ Job {job_id}: already trained, result available"
+        training_pool().submit(request)
+        return f"✓ Submitted job {job_id}"
+    
+    return submit_training
+
+
+@tool
+def training_status_tool() -> Tool:
+    """Tool for polling background training jobs."""
+    
+    async def training_status(job_ids: List[str]) -> str:
+        """Check the status of submitted training jobs.
+        
+        Args:
+            job_ids: Job IDs returned by submit_training
+            
+        Returns:
+            One status per job: pending, running, done, failed or unknown
+        """
+        registry = model_registry(_sample_seed())
+        pool = training_pool()
+        lines = []
+        for job_id in job_ids:
+            status = "done" if job_id in registry else pool.status(job_id)
+            lines.append(f"- {job_id}: {status}")
+        return "\n".join(lines)
+    
+    return training_status
+
+
+@tool
+def training_result_tool() -> Tool:
+    """Tool for collecting background training results."""
+    
+    async def training_result(job_id: str, wait: bool = False) -> str:
+        """Get the result of a training job.
+        
+        Args:
+            job_id: Job ID returned by submit_training
+            wait: Wait for the job to finish instead of returning its status
+            
+        Returns:
+            Training results, or the job status if not finished
+        """
+        registry = model_registry(_sample_seed())
+        meta = registry.metadata(job_id)
+        if meta is not None:
+            return _format_training(job_id, meta)
+        
+        job = training_pool().get(job_id)
+        if job is None:
+            return f"Unknown job: {job_id}"
+        if not job.done() and not wait:
+            return f"Job {job_id} is {training_pool().status(job_id)}"
+        try:
+            trained = await asyncio.wrap_future(job)
+        except Exception as e:
+            return f"Error: training failed: {e!r}"
+        return _format_training(job_id, trained)
+    
+    return training_result
+
+
+def _predict_split(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    seed: int,
+) -> Dict[str, Any]:
+    """Stored predictions of a model on a split, generating them on a miss."""
+    stored = prediction_store(seed)
+    cached = (model_id, era_store.dataset) in stored
+    predictions = model_predictions(model_id, era_store.dataset, seed)
+    window = np.asarray(predictions[rows])
+    return {
+        "cached": cached,
+        "rows": len(window),
+        "eras": np.unique(era_store.eras(rows)),
+        "nbytes": predictions.nbytes,
+        "store_bytes": stored.nbytes,
+        "max_bytes": stored.max_bytes,
+        "mean": float(window.mean()),
+        "std": float(window.std()),
+        "min": float(window.min()),
+        "max": float(window.max()),
+    }
+
+
+@tool
+def prediction_tool() -> Tool:
+    """Tool for generating and storing model predictions."""
+    
+    async def generate_predictions(model_id: str, dataset: str = "tournament") -> str:
+        """Generate a model's predictions for a dataset and store them.
+        
+        Live tournament rows go through exactly the same chunked pipeline
+        as validation rows, so live and validation predictions are
+        comparable. Predictions are computed once and reused by evaluation,
+        ensembling and submission simulation.
+        
+        Args:
+            model_id: ID of trained model
+            dataset: Dataset to predict ('tournament', 'validation' or 'training')
+            
+        Returns:
+            Row count, storage and distribution of the predictions
+        """
+        if dataset not in DATASETS:
+            return f"Unknown dataset type: {dataset}"
+        seed = _sample_seed()
+        if model_id not in model_registry(seed):
+            return f"Error: Unknown model: {model_id}"
+        try:
+            era_store = await _in_executor(load_split, dataset, seed)
+            rows = _round_rows(era_store)
+        except ValueError as e:
+            return f"Error: {e}"
+        if rows.stop == rows.start:
+            return f"Error: No {dataset} rows available this round"
+        
+        result = await _in_executor(
+            _predict_split, model_id, era_store, rows, seed
+        )
+        eras = result["eras"]
+        if result["cached"]:
+            source = "served from the prediction store"
+        else:
+            n_chunks = -(-era_store.n_rows // PREDICTION_CHUNK_ROWS)
+            source = (
+                f"generated in {n_chunks} chunks "
+                f"of up to {PREDICTION_CHUNK_ROWS:,} rows"
+            )
+        used, quota = result["store_bytes"] / 1e6, result["max_bytes"] / 1e6
+        return f"""✓ Predictions for {model_id} on {dataset}
+Rows: {result['rows']:,} (eras {eras[0]}-{eras[-1]}), {source}
+Storage: float32 memory map, {result['nbytes'] / 1e6:.2f} MB \
+(store: {used:.1f} of {quota:.0f} MB)
+Distribution: mean {result['mean']:.4f}, std {result['std']:.4f}
+Range: {result['min']:.4f} to {result['max']:.4f}"""
+    
+    return generate_predictions
+
+
+def _window_scores(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    seed: int,
+    meta_model: bool,
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """Cached per-era labels, CORR and MMC (None without ``meta_model``) on ``rows``."""
+    scores = era_scores(model_id, era_store.dataset, seed)
+    first, last = era_store.eras(rows)[[0, -1]]
+    window = (scores["eras"] >= first) & (scores["eras"] <= last)
+    mmc = scores["mmc"][window] if meta_model else None
+    return scores["eras"][window], scores["corr"][window], mmc
+
+
+def _simulate(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    stake_amount: float,
+    confidence: float,
+    seed: int,
+    meta_model: bool,
+) -> Dict[str, Any]:
+    """Replay a model's per-era scores on ``rows`` as compounding payouts."""
+    eras, corr, mmc = _window_scores(model_id, era_store, rows, seed, meta_model)
+    simulation = simulate_payouts(corr, mmc, stake_amount, confidence)
+    return {
+        "eras": eras,
+        "corr": corr,
+        "mmc": mmc,
+        "payouts": simulation["payouts"],
+        **payout_summary(simulation, stake_amount),
+    }
 
 
 @tool
@@ -231,23 +1489,211 @@ def submission_simulator_tool() -> Tool:
         model_id: str,
         stake_amount: float,
         confidence: float = 0.5,
+        dataset: str = "validation",
+        era_range: Optional[str] = None,
     ) -> str:
         """Simulate a tournament submission.
         
+        Replays the model's stored predictions over historical eras as if
+        each era were a resolved round: the payout is the stake at risk
+        times 0.5 × CORR + 2 × MMC, capped at ±5% per round (the burn cap),
+        and payouts compound into the stake. Scores are cached, so trying
+        other stakes and confidence levels is instant.
+        
         Args:
             model_id: ID of model to submit
             stake_amount: Amount to stake (in NMR)
-            confidence: Confidence level (0-1)
+            confidence: Confidence level (0-1): fraction of the stake put at
+                risk each round
+            dataset: Historical eras to replay ('validation' or 'training')
+            era_range: Era range to replay (e.g., '121-130'; default: all allowed)
             
         Returns:
             Simulation results including correlation, MMC, and payout
         """
-        # TODO: Implement submission simulation using historical data
-        return f"Simulated submission for {model_id} with stake {stake_amount} NMR"
+        if stake_amount <= 0:
+            return "Error: stake_amount must be positive"
+        if not 0.0 <= confidence <= 1.0:
+            return "Error: confidence must be between 0 and 1"
+        try:
+            era_store, rows, _ = await _in_executor(
+                _evaluation_rows, model_id, dataset, era_range
+            )
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        result = await _in_executor(
+            _simulate, model_id, era_store, rows, stake_amount, confidence,
+            _sample_seed(), _meta_model_info(),
+        )
+        
+        eras = result["eras"]
+        series = ", ".join(
+            f"{int(era)}: {payout:+.2f}" for era, payout in zip(eras, result["payouts"])
+        )
+        mmc = (
+            f"MMC (mean per era): {result['mmc'].mean():.4f}"
+            if result["mmc"] is not None
+            else "MMC: not scored (meta-model information is not available this round)"
+        )
+        return f"""✓ Submission Simulation: {model_id}
+Replayed: {len(eras)} {dataset} eras ({eras[0]}-{eras[-1]})
+Stake: {stake_amount:.2f} NMR, {confidence:.0%} at risk per round
+Payout Rule: {CORR_MULTIPLIER} × CORR + {MMC_MULTIPLIER} × MMC, \
+capped at ±{PAYOUT_CAP:.0%}, compounding
+
+Scores:
+- CORR (mean per era): {result['corr'].mean():.4f}
+- {mmc}
+
+Payouts:
+- Total Payout: {result['total_payout']:+.2f} NMR ({result['total_return']:+.2%})
+- Final Stake: {result['final_stake']:.2f} NMR
+- Mean Payout per Round: {result['mean_payout']:+.3f} NMR
+- Positive Rounds: {result['hit_rate']:.0%}
+- Best / Worst Round: {result['best_payout']:+.2f} / {result['worst_payout']:+.2f} NMR
+- Max Stake Drawdown: {result['max_drawdown']:.2%}
+- Rounds at Burn Cap / Payout Cap: {result['burn_capped']} / {result['payout_capped']}
+
+Payout series (NMR): {series}"""
     
     return simulate_submission
 
 
+def _stake_risk(
+    model_id: str,
+    era_store: EraStore,
+    rows: slice,
+    stake_amount: float,
+    confidence_levels: List[float],
+    rounds: int,
+    n_paths: int,
+    ruin_level: float,
+    block_rounds: int,
+    seed: int,
+    data_seed: int,
+    meta_model: bool,
+) -> Dict[str, Any]:
+    """Bootstrap future stake paths from a model's per-era scores on ``rows``.
+
+    Blocks are capped at half the history; longer ones would make every path
+    a rotation of the historical one.
+    """
+    eras, corr, mmc = _window_scores(model_id, era_store, rows, data_seed, meta_model)
+    block_rounds = min(block_rounds, max(1, len(eras) // 2))
+    return {
+        "eras": eras,
+        "mmc": mmc is not None,
+        "block_rounds": block_rounds,
+        **bootstrap_payouts(
+            corr, mmc, stake_amount, confidence_levels, rounds, n_paths, ruin_level,
+            block_rounds, seed, quantiles=(0.05, 0.5, 0.95),
+        ),
+    }
+
+
+@tool
+def stake_risk_tool() -> Tool:
+    """Tool for Monte-Carlo stake sizing and risk of ruin."""
+    
+    async def simulate_stake_risk(
+        model_id: str,
+        stake_amount: float,
+        confidence_levels: Optional[List[float]] = None,
+        rounds: int = 52,
+        n_paths: int = 100_000,
+        ruin_level: float = 0.5,
+        block_rounds: int = 4,
+        dataset: str = "validation",
+        era_range: Optional[str] = None,
+        seed: int = 42,
+    ) -> str:
+        """Compare staking policies on bootstrapped future rounds.
+        
+        Resamples the model's historical per-era payouts (in blocks of
+        consecutive eras) into many future stake paths and reports, for each
+        fraction of the stake put at risk, the distribution of the final
+        stake, drawdowns and the risk of ruin. All policies are scored on the
+        same paths.
+        
+        Args:
+            model_id: ID of model to stake on
+            stake_amount: Initial stake (in NMR)
+            confidence_levels: Fractions of the stake at risk per round to
+                compare (default: 0.1, 0.25, 0.5, 0.75 and 1.0)
+            rounds: Future rounds per path
+            n_paths: Number of simulated paths (up to 1,000,000)
+            ruin_level: Fraction of the initial stake whose loss counts as ruin
+                (e.g. 0.5: the stake halves at some point)
+            block_rounds: Consecutive historical eras per resampled block
+            dataset: Historical eras to resample ('validation' or 'training')
+            era_range: Era range to resample (e.g., '121-130'; default: all allowed)
+            seed: Sampling seed
+            
+        Returns:
+            Per-policy final stake quantiles, loss probability, drawdowns,
+            risk of ruin and growth, plus the recommended policy
+        """
+        levels = list(confidence_levels or CONFIDENCE_LEVELS)
+        try:
+            era_store, rows, _ = await _in_executor(
+                _evaluation_rows, model_id, dataset, era_range
+            )
+            result = await _in_executor(
+                _stake_risk, model_id, era_store, rows, stake_amount, levels,
+                rounds, n_paths, ruin_level, block_rounds, seed, _sample_seed(),
+                _meta_model_info(),
+            )
+        except (KeyError, ValueError) as e:
+            return f"Error: {e.args[0]}"
+        
+        eras = result["eras"]
+        if result["mmc"]:
+            rule = f"{CORR_MULTIPLIER} × CORR + {MMC_MULTIPLIER} × MMC"
+        else:
+            rule = f"{CORR_MULTIPLIER} × CORR (MMC not available this round)"
+        lines = [
+            f"✓ Stake Risk Simulation: {model_id}",
+            f"Bootstrapped: {n_paths:,} paths of {rounds} rounds "
+            f"from {len(eras)} {dataset} eras ({eras[0]}-{eras[-1]}), "
+            f"blocks of {result['block_rounds']}",
+            f"Stake: {stake_amount:.2f} NMR; ruin = falling to {ruin_level:.0%} "
+            f"({stake_amount * ruin_level:.2f} NMR)",
+            f"Payout Rule: {rule}, capped at ±{PAYOUT_CAP:.0%}, compounding",
+            "",
+            "At Risk | Median Final | 5%-95% Final | P(loss) | Median / 95% Drawdown "
+            "| Risk of Ruin | Growth per Round",
+        ]
+        for i, level in enumerate(levels):
+            final, drawdown = result["final_stake"][i], result["max_drawdown"][i]
+            lines.append(
+                f"{level:.0%} | {final[1]:.2f} | {final[0]:.2f}-{final[2]:.2f} "
+                f"| {result['loss_probability'][i]:.1%} "
+                f"| {drawdown[1]:.1%} / {drawdown[2]:.1%} "
+                f"| {result['risk_of_ruin'][i]:.2%} "
+                f"| {np.expm1(result['growth_rate'][i]):+.3%}"
+            )
+        safe = [
+            i for i in range(len(levels))
+            if result["risk_of_ruin"][i] <= RUIN_TOLERANCE
+        ]
+        lines.append("")
+        if safe:
+            best = max(safe, key=lambda i: result["growth_rate"][i])
+            lines.append(
+                f"Best growth with risk of ruin ≤ {RUIN_TOLERANCE:.0%}: "
+                f"{levels[best]:.0%} of the stake at risk"
+            )
+        else:
+            lines.append(
+                f"No policy keeps the risk of ruin at or below {RUIN_TOLERANCE:.0%}; "
+                "put less of the stake at risk"
+            )
+        return "\n".join(lines)
+    
+    return simulate_stake_risk
+
+
 @tool
 def business_sim_tool() -> Tool:
     """Tool for bankroll and risk management simulation."""
@@ -259,6 +1705,9 @@ def business_sim_tool() -> Tool:
     ) -> str:
         """Update bankroll after round payout.
         
+        The bankroll starts at the first round's stake and every payout is
+        added to it. Running risk statistics are updated with each round.
+        
         Args:
             round_num: Tournament round number
             payout: Payout amount (can be negative)
@@ -267,25 +1716,122 @@ def business_sim_tool() -> Tool:
         Returns:
             Updated bankroll status
         """
-        # TODO: Implement bankroll tracking
-        return f"Updated bankroll after round {round_num}: payout {payout}"
+        try:
+            metrics = _record_bankroll(round_num, payout, stake)
+        except ValueError as e:
+            return f"Error: {e.args[0]}"
+        return f"""✓ Bankroll updated after round {round_num}
+Payout: {payout:+.2f} NMR on {stake:.2f} NMR staked ({metrics['return']:+.2%})
+Bankroll: {metrics['bankroll']:.2f} NMR
+Peak: {metrics['peak']:.2f} NMR (current drawdown {metrics['drawdown']:.2%})
+Rounds Recorded: {metrics['rounds']}"""
+    
+    return update_bankroll
+
+
+def _round_regimes(rounds: np.ndarray) -> np.ndarray:
+    """Regime code of the era each round resolved on (-1 for unknown eras)."""
+    eras, codes = regime_labels(seed=_sample_seed())
+    index = np.minimum(np.searchsorted(eras, rounds), len(eras) - 1)
+    return np.where(eras[index] == rounds, codes[index], -1)
+
+
+def _format_rolling(rolling: Dict[str, np.ndarray]) -> List[str]:
+    """Latest, lowest and highest rolling Sharpe ratio per window."""
+    lines = ["Rolling Sharpe (latest / min / max over full windows):"]
+    for window, sharpe in zip(rolling["windows"], rolling["sharpe"]):
+        full = sharpe[~np.isnan(sharpe)]
+        if len(full) == 0:
+            lines.append(f"- {window} rounds: needs {window} recorded rounds")
+            continue
+        lines.append(
+            f"- {window} rounds: {full[-1]:.2f} / {full.min():.2f} / {full.max():.2f}"
+        )
+    return lines
+
+
+def _format_regimes(breakdown: Dict[str, np.ndarray], unlabeled: int) -> List[str]:
+    """Per-regime table of the rounds played."""
+    lines = [
+        "Regimes (of the era each round resolved on):",
+        "Regime | Rounds | Mean Return | Sharpe | Positive Rounds | Total Payout",
+    ]
+    for i, name in enumerate(REGIME_NAMES):
+        if breakdown["rounds"][i] == 0:
+            lines.append(f"{name} | 0 | - | - | - | -")
+            continue
+        lines.append(
+            f"{name} | {breakdown['rounds'][i]} | {breakdown['mean_return'][i]:+.2%} "
+            f"| {breakdown['sharpe'][i]:.2f} | {breakdown['hit_rate'][i]:.0%} "
+            f"| {breakdown['total_payout'][i]:+.2f} NMR"
+        )
+    if unlabeled:
+        lines.append(f"({unlabeled} rounds without a matching era are left out)")
+    return lines
+
+
+@tool
+def risk_metrics_tool() -> Tool:
+    """Tool for risk metrics of the recorded bankroll."""
     
     async def calculate_risk_metrics(
         round_num: int,
+        windows: Optional[List[int]] = None,
     ) -> str:
         """Calculate risk metrics for current strategy.
         
+        Reads the running statistics kept by the bankroll ledger, so the
+        cost does not grow with the number of rounds recorded. Adds rolling
+        Sharpe ratios for any number of window lengths, drawdown duration,
+        and (when regime labels are available) a per-regime breakdown.
+        
         Args:
-            round_num: Tournament round number
+            round_num: Tournament round number (metrics as of the last
+                recorded round at or before it)
+            windows: Rolling window lengths in rounds (default: 4, 13, 26)
             
         Returns:
             Risk metrics (drawdown, Sharpe ratio, etc.)
         """
-        # TODO: Implement risk calculations
-        return f"Risk metrics for round {round_num}"
+        ledger = _bankroll_ledger()
+        metrics = ledger.metrics(round_num)
+        if not metrics:
+            return f"No bankroll updates recorded by round {round_num}"
+        try:
+            rolling = ledger.rolling(windows or ROLLING_WINDOWS, round_num)
+        except ValueError as e:
+            return f"Error: {e.args[0]}"
+        
+        lines = [
+            f"✓ Risk Metrics as of round {metrics['round']}",
+            f"Rounds Recorded: {metrics['rounds']}",
+            f"Bankroll: {metrics['bankroll']:.2f} NMR "
+            f"({metrics['total_payout']:+.2f} NMR total payout)",
+            f"Peak: {metrics['peak']:.2f} NMR",
+            f"Current Drawdown: {metrics['drawdown']:.2%}",
+            f"Max Drawdown: {metrics['max_drawdown']:.2%}",
+            f"Drawdown Duration: {metrics['drawdown_rounds']} rounds below peak "
+            f"(longest {metrics['max_drawdown_rounds']})",
+            f"Return per Round (on stake): {metrics['mean_return']:+.2%} mean, "
+            f"{metrics['std_return']:.2%} std",
+            f"Sharpe Ratio (per round): {metrics['sharpe']:.2f}",
+            f"Sortino Ratio (per round): {metrics['sortino']:.2f}",
+            f"Positive Rounds: {metrics['hit_rate']:.0%}",
+            "",
+            *_format_rolling(rolling),
+            "",
+        ]
+        data_config = store().get("data_config")
+        if data_config is not None and not data_config["regime_labels"]:
+            lines.append("Regimes: regime labels are not available this round")
+        else:
+            rounds = ledger.history()["round"][:metrics["rounds"]]
+            regimes = await _in_executor(_round_regimes, rounds)
+            breakdown = ledger.regime_breakdown(regimes, len(REGIME_NAMES), round_num)
+            lines += _format_regimes(breakdown, int(np.sum(regimes < 0)))
+        return "\n".join(lines)
     
-    # Return single function for MVP
-    return update_bankroll
+    return calculate_risk_metrics
 
 
 @tool
@@ -338,6 +1884,11 @@ def NumeraiDataTool() -> Tool:
     return numerai_data_tool()
 
 
+def FeatureMetadataTool() -> Tool:
+    """Factory function for feature metadata tool."""
+    return feature_metadata_tool()
+
+
 def ScratchpadTool() -> Tool:
     """Factory function for scratchpad tool."""
     return scratchpad_tool()
@@ -353,16 +1904,66 @@ def ModelTrainingTool() -> Tool:
     return model_training_tool()
 
 
+def ModelEvaluationTool() -> Tool:
+    """Factory function for model evaluation tool."""
+    return model_evaluation_tool()
+
+
+def NeutralizationTool() -> Tool:
+    """Factory function for feature neutralization tool."""
+    return neutralization_tool()
+
+
+def EnsembleTool() -> Tool:
+    """Factory function for ensemble blending tool."""
+    return ensemble_tool()
+
+
+def HyperparameterSweepTool() -> Tool:
+    """Factory function for hyperparameter sweep tool."""
+    return hyperparameter_sweep_tool()
+
+
+def TrainingJobsTool() -> Tool:
+    """Factory function for background training submission tool."""
+    return training_jobs_tool()
+
+
+def TrainingStatusTool() -> Tool:
+    """Factory function for training job status tool."""
+    return training_status_tool()
+
+
+def TrainingResultTool() -> Tool:
+    """Factory function for training job result tool."""
+    return training_result_tool()
+
+
+def PredictionTool() -> Tool:
+    """Factory function for prediction generation tool."""
+    return prediction_tool()
+
+
 def SubmissionSimulatorTool() -> Tool:
     """Factory function for submission simulator tool."""
     return submission_simulator_tool()
 
 
+def StakeRiskTool() -> Tool:
+    """Factory function for Monte-Carlo stake risk tool."""
+    return stake_risk_tool()
+
+
 def BusinessSimTool() -> Tool:
     """Factory function for business simulation tool."""
     return business_sim_tool()
 
 
+def RiskMetricsTool() -> Tool:
+    """Factory function for bankroll risk metrics tool."""
+    return risk_metrics_tool()
+
+
 def VectorMemoryTool() -> Tool:
     """Factory function for vector memory tool."""
     return vector_memory_tool()
\ No newline at end of file
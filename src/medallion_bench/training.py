@@ -0,0 +1,337 @@
+"""Model training backends for MedallionBench.
+
+The default engine is histogram gradient boosting from scikit-learn, which
+bins the ``uint8`` feature codes directly (five codes, five bins). XGBoost
+and LightGBM are used when the ``numerai`` extra is installed and fall back
+to the histogram engine otherwise. Every fit and prediction runs under an
+explicit thread limit so concurrent samples do not oversubscribe the
+machine's cores. Thread limits are process-wide, so limited blocks in one
+process take turns (see :func:`limit_threads`): training workers run one job
+each, and inference in the main process shares a single thread budget.
+
+Models can be fitted on several targets at once from one in-memory copy of
+the features: ridge solves all targets against one factorization, the
+neural net shares its hidden layers, and XGBoost (2.0 or later) grows
+multi-output trees from shared histograms. The histogram engine and LightGBM
+have no multi-output trees, so they still fit one booster per target on the
+same codes: a separate pass per target, with nothing shared but the input
+array. The model's prediction is the mean of its per-target predictions.
+"""
+
+import contextlib
+import copy
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from .store import dequantize
+
+THREADS_ENV = "MEDALLION_BENCH_TRAIN_THREADS"
+
+MODEL_TYPES = ("hist_gbdt", "xgboost", "lightgbm", "linear", "neural_net")
+
+# Common boosting hyperparameter names mapped onto scikit-learn's.
+_HIST_ALIASES = {
+    "n_estimators": "max_iter",
+    "num_boost_round": "max_iter",
+    "num_leaves": "max_leaf_nodes",
+    "min_child_samples": "min_samples_leaf",
+    "min_data_in_leaf": "min_samples_leaf",
+    "reg_lambda": "l2_regularization",
+    "lambda_l2": "l2_regularization",
+    "colsample_bytree": "max_features",
+    "feature_fraction": "max_features",
+}
+WARM_START_ITERS = 20
+
+_THREAD_LIMIT_LOCK = threading.RLock()
+
+_HIST_DEFAULTS = {
+    "max_iter": 100,
+    "learning_rate": 0.05,
+    "max_leaf_nodes": 31,
+    "early_stopping": False,
+}
+
+
+class TrainedModel:
+    """A fitted model plus the measurements taken while fitting it."""
+
+    def __init__(
+        self,
+        model_type: str,
+        engine: str,
+        estimator: Any,
+        params: Dict[str, Any],
+        n_threads: int,
+        train_seconds: float,
+    ):
+        self.model_type = model_type
+        self.engine = engine
+        self.estimator = estimator
+        self.params = params
+        self.n_threads = n_threads
+        self.train_seconds = train_seconds
+        self.size_bytes = len(pickle.dumps(estimator))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict from ``uint8`` feature codes as float32.
+
+        Multi-target models return the mean of their per-target predictions.
+        """
+        predictions = self.predict_targets(X)
+        if predictions.shape[1] == 1:
+            return predictions[:, 0]
+        return np.asarray(predictions.mean(axis=1))
+
+    def predict_targets(self, X: np.ndarray) -> np.ndarray:
+        """``(rows, n_targets)`` float32 predictions, one column per target."""
+        with limit_threads(self.n_threads):
+            if self.engine in ("linear", "neural_net"):
+                X = dequantize(X)
+            predictions = np.asarray(self.estimator.predict(X), dtype=np.float32)
+        return predictions.reshape(len(predictions), -1)
+
+
+def default_threads() -> int:
+    """Threads per training call.
+
+    Uses ``$MEDALLION_BENCH_TRAIN_THREADS`` when set, otherwise half the
+    machine's cores so two concurrent fits fill it without oversubscribing.
+    """
+    env = os.environ.get(THREADS_ENV)
+    if env:
+        return max(1, int(env))
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+@contextlib.contextmanager
+def limit_threads(n_threads: int) -> Iterator[None]:
+    """Limit native (BLAS/OpenMP) threads to ``n_threads`` within a block.
+
+    ``threadpool_limits`` changes process-wide settings and is not
+    thread-safe, so limited blocks in one process are serialized: executor
+    threads predicting for different samples wait for each other instead of
+    each claiming ``n_threads`` cores.
+    """
+    with _THREAD_LIMIT_LOCK, threadpool_limits(limits=n_threads):
+        yield
+
+
+def resolve_engine(model_type: str) -> str:
+    """Engine that will actually fit ``model_type`` in this environment.
+
+    Raises:
+        ValueError: If the model type is unknown
+    """
+    if model_type not in MODEL_TYPES:
+        raise ValueError(
+            f"Unknown model type: {model_type}. Choose from {', '.join(MODEL_TYPES)}"
+        )
+    if model_type in ("xgboost", "lightgbm") and not _importable(model_type):
+        return "hist_gbdt"
+    return model_type
+
+
+def fit_model(
+    model_type: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    hyperparameters: Optional[Dict[str, Any]] = None,
+    seed: int = 42,
+    n_threads: Optional[int] = None,
+) -> TrainedModel:
+    """Fit a model on ``uint8`` feature codes.
+
+    Args:
+        model_type: One of ``MODEL_TYPES``
+        X: ``(rows, features)`` uint8 feature codes
+        y: ``(rows,)`` float32 target, or ``(rows, n_targets)`` to fit
+            several targets in one model. Only XGBoost (2.0 or later) shares
+            histograms across targets; the histogram engine and LightGBM
+            fit one booster per target, so they cost ``n_targets`` fits.
+        hyperparameters: Engine hyperparameters (common boosting names
+            such as ``n_estimators`` or ``num_leaves`` are translated)
+        seed: Random seed for reproducibility
+        n_threads: Thread limit for this fit (default: :func:`default_threads`)
+
+    Returns:
+        TrainedModel: Fitted model with measured training time and size
+
+    Raises:
+        ValueError: On unknown model types or hyperparameters
+    """
+    engine = resolve_engine(model_type)
+    n_threads = n_threads or default_threads()
+    if y.ndim == 2 and y.shape[1] == 1:
+        y = y[:, 0]
+    multi_target = y.ndim == 2
+    params = dict(hyperparameters or {})
+    if multi_target and engine == "xgboost":
+        params.setdefault("multi_strategy", "multi_output_tree")
+    estimator, params = _build_estimator(engine, params, seed, n_threads)
+    if multi_target and engine in ("hist_gbdt", "lightgbm"):
+        from sklearn.multioutput import MultiOutputRegressor
+
+        estimator = MultiOutputRegressor(estimator)
+
+    start = time.perf_counter()
+    with limit_threads(n_threads):
+        if engine in ("linear", "neural_net"):
+            estimator.fit(dequantize(X), y)
+        else:
+            estimator.fit(X, y)
+    train_seconds = time.perf_counter() - start
+
+    return TrainedModel(model_type, engine, estimator, params, n_threads, train_seconds)
+
+
+def continue_model(
+    base: TrainedModel,
+    X: np.ndarray,
+    y: np.ndarray,
+    hyperparameters: Optional[Dict[str, Any]] = None,
+    n_threads: Optional[int] = None,
+) -> TrainedModel:
+    """Continue training a fitted model on new rows only.
+
+    Boosting engines add trees fitted on the new rows to the existing
+    ensemble (``warm_start`` for the histogram engine, ``xgb_model`` for
+    XGBoost, ``init_model`` for LightGBM); the neural net takes further
+    ``partial_fit`` epochs. The base model is left untouched.
+
+    Args:
+        base: Model to continue from
+        X: ``(rows, features)`` uint8 feature codes of the new rows
+        y: ``(rows,)`` float32 target of the new rows, or
+            ``(rows, n_targets)`` for a multi-target base
+        hyperparameters: ``max_iter`` (or an alias such as
+            ``n_estimators``): trees or epochs to add (default
+            ``WARM_START_ITERS``)
+        n_threads: Thread limit for this fit (default: :func:`default_threads`)
+
+    Returns:
+        TrainedModel: The continued model
+
+    Raises:
+        ValueError: For engines that cannot be continued or unknown
+            hyperparameters
+    """
+    params = {_HIST_ALIASES.get(k, k): v for k, v in (hyperparameters or {}).items()}
+    extra = params.pop("max_iter", WARM_START_ITERS)
+    if params:
+        raise ValueError(
+            f"Only max_iter (trees or epochs to add) can be set when continuing: "
+            f"{', '.join(params)}"
+        )
+    from sklearn.multioutput import MultiOutputRegressor
+
+    n_threads = n_threads or default_threads()
+    estimator = copy.deepcopy(base.estimator)
+
+    start = time.perf_counter()
+    with limit_threads(n_threads):
+        if isinstance(estimator, MultiOutputRegressor):
+            # One booster per target: continue each on its own column.
+            for i, (member, base_member) in enumerate(
+                zip(estimator.estimators_, base.estimator.estimators_)
+            ):
+                _continue_estimator(base.engine, member, base_member, X, y[:, i], extra)
+        else:
+            _continue_estimator(base.engine, estimator, base.estimator, X, y, extra)
+    train_seconds = time.perf_counter() - start
+
+    params = {**base.params, "warm_start_iters": extra}
+    return TrainedModel(
+        base.model_type, base.engine, estimator, params, n_threads, train_seconds
+    )
+
+
+def _continue_estimator(
+    engine: str,
+    estimator: Any,
+    base_estimator: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    extra: int,
+) -> None:
+    """Add ``extra`` trees or epochs to a copy of a fitted estimator in place."""
+    if engine == "hist_gbdt":
+        estimator.set_params(warm_start=True, max_iter=estimator.max_iter + extra)
+        estimator.fit(X, y)
+    elif engine == "xgboost":
+        estimator.set_params(n_estimators=extra)
+        estimator.fit(X, y, xgb_model=base_estimator.get_booster())
+    elif engine == "lightgbm":
+        estimator.set_params(n_estimators=extra)
+        estimator.fit(X, y, init_model=base_estimator.booster_)
+    elif engine == "neural_net":
+        # partial_fit tracks training loss; a net fitted with early
+        # stopping only tracked validation scores so far.
+        estimator.set_params(early_stopping=False)
+        if getattr(estimator, "best_loss_", None) is None:
+            estimator.best_loss_ = np.inf
+        for _ in range(extra):
+            estimator.partial_fit(dequantize(X), y)
+    else:
+        raise ValueError(f"{engine} models cannot be continued")
+
+
+def _build_estimator(
+    engine: str,
+    params: Dict[str, Any],
+    seed: int,
+    n_threads: int,
+) -> Tuple[Any, Dict[str, Any]]:
+    """Instantiate an unfitted estimator, validating hyperparameters."""
+    if engine == "hist_gbdt":
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        params = {_HIST_ALIASES.get(k, k): v for k, v in params.items()}
+        params = {**_HIST_DEFAULTS, **params, "random_state": seed}
+        cls: Any = HistGradientBoostingRegressor
+    elif engine == "xgboost":
+        from xgboost import XGBRegressor
+
+        params = {"tree_method": "hist", "max_bin": 5, **params}
+        params.update(random_state=seed, n_jobs=n_threads)
+        cls = XGBRegressor
+    elif engine == "lightgbm":
+        from lightgbm import LGBMRegressor
+
+        params = {"max_bin": 5, "verbose": -1, **params}
+        params.update(random_state=seed, n_jobs=n_threads)
+        cls = LGBMRegressor
+    elif engine == "linear":
+        from sklearn.linear_model import Ridge
+
+        params = {"alpha": 1.0, **params}
+        cls = Ridge
+    else:
+        from sklearn.neural_network import MLPRegressor
+
+        params = {"hidden_layer_sizes": (64,), "early_stopping": True, **params}
+        params["random_state"] = seed
+        cls = MLPRegressor
+
+    if engine not in ("xgboost", "lightgbm"):
+        valid = cls().get_params()
+        unknown = [k for k in params if k not in valid]
+        if unknown:
+            raise ValueError(
+                f"Unknown hyperparameters for {engine}: {', '.join(unknown)}"
+            )
+    return cls(**params), params
+
+
+def _importable(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
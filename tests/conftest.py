@@ -0,0 +1,32 @@
+"""Shared fixtures for MedallionBench tests."""
+
+import pytest
+from inspect_ai.util import store
+
+from medallion_bench.store import DATA_DIR_ENV
+from medallion_bench.synthetic import generate_numerai_data
+
+SMALL_SHAPE = {
+    "n_features": 24,
+    "training_rows": 1_200,
+    "validation_rows": 400,
+    "live_rows": 100,
+    "training_eras": 12,
+    "validation_eras": 4,
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_sample_store():
+    """Keep sample-store values set by one test out of the next."""
+    yield
+    for key in list(store().keys()):
+        store().delete(key)
+
+
+@pytest.fixture
+def numerai_data(tmp_path, monkeypatch):
+    """Generate a small seed-42 dataset and point the tools at it."""
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    generate_numerai_data(seed=42, data_dir=tmp_path, **SMALL_SHAPE)
+    return tmp_path
@@ -0,0 +1,102 @@
+"""Tests for the process-wide dataset cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from medallion_bench import cache as cache_module
+from medallion_bench.cache import DatasetCache
+from medallion_bench.store import open_store
+
+
+@pytest.fixture
+def training(numerai_data):
+    """Training split of the small test dataset."""
+    return open_store("training", data_dir=numerai_data)
+
+
+def test_hits_and_misses(training):
+    """Test that repeat loads share one entry."""
+    cache = DatasetCache()
+    with cache.acquire(training, training.era_rows(1, 3)) as first:
+        pass
+    with cache.acquire(training, training.era_rows(1, 3)) as second:
+        assert second.X is first.X
+    assert not first.hit and second.hit
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_views_are_read_only(training):
+    """Test that cached arrays cannot be mutated by a sample."""
+    with DatasetCache().acquire(training, training.era_rows(1, 2)) as view:
+        assert view.X.dtype == np.uint8
+        with pytest.raises(ValueError):
+            view.X[0, 0] = 1
+
+
+def test_lru_eviction_under_budget(training):
+    """Test that the least recently used entry is evicted first."""
+    one_era = training.era_rows(1, 1)
+    era_bytes = DatasetCache().acquire(training, one_era).nbytes
+    cache = DatasetCache(max_bytes=2 * era_bytes)
+    for era in [1, 2, 1, 3]:
+        cache.acquire(training, training.era_rows(era, era)).release()
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.acquire(training, training.era_rows(1, 1)).release()
+    assert cache.hits == 2
+
+
+def test_referenced_entries_are_pinned(training):
+    """Test that entries with live views survive eviction."""
+    cache = DatasetCache(max_bytes=0)
+    view = cache.acquire(training, training.era_rows(1, 1))
+    assert len(cache) == 1
+    view.release()
+    assert len(cache) == 0
+
+
+def test_derived_arrays_share_the_entry(training):
+    """Test that derived arrays are computed once and counted in the budget."""
+    cache = DatasetCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.ones(1000, dtype=np.float32)
+
+    with cache.acquire(training, training.era_rows(1, 2)) as view:
+        before = cache.nbytes
+        assert "ones" not in view
+        assert view.derived("ones", compute).sum() == 1000
+    with cache.acquire(training, training.era_rows(1, 2)) as view:
+        assert "ones" in view
+        view.derived("ones", compute)
+    assert len(calls) == 1
+    assert cache.nbytes == before + 4000
+
+
+def test_misses_load_outside_the_lock(training, monkeypatch):
+    """Test that a slow miss blocks neither other hits nor repeat loads."""
+    cache = DatasetCache()
+    cache.acquire(training, training.era_rows(1, 1)).release()
+    started, proceed = threading.Event(), threading.Event()
+    load_arrays = cache_module._load_arrays
+
+    def slow_load(*args):
+        started.set()
+        proceed.wait(5)
+        return load_arrays(*args)
+
+    monkeypatch.setattr(cache_module, "_load_arrays", slow_load)
+    with ThreadPoolExecutor(2) as pool:
+        first = pool.submit(cache.acquire, training, training.era_rows(2, 2))
+        assert started.wait(5)
+        second = pool.submit(cache.acquire, training, training.era_rows(2, 2))
+        # The other slice is served while era 2 is still loading.
+        cache.acquire(training, training.era_rows(1, 1)).release()
+        proceed.set()
+        assert second.result().X is first.result().X
+    assert (cache.hits, cache.misses) == (2, 2)
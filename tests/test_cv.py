@@ -0,0 +1,58 @@
+"""Tests for era-wise purged cross-validation."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.cv import cv_summary, era_folds, run_cv_fold
+
+
+def test_era_folds_purge_and_embargo():
+    """Test contiguous test blocks and the windows removed around them."""
+    folds = era_folds(12, 3, purge=2, embargo=1)
+    assert [test.tolist() for _, test in folds] == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9, 10, 11],
+    ]
+    assert folds[0][0].tolist() == [5, 6, 7, 8, 9, 10, 11]
+    assert folds[1][0].tolist() == [0, 1, 9, 10, 11]
+    assert folds[2][0].tolist() == [0, 1, 2, 3, 4, 5]
+
+    with pytest.raises(ValueError):
+        era_folds(12, 1)
+    with pytest.raises(ValueError):
+        era_folds(4, 2, purge=4)
+
+
+@pytest.mark.parametrize("model_type", ["linear", "hist_gbdt"])
+def test_run_cv_fold(numerai_data, model_type):
+    """Test that a fold scores exactly its test eras."""
+    train, test = era_folds(12, 3, purge=1, embargo=1)[1]
+    fold = run_cv_fold({
+        "model_type": model_type,
+        "features": ["feature_intelligence1", "feature_charisma1"],
+        "hyperparameters": {"max_iter": 5} if model_type == "hist_gbdt" else {},
+        "seed": 1,
+        "data_seed": 42,
+        "data_dir": str(numerai_data),
+        "n_threads": 1,
+        "train_eras": train,
+        "test_eras": test,
+    })
+    assert fold["test_eras"] == [5, 6, 7, 8]
+    assert len(fold["per_era"]) == 4
+    assert fold["train_eras"] == 6
+    assert fold["train_rows"] == 600
+
+
+def test_cv_summary_pools_folds():
+    """Test per-fold arrays and the pooled out-of-fold summary."""
+    summary = cv_summary([
+        {"per_era": [0.01, 0.03]},
+        {"per_era": [0.02, -0.01, 0.05]},
+    ])
+    assert [len(fold) for fold in summary["per_fold"]] == [2, 3]
+    assert summary["mean"] == pytest.approx(0.02)
+    assert summary["fold_summaries"][0]["mean"] == pytest.approx(0.02)
+    assert summary["max_drawdown"] == pytest.approx(0.01)
+    assert isinstance(summary["per_fold"][0], np.ndarray)
@@ -3,7 +3,7 @@
 import pytest
 from inspect_ai.dataset import Dataset
 
-from medallion_bench.dataset import numerai_dataset, _get_data_config
+from medallion_bench.dataset import allowed_era_range, numerai_dataset, _get_data_config
 
 
 def test_numerai_dataset_creation():
@@ -75,4 +75,14 @@ def test_sample_metadata():
         assert sample.metadata["round"] == i + 1
         assert sample.metadata["phase"] == 2
         assert sample.metadata["seed"] == 123
-        assert "data_config" in sample.metadata
\ No newline at end of file
+        assert "data_config" in sample.metadata
+
+
+def test_allowed_era_range_follows_phase():
+    """Test that phase-gated configs map onto era windows."""
+    eras = list(range(1, 121))
+    phase_1 = _get_data_config(round_num=5, phase=1)
+    phase_2 = _get_data_config(round_num=15, phase=2)
+    assert allowed_era_range(phase_1, "training", eras) == (1, 60)
+    assert allowed_era_range(phase_2, "training", eras) == (1, 120)
+    assert allowed_era_range(phase_1, "tournament", [141]) is None
@@ -0,0 +1,87 @@
+"""Tests for vectorized prediction blending."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.ensemble import (
+    blend,
+    candidate_pearson,
+    era_moments,
+    era_rank_matrix,
+    search_weights,
+    stack_predictions,
+)
+from medallion_bench.evaluation import (
+    era_offsets,
+    era_rank,
+    numerai_corr,
+    per_era_pearson,
+)
+
+
+def _members(n_members=3, n_eras=6, era_size=200, seed=0):
+    rng = np.random.default_rng(seed)
+    eras = np.repeat(np.arange(1, n_eras + 1), era_size)
+    target = rng.integers(0, 5, len(eras)).astype(np.float32) / 4
+    signal = target - 0.5
+    members = [
+        (signal * strength + rng.standard_normal(len(eras)) * scale).astype(np.float32)
+        for strength, scale in zip([1.0, 0.5, 0.0], [1.0, 10.0, 0.01])
+    ][:n_members]
+    return stack_predictions(members), target, era_offsets(eras)
+
+
+def test_rank_matrix_matches_per_member_ranks():
+    """Test that one argsort ranks every member within every era."""
+    predictions, _, offsets = _members()
+    predictions[0, :50] = 0.25  # Ties
+    ranks = era_rank_matrix(predictions, offsets)
+    assert ranks.shape == predictions.shape and ranks.dtype == np.float32
+    for member, member_ranks in zip(predictions, ranks):
+        np.testing.assert_allclose(member_ranks, era_rank(member, offsets), atol=1e-6)
+
+
+def test_blend_weights():
+    """Test that one-hot weights reproduce a member and invalid weights fail."""
+    predictions, _, offsets = _members()
+    np.testing.assert_allclose(
+        blend(predictions, [0, 2, 0], offsets, "raw"), predictions[1], rtol=1e-6
+    )
+    ranked = blend(predictions, [1, 1, 1], offsets, "rank")
+    expected = era_rank_matrix(predictions, offsets).mean(axis=0)
+    np.testing.assert_allclose(ranked, expected, atol=1e-6)
+    with pytest.raises(ValueError):
+        blend(predictions, [1, -1, 1], offsets)
+    with pytest.raises(ValueError):
+        blend(predictions, [1, 1], offsets)
+    with pytest.raises(ValueError):
+        blend(predictions, [1, 1, 1], offsets, "median")
+
+
+def test_candidate_pearson_matches_direct_blends():
+    """Test closed-form per-era correlation of many weightings at once."""
+    predictions, target, offsets = _members()
+    weights = np.random.default_rng(1).dirichlet(np.ones(3), size=5)
+    scores = candidate_pearson(era_moments(predictions, target, offsets), weights)
+    for w, per_era in zip(weights, scores):
+        expected = per_era_pearson(w @ predictions, target, offsets)
+        np.testing.assert_allclose(per_era, expected, atol=1e-6)
+
+
+def test_search_weights_beats_members():
+    """Test that the searched blend scores at least as well as the best member."""
+    predictions, target, offsets = _members()
+    result = search_weights(predictions, target, offsets, n_candidates=64)
+    assert result["weights"].shape == (3,)
+    assert result["weights"].sum() == pytest.approx(1.0)
+    best_member = max(
+        numerai_corr(member, target, offsets).mean() for member in predictions
+    )
+    assert result["per_era"].mean() >= best_member - 1e-9
+    np.testing.assert_allclose(
+        result["per_era"],
+        numerai_corr(blend(predictions, result["weights"], offsets), target, offsets),
+        atol=1e-5,
+    )
+    with pytest.raises(ValueError):
+        search_weights(predictions, target, offsets, objective="sortino")
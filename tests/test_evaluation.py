@@ -0,0 +1,133 @@
+"""Tests for vectorized per-era evaluation."""
+
+import numpy as np
+import pytest
+from scipy.special import ndtri
+from scipy.stats import pearsonr, rankdata
+
+from medallion_bench.evaluation import (
+    era_basis,
+    era_offsets,
+    era_rank,
+    evaluate_predictions,
+    exposure_summary,
+    feature_exposure,
+    max_drawdown,
+    neutralize,
+    numerai_corr,
+)
+
+
+def _reference_corr(predictions, target):
+    """Numerai correlation of one era, computed the direct way."""
+    gauss = ndtri((rankdata(predictions) - 0.5) / len(predictions))
+    centered = target - 0.5
+    return pearsonr(
+        np.sign(gauss) * np.abs(gauss) ** 1.5,
+        np.sign(centered) * np.abs(centered) ** 1.5,
+    )[0]
+
+
+def test_era_offsets():
+    """Test era start offsets of era-sorted labels."""
+    offsets = era_offsets(np.array([3, 3, 4, 7, 7, 7]))
+    assert offsets.tolist() == [0, 2, 3, 6]
+
+
+def test_era_rank_matches_groupwise_rankdata():
+    """Test per-era ranks, including ties, against scipy."""
+    rng = np.random.default_rng(0)
+    eras = np.repeat([1, 2, 3], [50, 80, 30])
+    values = np.round(rng.normal(size=len(eras)), 1)
+    offsets = era_offsets(eras)
+    expected = np.concatenate([
+        (rankdata(values[a:b]) - 0.5) / (b - a)
+        for a, b in zip(offsets[:-1], offsets[1:])
+    ])
+    np.testing.assert_allclose(era_rank(values, offsets), expected)
+
+
+def test_era_rank_is_exact_with_outliers():
+    """Test that an extreme value does not merge close values into ties."""
+    rng = np.random.default_rng(2)
+    eras = np.repeat([1, 2], 500)
+    values = rng.normal(scale=1e-6, size=len(eras))
+    values[0] = 1e9
+    offsets = era_offsets(eras)
+    expected = np.concatenate([
+        (rankdata(values[a:b]) - 0.5) / (b - a)
+        for a, b in zip(offsets[:-1], offsets[1:])
+    ])
+    np.testing.assert_array_equal(era_rank(values, offsets), expected)
+
+
+def test_numerai_corr_matches_reference():
+    """Test per-era correlation against a per-era loop."""
+    rng = np.random.default_rng(1)
+    eras = np.repeat(np.arange(1, 6), 200)
+    target = rng.choice([0.0, 0.25, 0.5, 0.75, 1.0], size=len(eras))
+    predictions = target + rng.normal(scale=1.0, size=len(eras))
+    offsets = era_offsets(eras)
+    expected = [
+        _reference_corr(predictions[a:b], target[a:b])
+        for a, b in zip(offsets[:-1], offsets[1:])
+    ]
+    np.testing.assert_allclose(numerai_corr(predictions, target, offsets), expected)
+
+
+def test_max_drawdown():
+    """Test drawdown of the cumulative per-era score."""
+    assert max_drawdown(np.array([0.1, -0.05, -0.1, 0.2])) == pytest.approx(0.15)
+    assert max_drawdown(np.array([0.01, 0.02])) == 0.0
+    assert max_drawdown(np.array([-0.02])) == pytest.approx(0.02)
+
+
+def test_evaluate_predictions_summary():
+    """Test the per-era series and summary statistics."""
+    rng = np.random.default_rng(2)
+    eras = np.repeat([10, 11, 12, 13], 100)
+    target = rng.random(len(eras)).astype(np.float32)
+    result = evaluate_predictions(target + rng.normal(size=len(eras)), target, eras)
+    assert result["eras"].tolist() == [10, 11, 12, 13]
+    assert len(result["per_era"]) == 4
+    assert result["mean"] > 0
+    assert result["sharpe"] == pytest.approx(result["mean"] / result["std"])
+    perfect = evaluate_predictions(target, target, eras)
+    assert perfect["mean"] > 0.9
+
+
+@pytest.fixture
+def exposed():
+    """Feature codes with a duplicate column and predictions built on them."""
+    rng = np.random.default_rng(3)
+    eras = np.repeat([1, 2, 3], 300)
+    codes = rng.integers(0, 5, size=(len(eras), 8)).astype(np.uint8)
+    codes[:, 5] = codes[:, 4]
+    codes[:300, 6] = 2
+    predictions = codes[:, :3].sum(axis=1) + rng.normal(size=len(eras))
+    return predictions, codes, era_offsets(eras)
+
+
+def test_feature_exposure_matches_corrcoef(exposed):
+    """Test per-era exposures against np.corrcoef."""
+    predictions, codes, offsets = exposed
+    exposures = feature_exposure(predictions, codes, offsets)
+    assert exposures.shape == (3, 8)
+    expected = np.corrcoef(codes[300:600].T, predictions[300:600])[-1, :-1]
+    np.testing.assert_allclose(exposures[1], expected, atol=1e-5)
+    assert exposures[0, 6] == 0.0
+    assert exposure_summary(exposures)["max_exposure"] > 0.3
+
+
+def test_neutralize_removes_exposure(exposed):
+    """Test full and partial neutralization with one cached basis."""
+    predictions, codes, offsets = exposed
+    basis = era_basis(codes, offsets)
+    full = neutralize(predictions, basis, offsets, proportion=1.0)
+    assert np.abs(feature_exposure(full, codes, offsets)).max() < 1e-4
+    assert np.allclose(full[:300].std(), 1.0)
+
+    before = exposure_summary(feature_exposure(predictions, codes, offsets))
+    half_neutral = neutralize(predictions, basis, offsets, 0.5)
+    half = exposure_summary(feature_exposure(half_neutral, codes, offsets))
+    assert 1e-3 < half["max_exposure"] < before["max_exposure"]
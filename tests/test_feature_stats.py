@@ -0,0 +1,41 @@
+"""Tests for precomputed feature statistics."""
+
+import numpy as np
+
+from medallion_bench.feature_stats import (
+    STATS_FILE,
+    compute_feature_stats,
+    feature_group,
+    load_feature_stats,
+)
+from medallion_bench.store import dequantize, open_store
+
+
+def test_feature_group():
+    """Test feature group parsing from names."""
+    assert feature_group("feature_intelligence12") == "intelligence"
+    assert feature_group("era") == "other"
+
+
+def test_stats_match_direct_computation(numerai_data):
+    """Test per-era statistics against a direct per-era computation."""
+    era_store = open_store("training", data_dir=numerai_data)
+    stats = compute_feature_stats(era_store, eras_per_batch=5)
+    assert stats["mean"].shape == (12, era_store.n_features)
+
+    rows = era_store.era_rows(7, 7)
+    X = dequantize(era_store.features(rows=rows)).astype(np.float64)
+    y = era_store.target(rows).astype(np.float64)
+    np.testing.assert_allclose(stats["mean"][6], X.mean(axis=0), atol=1e-5)
+    np.testing.assert_allclose(stats["std"][6], X.std(axis=0), atol=1e-4)
+    expected = [np.corrcoef(X[:, j], y)[0, 1] for j in range(X.shape[1])]
+    np.testing.assert_allclose(stats["target_corr"][6], expected, atol=1e-4)
+
+
+def test_stats_cached_on_disk(numerai_data):
+    """Test that statistics are persisted next to the data."""
+    era_store = open_store("training", data_dir=numerai_data)
+    first = load_feature_stats(era_store)
+    assert (era_store.path / STATS_FILE).exists()
+    second = load_feature_stats(era_store)
+    np.testing.assert_array_equal(first["target_corr"], second["target_corr"])
@@ -0,0 +1,66 @@
+"""Tests for cached per-era Gram matrices."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.gram import (
+    GRAM_DIR,
+    era_positions,
+    fit_gram_ridge,
+    gram_eligible,
+    load_era_grams,
+)
+from medallion_bench.store import dequantize, open_store
+from medallion_bench.training import fit_model
+
+
+@pytest.fixture
+def training(numerai_data):
+    """Training split of the small test dataset."""
+    return open_store("training", data_dir=numerai_data)
+
+
+def test_grams_cached_on_disk(training):
+    """Test that Gram matrices are computed once and memory-mapped."""
+    grams = load_era_grams(training)
+    assert (training.path / GRAM_DIR / "xx.npy").exists()
+    assert grams.arrays["xx"].shape == (12, 24, 24)
+    assert isinstance(load_era_grams(training).arrays["xx"], np.memmap)
+
+    rows = training.era_rows(5, 5)
+    codes = np.asarray(training.features(rows=rows)).astype(np.int64)
+    np.testing.assert_array_equal(grams.arrays["xx"][4], codes.T @ codes)
+
+
+def test_ridge_matches_row_fit(training):
+    """Test that the Gram ridge equals a ridge fitted on the rows."""
+    columns = np.array([0, 3, 7, 11])
+    names = [training.feature_names[i] for i in columns]
+    rows = training.era_rows(2, 9)
+    X = np.asarray(training.features(names, rows))
+    y = np.asarray(training.target(rows))
+
+    expected = fit_model("linear", X, y, {"alpha": 5.0})
+    model, per_era = fit_gram_ridge(
+        load_era_grams(training), columns, era_positions(training, rows), {"alpha": 5.0}
+    )
+    np.testing.assert_allclose(
+        model.estimator.coef_, expected.estimator.coef_, atol=1e-6
+    )
+    np.testing.assert_allclose(model.predict(X), expected.predict(X), atol=1e-5)
+
+    predictions = dequantize(X) @ model.estimator.coef_
+    first = training.era_rows(2, 2)
+    assert per_era[0] == pytest.approx(
+        np.corrcoef(
+            predictions[: first.stop - first.start], y[: first.stop - first.start]
+        )[0, 1]
+    )
+
+
+def test_gram_eligible():
+    """Test which training requests take the Gram path."""
+    assert gram_eligible("linear", {})
+    assert gram_eligible("linear", {"alpha": 3.0})
+    assert not gram_eligible("linear", {"fit_intercept": False})
+    assert not gram_eligible("hist_gbdt", {})
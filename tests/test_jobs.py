@@ -0,0 +1,52 @@
+"""Tests for process-pool training jobs."""
+
+import pytest
+
+from medallion_bench.jobs import TrainingPool, run_training_job
+from medallion_bench.registry import model_registry
+
+
+@pytest.fixture
+def request_for(numerai_data):
+    """Build a training request against the small test dataset."""
+    def build(model_id="hist_gbdt-test", **overrides):
+        request = {
+            "model_id": model_id,
+            "model_type": "hist_gbdt",
+            "features": ["feature_intelligence1", "feature_charisma1"],
+            "hyperparameters": {"max_iter": 5},
+            "seed": 1,
+            "data_seed": 42,
+            "data_dir": str(numerai_data),
+            "rows": (0, 600),
+            "n_threads": 1,
+        }
+        request.update(overrides)
+        return request
+    return build
+
+
+def test_run_training_job_registers_model(request_for, numerai_data):
+    """Test that a job fits and registers its model."""
+    meta = run_training_job(request_for())
+    assert meta["eras"] == [1, 6]
+    assert "hist_gbdt-test" in model_registry(42, numerai_data)
+
+
+@pytest.mark.slow
+def test_pool_runs_and_dedups_jobs(request_for):
+    """Test submission, polling and deduplication through the pool."""
+    pool = TrainingPool(max_workers=1)
+    try:
+        first = pool.submit(request_for())
+        assert pool.submit(request_for()) is first
+        assert first.result(timeout=120)["eras"] == [1, 6]
+        assert pool.status("hist_gbdt-test") == "done"
+
+        failed = pool.submit(request_for("bad", hyperparameters={"bogus": 1}))
+        with pytest.raises(ValueError):
+            failed.result(timeout=120)
+        assert pool.status("bad") == "failed"
+        assert pool.status("missing") == "unknown"
+    finally:
+        pool.shutdown()
@@ -0,0 +1,101 @@
+"""Tests for the bankroll ledger."""
+
+import json
+
+import numpy as np
+import pytest
+
+from medallion_bench.ledger import BankrollLedger
+
+
+def test_online_metrics_match_history():
+    """Test running metrics against a recomputation from the full history."""
+    rng = np.random.default_rng(0)
+    stakes = rng.uniform(10, 100, 40)
+    payouts = stakes * rng.normal(0.005, 0.03, 40)
+    ledger = BankrollLedger(capacity=4)
+    for i, (stake, payout) in enumerate(zip(stakes, payouts)):
+        metrics = ledger.record(i + 1, payout, stake)
+    assert len(ledger) == 40 and ledger.capacity == 64
+
+    returns = payouts / stakes
+    bankroll = stakes[0] + np.cumsum(payouts)
+    peak = np.maximum.accumulate(np.append(stakes[0], bankroll))[1:]
+    downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+    assert metrics["bankroll"] == pytest.approx(bankroll[-1])
+    assert metrics["total_payout"] == pytest.approx(payouts.sum())
+    assert metrics["mean_return"] == pytest.approx(returns.mean())
+    assert metrics["std_return"] == pytest.approx(returns.std(ddof=1))
+    assert metrics["sharpe"] == pytest.approx(returns.mean() / returns.std(ddof=1))
+    assert metrics["sortino"] == pytest.approx(returns.mean() / downside)
+    assert metrics["max_drawdown"] == pytest.approx(np.max(1 - bankroll / peak))
+    assert metrics["hit_rate"] == pytest.approx(np.mean(payouts > 0))
+    np.testing.assert_allclose(ledger.history()["bankroll"], bankroll)
+
+
+def test_metrics_as_of_round():
+    """Test metrics at earlier rounds and validation of new rounds."""
+    ledger = BankrollLedger(initial_bankroll=100.0)
+    assert ledger.metrics() == {}
+    ledger.record(3, 5.0, 50.0)
+    ledger.record(7, -10.0, 50.0)
+    ledger.record(9, 2.0, 50.0)
+    assert ledger.metrics(2) == {}
+    as_of = ledger.metrics(8)
+    assert as_of["round"] == 7 and as_of["rounds"] == 2
+    assert as_of["bankroll"] == pytest.approx(95.0)
+    assert as_of["drawdown"] == pytest.approx(10 / 105)
+    assert ledger.metrics()["bankroll"] == pytest.approx(97.0)
+    with pytest.raises(ValueError):
+        ledger.record(9, 1.0, 50.0)
+    with pytest.raises(ValueError):
+        ledger.record(10, 1.0, 0.0)
+
+
+def test_state_round_trips_through_json():
+    """Test that a ledger rebuilt from its JSON state continues unchanged."""
+    ledger = BankrollLedger()
+    assert BankrollLedger.from_state(ledger.state()).metrics() == {}
+    for i, payout in enumerate([4.0, -6.0, 1.5]):
+        ledger.record(i + 1, payout, 40.0)
+    rebuilt = BankrollLedger.from_state(json.loads(json.dumps(ledger.state())))
+    assert rebuilt.metrics() == ledger.metrics()
+    assert rebuilt.record(4, 2.0, 40.0) == ledger.record(4, 2.0, 40.0)
+    np.testing.assert_array_equal(rebuilt.history(), ledger.history())
+
+
+def test_rolling_and_regime_statistics():
+    """Test rolling windows and regime groups against direct computation."""
+    rng = np.random.default_rng(1)
+    payouts = rng.normal(0.5, 2.0, 30)
+    ledger = BankrollLedger()
+    for i, payout in enumerate(payouts):
+        ledger.record(i + 1, payout, 50.0)
+    returns = payouts / 50.0
+
+    rolling = ledger.rolling([3, 10, 40])
+    assert rolling["sharpe"].shape == (3, 30)
+    assert np.isnan(rolling["sharpe"][0, :2]).all()
+    assert np.isnan(rolling["sharpe"][2]).all()
+    for k, window in enumerate([3, 10]):
+        for end in range(window, 31):
+            chunk = returns[end - window:end]
+            assert rolling["sharpe"][k, end - 1] == pytest.approx(
+                chunk.mean() / chunk.std(ddof=1)
+            )
+    assert ledger.rolling([3], round_num=5)["mean"].shape == (1, 5)
+    with pytest.raises(ValueError):
+        ledger.rolling([1])
+
+    regimes = np.arange(30) % 3
+    regimes[0] = -1
+    breakdown = ledger.regime_breakdown(regimes, 3)
+    np.testing.assert_array_equal(breakdown["rounds"], [9, 10, 10])
+    for code in range(3):
+        chunk = returns[regimes == code]
+        assert breakdown["mean_return"][code] == pytest.approx(chunk.mean())
+        sharpe = chunk.mean() / chunk.std(ddof=1)
+        assert breakdown["sharpe"][code] == pytest.approx(sharpe)
+        total = payouts[regimes == code].sum()
+        assert breakdown["total_payout"][code] == pytest.approx(total)
+    assert ledger.regime_breakdown(regimes, 3, round_num=4)["rounds"].sum() == 3
@@ -0,0 +1,65 @@
+"""Tests for the synthetic meta-model and MMC."""
+
+import numpy as np
+import pytest
+from scipy.special import ndtri
+
+from medallion_bench.evaluation import era_offsets, era_rank
+from medallion_bench.meta_model import (
+    META_MODEL_FILE,
+    contribution_scores,
+    era_unit_vectors,
+    meta_model_basis,
+    meta_model_predictions,
+)
+from medallion_bench.store import EraStore, dataset_path
+from medallion_bench.synthetic import generate_meta_model
+
+
+def test_meta_model_is_stored_once(numerai_data):
+    """Test that meta-model predictions are reproducible and written once."""
+    meta_model = meta_model_predictions("validation", seed=42, data_dir=numerai_data)
+    path = dataset_path("validation", seed=42, data_dir=numerai_data) / META_MODEL_FILE
+    assert path.exists() and meta_model.shape == (400,)
+    assert 0 < meta_model.min() and meta_model.max() < 1
+
+    mtime = path.stat().st_mtime_ns
+    again = meta_model_predictions("validation", seed=42, data_dir=numerai_data)
+    assert path.stat().st_mtime_ns == mtime
+    expected = generate_meta_model("validation", 42, numerai_data)
+    np.testing.assert_array_equal(again, expected)
+
+
+def test_contribution_matches_per_era_orthogonalization(numerai_data):
+    """Test batched MMC against Numerai's per-era definition."""
+    era_store = EraStore(dataset_path("validation", seed=42, data_dir=numerai_data))
+    target = era_store.target()
+    offsets = era_offsets(era_store.eras())
+    meta_model = meta_model_predictions("validation", seed=42, data_dir=numerai_data)
+    basis = meta_model_basis("validation", seed=42, data_dir=numerai_data)
+    np.testing.assert_allclose(basis, era_unit_vectors(meta_model, offsets))
+
+    rng = np.random.default_rng(0)
+    candidates = np.vstack([
+        meta_model,
+        meta_model + rng.normal(0, 0.3, 400),
+        target + rng.normal(0, 0.5, 400),
+    ]).astype(np.float32)
+    scores = contribution_scores(candidates, target, basis, offsets)
+    assert scores["mmc"].shape == (3, 4)
+    np.testing.assert_allclose(scores["mmc"][0], 0.0, atol=1e-6)
+    np.testing.assert_allclose(scores["meta_corr"][0], 1.0, atol=1e-6)
+    assert scores["mmc"][2].mean() > 0
+
+    for k, predictions in enumerate(candidates):
+        expected = []
+        for start, stop in zip(offsets[:-1], offsets[1:]):
+            era = np.array([0, stop - start])
+            p = ndtri(era_rank(predictions[start:stop], era))
+            m = ndtri(era_rank(meta_model[start:stop], era))
+            neutral = p - m * (m @ p) / (m @ m)
+            y = target[start:stop] - target[start:stop].mean()
+            expected.append(y @ neutral / len(y))
+        np.testing.assert_allclose(scores["mmc"][k], expected, atol=1e-6)
+        single = contribution_scores(predictions, target, basis, offsets)
+        assert single["mmc"] == pytest.approx(scores["mmc"][k])
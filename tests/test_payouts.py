@@ -0,0 +1,106 @@
+"""Tests for the historical payout simulator."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.payouts import (
+    bootstrap_payouts,
+    payout_summary,
+    round_returns,
+    simulate_payouts,
+)
+
+
+def test_round_returns_clip_at_caps():
+    """Test the payout score, its burn and payout caps and stake exposure."""
+    corr = np.array([0.02, 0.5, -0.5, 0.0])
+    mmc = np.array([0.01, 0.0, 0.0, -0.01])
+    np.testing.assert_allclose(
+        round_returns(corr, mmc), [0.5 * 0.02 + 2 * 0.01, 0.05, -0.05, -0.02]
+    )
+    np.testing.assert_allclose(
+        round_returns(corr, confidence=0.5), [0.005, 0.025, -0.025, 0.0]
+    )
+
+
+def test_simulate_payouts_compounds_like_a_loop():
+    """Test the vectorized stake path against a round-by-round replay."""
+    rng = np.random.default_rng(0)
+    corr = rng.normal(0.01, 0.05, 50)
+    mmc = rng.normal(0.0, 0.01, 50)
+    simulation = simulate_payouts(corr, mmc, 100.0, confidence=0.8)
+
+    stake, payouts = 100.0, []
+    for c, m in zip(corr, mmc):
+        payout = stake * 0.8 * min(max(0.5 * c + 2 * m, -0.05), 0.05)
+        payouts.append(payout)
+        stake += payout
+    np.testing.assert_allclose(simulation["payouts"], payouts)
+    assert simulation["stakes"][-1] == pytest.approx(stake)
+    assert simulation["burn_capped"].sum() == np.sum(0.5 * corr + 2 * mmc <= -0.05)
+
+
+def test_simulate_payouts_broadcasts_settings():
+    """Test that a grid of stakes and exposures is simulated in one pass."""
+    corr = np.random.default_rng(1).normal(0.01, 0.05, 20)
+    stakes = np.array([[10.0], [100.0]])
+    confidence = np.array([[0.25], [1.0]])
+    grid = simulate_payouts(corr, None, stakes, confidence)
+    assert grid["payouts"].shape == (2, 20)
+    single = simulate_payouts(corr, None, 100.0, 1.0)
+    np.testing.assert_allclose(grid["payouts"][1], single["payouts"])
+
+
+def test_payout_summary():
+    """Test totals, hit rate and drawdown of a known series."""
+    simulation = simulate_payouts(np.array([0.1, -0.1, -0.1, 0.1]), None, 100.0)
+    summary = payout_summary(simulation, 100.0)
+    assert summary["final_stake"] == pytest.approx(100 * 1.05 * 0.95 * 0.95 * 1.05)
+    assert summary["total_payout"] == pytest.approx(summary["final_stake"] - 100)
+    assert summary["hit_rate"] == 0.5
+    assert summary["max_drawdown"] == pytest.approx(1 - 0.95 * 0.95)
+    assert summary["burn_capped"] == 2 and summary["payout_capped"] == 2
+
+
+def test_bootstrap_payouts_policies():
+    """Test ruin, loss and growth of bootstrapped paths across policies."""
+    corr = np.full(10, -0.2)  # Every round hits the burn cap
+    result = bootstrap_payouts(corr, None, 100.0, [0.1, 1.0], rounds=20, n_paths=1_000)
+    assert result["final_stake"].shape == (2, 5)
+    np.testing.assert_allclose(
+        result["final_stake"][:, 2], [100 * 0.995 ** 20, 100 * 0.95 ** 20]
+    )
+    np.testing.assert_allclose(result["risk_of_ruin"], [0.0, 1.0])
+    np.testing.assert_allclose(result["loss_probability"], [1.0, 1.0])
+    np.testing.assert_allclose(result["max_drawdown"][1], 1 - 0.95 ** 20)
+    assert result["growth_rate"][1] == pytest.approx(np.log(0.95))
+
+    single = bootstrap_payouts(corr, None, 100.0, 0.1, rounds=20, n_paths=1_000)
+    assert single["risk_of_ruin"] == 0.0 and single["final_stake"].shape == (5,)
+
+
+def test_bootstrap_blocks_resample_history():
+    """Test that whole-history blocks replay rotations of the historical path."""
+    rng = np.random.default_rng(2)
+    corr = rng.normal(0.01, 0.05, 12)
+    mmc = rng.normal(0.0, 0.01, 12)
+    history = simulate_payouts(corr, mmc, 50.0, 0.5)
+    result = bootstrap_payouts(
+        corr, mmc, 50.0, 0.5, rounds=12, n_paths=500, block_rounds=12, chunk_paths=64
+    )
+    np.testing.assert_allclose(result["final_stake"], history["stakes"][-1])
+    np.testing.assert_allclose(result["mean_final_stake"], history["stakes"][-1])
+
+    again = bootstrap_payouts(corr, mmc, 50.0, 0.5, n_paths=2_000, seed=3)
+    assert again["final_stake"] == pytest.approx(
+        bootstrap_payouts(corr, mmc, 50.0, 0.5, n_paths=2_000, seed=3)["final_stake"]
+    )
+    invalid = (
+        {"n_paths": 0},
+        {"ruin_level": 1.0},
+        {"confidence": [1.5]},
+        {"rounds": 0},
+    )
+    for bad in invalid:
+        with pytest.raises(ValueError):
+            bootstrap_payouts(corr, mmc, 50.0, **bad)
@@ -0,0 +1,94 @@
+"""Tests for the persistent prediction store."""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from medallion_bench.predictions import PredictionStore, model_predictions
+from medallion_bench.registry import model_id_for, model_registry
+from medallion_bench.store import EraStore, dataset_path, seed_path
+from medallion_bench.training import fit_model
+
+
+def test_put_and_get_memory_map(tmp_path):
+    """Test that stored predictions come back as read-only float32 memmaps."""
+    store = PredictionStore(tmp_path)
+    assert store.get("linear-abc", "validation") is None
+
+    stored = store.put("linear-abc", "validation", np.arange(10, dtype=np.float64))
+    loaded = store.get("linear-abc", "validation")
+    assert isinstance(loaded, np.memmap)
+    assert loaded.dtype == np.float32
+    assert not loaded.flags.writeable
+    np.testing.assert_array_equal(loaded, stored)
+    assert ("linear-abc", "validation") in store
+    assert store.nbytes == os.path.getsize(store.path("linear-abc", "validation"))
+
+
+def test_evicts_least_recently_read(tmp_path):
+    """Test that the quota evicts the least recently read files first."""
+    one_file = 4 * 100 + 128  # float32 payload plus .npy header
+    store = PredictionStore(tmp_path, max_bytes=2 * one_file)
+    for i, model_id in enumerate(["a", "b"]):
+        store.put(model_id, "validation", np.zeros(100))
+        os.utime(store.path(model_id, "validation"), (i, i))
+    store.get("a", "validation")  # Now more recent than "b"
+
+    store.put("c", "validation", np.zeros(100))
+    assert [model_id for model_id, _, _ in store.entries()] == ["a", "c"]
+    assert not (tmp_path / "b").exists()
+
+    # A file larger than the quota is still kept until the next write.
+    store.put("d", "training", np.zeros(1000))
+    assert [model_id for model_id, _, _ in store.entries()] == ["d"]
+
+
+def test_model_predictions_computed_once(numerai_data):
+    """Test that a registered model is run once per split and then read back."""
+    era_store = EraStore(dataset_path("training", seed=42, data_dir=numerai_data))
+    features = era_store.feature_names[:4]
+    X, y = era_store.features(features), era_store.target()
+    model = fit_model("linear", X, y, n_threads=1)
+    rows = slice(0, era_store.n_rows)
+    model_id = model_id_for("linear", "linear", features, {}, 1, 42, rows)
+    model_registry(42, numerai_data).save(model_id, model, {"features": features})
+
+    validation = EraStore(dataset_path("validation", seed=42, data_dir=numerai_data))
+    first = model_predictions(model_id, "validation", seed=42, data_dir=numerai_data)
+    np.testing.assert_allclose(
+        first, model.predict(validation.features(features)), rtol=1e-6, atol=1e-6
+    )
+
+    # Served from the store: the model is no longer needed.
+    shutil.rmtree(seed_path(42, numerai_data) / "models" / model_id)
+    second = model_predictions(model_id, "validation", seed=42, data_dir=numerai_data)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_chunked_predictions_match_whole_split(numerai_data):
+    """Test that tournament rows stream in chunks through the validation pipeline."""
+    era_store = EraStore(dataset_path("training", seed=42, data_dir=numerai_data))
+    features = era_store.feature_names[:6]
+    X, y = era_store.features(features), era_store.target()
+    model = fit_model("hist_gbdt", X, y, {"max_iter": 5})
+    model_id = model_id_for("hist_gbdt", "hist_gbdt", features, {}, 1, 42, slice(0, 10))
+    model_registry(42, numerai_data).save(model_id, model, {"features": features})
+
+    for dataset in ("validation", "tournament"):
+        split = EraStore(dataset_path(dataset, seed=42, data_dir=numerai_data))
+        chunked = model_predictions(
+            model_id, dataset, seed=42, data_dir=numerai_data, chunk_rows=7
+        )
+        assert chunked.shape == (split.n_rows,)
+        np.testing.assert_array_equal(chunked, model.predict(split.features(features)))
+
+
+def test_incomplete_chunks_not_stored(tmp_path):
+    """Test that a short chunk stream leaves nothing in the store."""
+    store = PredictionStore(tmp_path)
+    with pytest.raises(ValueError):
+        store.put_chunks("linear-abc", "tournament", 10, [np.zeros(4), np.zeros(4)])
+    assert store.entries() == []
+    assert list((tmp_path / "linear-abc").iterdir()) == []
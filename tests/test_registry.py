@@ -0,0 +1,67 @@
+"""Tests for the content-addressed model registry."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.registry import ModelRegistry, model_id_for
+from medallion_bench.training import fit_model
+
+
+def _id(**overrides):
+    inputs = {
+        "model_type": "hist_gbdt",
+        "engine": "hist_gbdt",
+        "features": ["feature_a", "feature_b"],
+        "hyperparameters": {"max_iter": 5, "learning_rate": 0.1},
+        "seed": 1,
+        "data_seed": 42,
+        "rows": slice(0, 100),
+    }
+    inputs.update(overrides)
+    return model_id_for(**inputs)
+
+
+def test_model_id_is_content_addressed():
+    """Test that ids depend on training inputs only."""
+    assert _id() == _id(hyperparameters={"learning_rate": 0.1, "max_iter": 5})
+    assert _id().startswith("hist_gbdt-")
+    assert _id() != _id(seed=2)
+    assert _id() != _id(rows=slice(0, 50))
+    assert _id() != _id(features=["feature_b", "feature_a"])
+    assert _id() != _id(base_model_id="hist_gbdt-000000000000")
+    assert _id() == _id(targets=["target"])
+    assert _id() != _id(targets=["target", "target_nomi_20"])
+
+
+def test_save_and_load(tmp_path):
+    """Test that registered models round-trip with their metadata."""
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 5, (200, 3), dtype=np.uint8)
+    y = rng.random(200).astype(np.float32)
+    model = fit_model("linear", X, y, n_threads=1)
+
+    registry = ModelRegistry(tmp_path)
+    registry.save("linear-abc", model, {"train_corr": 0.1})
+    assert "linear-abc" in registry
+    assert registry.metadata("linear-abc")["train_corr"] == 0.1
+    loaded = registry.load("linear-abc")
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+    assert registry.model_ids() == ["linear-abc"]
+    with pytest.raises(KeyError):
+        registry.load("missing")
+
+
+def test_lineage(tmp_path):
+    """Test that lineage is read from the continued model's metadata."""
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 5, (50, 2), dtype=np.uint8)
+    model = fit_model("linear", X, rng.random(50))
+    registry = ModelRegistry(tmp_path)
+    registry.save("linear-a", model, {})
+    registry.save(
+        "linear-b", model, {"base_model_id": "linear-a", "lineage": ["linear-a"]}
+    )
+    assert registry.lineage("linear-a") == []
+    assert registry.lineage("linear-b") == ["linear-a"]
+    with pytest.raises(KeyError):
+        registry.lineage("missing")
@@ -0,0 +1,162 @@
+"""Tests for the memory-mapped era store."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.store import (
+    DATA_VERSION,
+    EraStore,
+    EraStoreWriter,
+    dataset_path,
+    dequantize,
+    parse_era_range,
+)
+
+
+@pytest.fixture
+def small_store(tmp_path):
+    """Write a small store spanning several feature blocks."""
+    rng = np.random.default_rng(0)
+    n_rows, n_features = 50, 10
+    X = rng.integers(0, 5, (n_rows, n_features), dtype=np.uint8)
+    y = rng.random(n_rows).astype(np.float32)
+    eras = np.repeat(np.arange(1, 6), 10).astype(np.int32)
+    names = [f"feature_{i}" for i in range(n_features)]
+
+    writer = EraStoreWriter(
+        tmp_path / "training", "training", names, n_rows, block_size=4
+    )
+    writer.write(0, X[:30], y[:30], eras[:30])
+    writer.write(30, X[30:], y[30:], eras[30:])
+    return writer.close(), X, y, eras
+
+
+def test_store_roundtrip(small_store):
+    """Test that written data reads back unchanged."""
+    era_store, X, y, eras = small_store
+    assert era_store.n_rows == 50
+    assert era_store.n_blocks == 3
+    np.testing.assert_array_equal(era_store.features(), X)
+    np.testing.assert_array_equal(era_store.target(), y)
+    np.testing.assert_array_equal(era_store.eras(), eras)
+
+
+def test_contiguous_projection_is_zero_copy(small_store):
+    """Test that a projection inside one block is a memmap view."""
+    era_store, X, _, _ = small_store
+    view = era_store.features(["feature_4", "feature_5", "feature_6"])
+    assert isinstance(view.base, np.memmap) or isinstance(view, np.memmap)
+    np.testing.assert_array_equal(view, X[:, 4:7])
+
+
+def test_projection_across_blocks(small_store):
+    """Test column projection across blocks with row selection."""
+    era_store, X, _, _ = small_store
+    names = ["feature_9", "feature_1", "feature_5"]
+    np.testing.assert_array_equal(
+        era_store.features(names, rows=slice(10, 20)), X[10:20][:, [9, 1, 5]]
+    )
+    rows = np.array([3, 7, 41])
+    np.testing.assert_array_equal(
+        era_store.features(names, rows=rows), X[rows][:, [9, 1, 5]]
+    )
+
+
+def test_unknown_feature_raises(small_store):
+    """Test that unknown feature names are rejected."""
+    era_store = small_store[0]
+    with pytest.raises(KeyError):
+        era_store.features(["feature_missing"])
+
+
+def test_writer_rejects_float_features(tmp_path):
+    """Test that the writer enforces the uint8 feature contract."""
+    writer = EraStoreWriter(tmp_path / "training", "training", ["feature_0"], 2)
+    with pytest.raises(ValueError):
+        writer.write(0, np.zeros((2, 1), dtype=np.float32), np.zeros(2), np.ones(2))
+
+
+def test_target_projection(tmp_path):
+    """Test that all targets are one zero-copy matrix and subsets are gathered."""
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 5, (20, 3), dtype=np.uint8)
+    Y = rng.random((20, 3)).astype(np.float32)
+    eras = np.repeat(np.arange(1, 3), 10).astype(np.int32)
+    writer = EraStoreWriter(
+        tmp_path / "training", "training", ["a", "b", "c"], 20,
+        target_names=["target", "target_x", "target_y"],
+    )
+    writer.write(0, X, Y, eras)
+    era_store = writer.close()
+
+    everything = era_store.targets()
+    assert isinstance(everything, np.memmap) and everything.shape == (20, 3)
+    np.testing.assert_array_equal(everything, Y)
+    np.testing.assert_array_equal(
+        era_store.targets(["target_y", "target"], slice(5, 15)), Y[5:15, [2, 0]]
+    )
+    np.testing.assert_array_equal(era_store.target(), Y[:, 0])
+    with pytest.raises(KeyError):
+        era_store.targets(["target_z"])
+
+
+def test_dequantize():
+    """Test that codes map to Numerai feature values."""
+    codes = np.array([[0, 1], [2, 4]], dtype=np.uint8)
+    values = dequantize(codes)
+    assert values.dtype == np.float32
+    np.testing.assert_array_equal(values, [[0.0, 0.25], [0.5, 1.0]])
+
+
+def test_incomplete_store_not_opened(tmp_path):
+    """Test that a store without a manifest cannot be opened."""
+    EraStoreWriter(tmp_path / "partial", "training", ["feature_0"], 5)
+    with pytest.raises(FileNotFoundError):
+        EraStore(tmp_path / "partial")
+
+
+def test_era_index_resolves_ranges(small_store):
+    """Test that era ranges resolve to contiguous row slices."""
+    era_store, _, _, eras = small_store
+    assert era_store.era_list == [1, 2, 3, 4, 5]
+    assert era_store.era_rows(2, 3) == slice(10, 30)
+    assert era_store.era_rows(4, None) == slice(30, 50)
+    assert era_store.era_rows(7, 9) == slice(0, 0)
+    np.testing.assert_array_equal(era_store.eras(era_store.era_rows(3, 3)), eras[20:30])
+
+
+def test_data_paths_are_versioned(tmp_path):
+    """Test that data written by another generator version is not reused."""
+    path = dataset_path("training", seed=7, data_dir=tmp_path)
+    assert path == tmp_path / f"v{DATA_VERSION}" / "seed_7" / "training"
+
+
+def test_parse_era_range():
+    """Test era range parsing."""
+    assert parse_era_range(None) == (None, None)
+    assert parse_era_range("1-120") == (1, 120)
+    assert parse_era_range("121") == (121, 121)
+    assert parse_era_range("100-") == (100, None)
+    for bad in ["a-b", "10-5"]:
+        with pytest.raises(ValueError):
+            parse_era_range(bad)
+
+
+def test_unordered_eras_rejected(tmp_path):
+    """Test that the era index requires era-ordered rows."""
+    writer = EraStoreWriter(tmp_path / "training", "training", ["feature_0"], 2)
+    writer.write(0, np.zeros((2, 1), dtype=np.uint8), np.zeros(2), np.array([2, 1]))
+    with pytest.raises(ValueError):
+        writer.close()
+
+
+def test_iter_era_batches(small_store):
+    """Test streaming whole eras in fixed-size batches."""
+    era_store, X, y, eras = small_store
+    rows = era_store.era_rows(2, 5)
+    batches = list(era_store.iter_era_batches(2, ["feature_3", "feature_8"], rows))
+    assert [np.unique(b[2]).tolist() for b in batches] == [[2, 3], [4, 5]]
+    np.testing.assert_array_equal(
+        np.concatenate([b[0] for b in batches]), X[10:][:, [3, 8]]
+    )
+    np.testing.assert_array_equal(np.concatenate([b[1] for b in batches]), y[10:])
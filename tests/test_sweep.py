@@ -0,0 +1,55 @@
+"""Tests for successive-halving sweeps."""
+
+import numpy as np
+import pytest
+
+from medallion_bench.sweep import (
+    era_subset,
+    halving_schedule,
+    holdout_split,
+    sample_configs,
+)
+
+
+def test_sample_configs_without_replacement():
+    """Test distinct, reproducible configurations from the grid."""
+    space = {"max_iter": [10, 20, 40], "learning_rate": [0.05, 0.1]}
+    configs = sample_configs(space, 4, seed=1)
+    assert len(configs) == 4
+    assert len({tuple(c.items()) for c in configs}) == 4
+    assert configs == sample_configs(space, 4, seed=1)
+    assert len(sample_configs(space, 50)) == 6
+    with pytest.raises(ValueError):
+        sample_configs({"max_iter": []}, 3)
+
+
+def test_halving_schedule():
+    """Test rung sizes shrink by eta while eras grow to the full set."""
+    assert halving_schedule(9, 90, eta=3) == [(9, 10), (3, 30), (1, 90)]
+    assert halving_schedule(1, 90) == [(1, 90)]
+    schedule = halving_schedule(27, 20, eta=3, min_eras=4)
+    assert schedule == [(27, 4), (9, 4), (3, 7), (1, 20)]
+    with pytest.raises(ValueError):
+        halving_schedule(9, 90, eta=1)
+
+
+def test_holdout_split_and_era_subset():
+    """Test the purged held-out block and evenly spread era subsets."""
+    train, test = holdout_split(np.arange(20), purge=2)
+    assert test.tolist() == [16, 17, 18, 19]
+    assert train.tolist() == list(range(14))
+    assert era_subset(train, 3).tolist() == [0, 6, 13]
+    with pytest.raises(ValueError):
+        holdout_split(np.arange(4), purge=2)
+
+
+def test_sample_configs_from_a_large_grid():
+    """Test sampling a grid far too large to enumerate."""
+    space = {f"param_{i}": list(range(10)) for i in range(8)}
+    configs = sample_configs(space, 20, seed=3)
+    assert len({tuple(c.items()) for c in configs}) == 20
+    assert all(list(c) == list(space) for c in configs)
+    huge = {f"param_{i}": list(range(100)) for i in range(12)}
+    assert len(sample_configs(huge, 5)) == 5
+    with pytest.raises(ValueError):
+        sample_configs({"alpha": 1.0}, 3)
@@ -0,0 +1,79 @@
+"""Tests for the synthetic Numerai data generator."""
+
+import numpy as np
+
+from medallion_bench.store import open_store, seed_path
+from medallion_bench.synthetic import (
+    REGIME_NAMES,
+    ensure_numerai_data,
+    generate_numerai_data,
+    regime_labels,
+)
+
+from .conftest import SMALL_SHAPE
+
+
+def _files(root):
+    return {p.relative_to(root): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+
+def test_same_seed_is_byte_identical(tmp_path):
+    """Test that generation is reproducible from the seed alone."""
+    first = generate_numerai_data(seed=7, data_dir=tmp_path / "a", **SMALL_SHAPE)
+    second = generate_numerai_data(seed=7, data_dir=tmp_path / "b", **SMALL_SHAPE)
+    assert _files(first) == _files(second)
+
+
+def test_different_seeds_differ(tmp_path):
+    """Test that different seeds produce different data."""
+    generate_numerai_data(seed=1, data_dir=tmp_path, **SMALL_SHAPE)
+    generate_numerai_data(seed=2, data_dir=tmp_path, **SMALL_SHAPE)
+    a = open_store("training", seed=1, data_dir=tmp_path).features()
+    b = open_store("training", seed=2, data_dir=tmp_path).features()
+    assert not np.array_equal(a, b)
+
+
+def test_numerai_shape(numerai_data):
+    """Test splits, eras, feature bins and the live slice."""
+    training = open_store("training", data_dir=numerai_data)
+    validation = open_store("validation", data_dir=numerai_data)
+    live = open_store("tournament", data_dir=numerai_data)
+
+    assert training.n_rows == SMALL_SHAPE["training_rows"]
+    assert training.n_features == SMALL_SHAPE["n_features"]
+    assert np.unique(training.eras()).tolist() == list(range(1, 13))
+    assert np.unique(validation.eras()).tolist() == list(range(13, 17))
+    assert np.unique(live.eras()).tolist() == [17]
+
+    features = training.features()
+    assert features.dtype == np.uint8
+    assert set(np.unique(features)) == {0, 1, 2, 3, 4}
+    assert set(np.unique(training.target())) == {0.0, 0.25, 0.5, 0.75, 1.0}
+    assert len(training.target_names) > 1
+    assert np.isnan(live.target()).all()
+
+
+def test_auxiliary_targets_track_the_main_target(numerai_data):
+    """Test that auxiliary targets correlate with, but differ from, the main one."""
+    targets = open_store("training", data_dir=numerai_data).targets()
+    corr = np.corrcoef(np.asarray(targets), rowvar=False)[0, 1:]
+    assert np.all(corr > 0.3) and np.all(corr < 0.95)
+    assert np.all(np.diff(corr) < 0)
+
+
+def test_ensure_reuses_existing_data(numerai_data):
+    """Test that existing data is not regenerated."""
+    manifest = seed_path(42, numerai_data) / "training" / "manifest.json"
+    mtime = manifest.stat().st_mtime_ns
+    ensure_numerai_data(seed=42, data_dir=numerai_data)
+    assert manifest.stat().st_mtime_ns == mtime
+
+
+def test_regime_labels(numerai_data):
+    """Test that every era gets one of three equally common regimes."""
+    eras, codes = regime_labels(seed=42, data_dir=numerai_data)
+    np.testing.assert_array_equal(eras, np.arange(1, 18))
+    np.testing.assert_array_equal(np.bincount(codes), [6, 6, 5])
+    _, again = regime_labels(seed=42, data_dir=numerai_data)
+    np.testing.assert_array_equal(again, codes)
+    assert len(REGIME_NAMES) == 3
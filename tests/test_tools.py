@@ -0,0 +1,501 @@
+"""Tests for MedallionBench tools."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from inspect_ai.util import store
+
+from medallion_bench import synthetic
+from medallion_bench.cache import dataset_cache
+from medallion_bench.dataset import _get_data_config
+from medallion_bench.ledger import BankrollLedger
+from medallion_bench.store import DATA_DIR_ENV, seed_path
+from medallion_bench.synthetic import generate_numerai_data
+from medallion_bench.tools import (
+    business_sim_tool,
+    ensemble_tool,
+    feature_metadata_tool,
+    hyperparameter_sweep_tool,
+    iter_numerai_data,
+    model_evaluation_tool,
+    model_training_tool,
+    neutralization_tool,
+    numerai_data_tool,
+    prediction_tool,
+    risk_metrics_tool,
+    stake_risk_tool,
+    submission_simulator_tool,
+    training_jobs_tool,
+    training_result_tool,
+    training_status_tool,
+)
+
+from .conftest import SMALL_SHAPE
+
+
+def _model_id(result: str) -> str:
+    """Model ID reported on the second line of a training result."""
+    return result.splitlines()[1].split(": ")[1]
+
+
+@pytest.mark.asyncio
+async def test_load_numerai_data(numerai_data):
+    """Test loading a dataset split with column projection."""
+    load = numerai_data_tool()
+    features = ["feature_intelligence1", "feature_charisma1"]
+    result = await load("training", features=features)
+    assert "1,200 rows × 2 features" in result
+    assert "eras 1-12" in result
+    assert "Targets: 4 columns, one (1,200, 4) float32 array" in result
+    assert "target_nomi_20: mean" in result
+
+
+@pytest.mark.asyncio
+async def test_load_numerai_data_errors(numerai_data):
+    """Test unknown datasets and features are reported."""
+    load = numerai_data_tool()
+    assert "Unknown dataset type" in await load("bogus")
+    assert "Unknown features" in await load("training", features=["feature_missing"])
+
+
+@pytest.mark.asyncio
+async def test_load_numerai_data_era_gating(numerai_data):
+    """Test era-range pushdown within the round's allowed eras."""
+    store().set("data_config", _get_data_config(round_num=1, phase=1))
+    load = numerai_data_tool()
+    assert "eras 3-4" in await load("training", era_range="3-4")
+    assert "eras 1-6" in await load("training")
+    assert "not available" in await load("tournament")
+
+
+@pytest.mark.asyncio
+async def test_load_numerai_data_copies_nothing(numerai_data):
+    """Test that loading reports from the memory map without caching arrays."""
+    load = numerai_data_tool()
+    cached = dataset_cache().nbytes
+    result = await load("validation", features=["feature_intelligence1"])
+    assert "0.0 MB mapped (nothing copied)" in result
+    assert dataset_cache().nbytes == cached
+
+
+@pytest.mark.asyncio
+async def test_data_generation_keeps_the_event_loop_free(tmp_path, monkeypatch):
+    """Test that first-use data generation does not stall other samples."""
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+
+    def slow_generate(seed, data_dir=None, **shape):
+        time.sleep(0.3)
+        return generate_numerai_data(seed, data_dir, **SMALL_SHAPE)
+
+    monkeypatch.setattr(synthetic, "generate_numerai_data", slow_generate)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while not loading.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    loading = asyncio.ensure_future(numerai_data_tool()("training"))
+    await tick()
+    assert "1,200 rows" in loading.result()
+    assert ticks >= 10
+
+
+def test_iter_numerai_data_history(numerai_data):
+    """Test streaming history across splits under Phase 4 gating."""
+    store().set("data_config", _get_data_config(round_num=30, phase=4))
+    eras = [int(era[0]) for _, _, era in iter_numerai_data("history", eras_per_batch=5)]
+    assert eras == [1, 6, 11, 13]
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    with pytest.raises(ValueError):
+        next(iter_numerai_data("history"))
+
+
+@pytest.mark.asyncio
+async def test_describe_features(numerai_data):
+    """Test feature metadata output and phase gating."""
+    describe = feature_metadata_tool()
+    result = await describe(top_k=3)
+    assert "intelligence" in result
+    assert "Top 3 features" in result
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "not available" in await describe()
+
+
+@pytest.mark.asyncio
+async def test_train_model(numerai_data):
+    """Test that training reports measured results."""
+    train = model_training_tool()
+    features = ["feature_intelligence1", "feature_wisdom2"]
+    result = await train("hist_gbdt", features, {"max_iter": 5})
+    assert "engine: hist_gbdt" in result
+    assert "Training Time:" in result
+    assert "Error" in await train("random_forest", [], {})
+
+
+@pytest.mark.asyncio
+async def test_train_model_registry_hit(numerai_data):
+    """Test that identical training requests reuse the registered model."""
+    train = model_training_tool()
+    args = ("hist_gbdt", ["feature_intelligence1"], {"max_iter": 5})
+    first = await train(*args)
+    second = await train(*args)
+    assert "registry hit" not in first
+    assert "registry hit" in second
+    assert _model_id(first) == _model_id(second)
+    assert _model_id(first).startswith("hist_gbdt-")
+
+
+@pytest.mark.asyncio
+async def test_submit_and_collect_training(numerai_data):
+    """Test background training through the job tools."""
+    submit = training_jobs_tool()
+    status = training_status_tool()
+    result = training_result_tool()
+
+    submitted = await submit("linear", ["feature_wisdom1"], {})
+    job_id = submitted.split()[-1]
+    assert job_id.startswith("linear-")
+    assert "Model ID: " + job_id in await result(job_id, wait=True)
+    assert "done" in await status([job_id])
+    assert "unknown" in await status(["linear-missing"])
+
+
+@pytest.mark.asyncio
+async def test_evaluate_model(numerai_data):
+    """Test per-era evaluation of a trained model on validation data."""
+    train = model_training_tool()
+    evaluate = model_evaluation_tool()
+    trained = await train("linear", [], {})
+    model_id = _model_id(trained)
+
+    result = await evaluate(model_id)
+    assert "4 eras" in result
+    stored = seed_path(42, numerai_data) / "predictions" / model_id / "validation.npy"
+    assert stored.exists()
+    assert "Per-era correlation: 13: " in result
+    assert "Sharpe Ratio:" in result
+    assert "MMC (mean per era): " in result and "Meta-Model Correlation: " in result
+    assert "2 eras" in await evaluate(model_id, "validation", era_range="13-14")
+    assert "Cannot evaluate on tournament" in await evaluate(model_id, "tournament")
+    assert "Unknown model" in await evaluate("linear-missing")
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "MMC" not in await evaluate(model_id)
+
+
+@pytest.mark.asyncio
+async def test_evaluation_reports_cache_hits(numerai_data):
+    """Test that a repeat evaluation is served from the dataset cache."""
+    train = model_training_tool()
+    evaluate = model_evaluation_tool()
+    neutralize = neutralization_tool()
+    model_id = _model_id(await train("linear", [], {}))
+    dataset_cache().clear()
+
+    first = await evaluate(model_id, era_range="13-14")
+    assert "Data Cache: miss (0 hits, 1 misses, 1 entries" in first
+    second = await evaluate(model_id, era_range="13-14")
+    assert "Data Cache: hit (1 hits, 1 misses, 1 entries" in second
+    features = ["feature_wisdom1"]
+    assert "Data Cache: miss (1 hits, 2 misses" in await neutralize(model_id, features)
+    assert "Data Cache: hit (2 hits, 2 misses" in await neutralize(model_id, features)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_model_on_history(numerai_data):
+    """Test that streamed history scores match per-split evaluation."""
+    train = model_training_tool()
+    evaluate = model_evaluation_tool()
+    trained = await train("linear", [], {})
+    model_id = _model_id(trained)
+
+    def per_era(result):
+        return result.split("Per-era correlation: ")[1]
+
+    store().set("data_config", _get_data_config(round_num=30, phase=4))
+    history = await evaluate(model_id, "history")
+    assert "Dataset: history (1,600 rows, 16 eras)" in history
+    assert "MMC (mean per era): " in history
+    split_scores = [
+        per_era(await evaluate(model_id, name)) for name in ("training", "validation")
+    ]
+    assert per_era(history) == ", ".join(split_scores)
+    assert "2 eras" in await evaluate(model_id, "history", era_range="12-13")
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "not available" in await evaluate(model_id, "history")
+
+
+@pytest.mark.asyncio
+async def test_neutralize_predictions(numerai_data):
+    """Test neutralization output and reuse of the cached factorization."""
+    train = model_training_tool()
+    neutralize = neutralization_tool()
+    trained = await train("linear", [], {})
+    model_id = _model_id(trained)
+    features = ["feature_intelligence1", "feature_charisma1", "feature_wisdom1"]
+
+    first = await neutralize(model_id, features, proportion=1.0)
+    assert "Factorization: computed" in first
+    exposure = first.split("Feature Exposure (max |corr|): ")[1].split("\n")[0]
+    assert float(exposure.split(" -> ")[1]) < 1e-3
+    again = await neutralize(model_id, features, proportion=0.5)
+    assert "Factorization: cached" in again
+    assert "Error" in await neutralize(model_id, features, proportion=2.0)
+    assert "Unknown features" in await neutralize(model_id, ["feature_missing"])
+
+
+@pytest.mark.asyncio
+async def test_blend_predictions(numerai_data):
+    """Test weight search and fixed-weight blending of stored predictions."""
+    train = model_training_tool()
+    blend = ensemble_tool()
+    ids = []
+    feature_sets = (["feature_intelligence1", "feature_charisma1"], ["feature_wisdom1"])
+    for features in feature_sets:
+        trained = await train("linear", features, {})
+        ids.append(_model_id(trained))
+
+    searched = await blend(ids, n_candidates=32)
+    assert (
+        "Ensemble of 2 models (rank blend, weights searched over 35 candidates"
+        in searched
+    )
+    assert "scores are in-sample" in searched
+    assert "Model | Weight | Corr | Sharpe | MMC" in searched
+    assert "- MMC (mean per era): " in searched
+    fixed = await blend(ids, weights=[1.0, 1.0], method="raw", era_range="13-14")
+    assert f"{ids[0]} | 0.500" in fixed
+    assert "eras 13-14" in fixed
+    assert "Error" in await blend(ids[:1])
+    assert "Error" in await blend(ids, weights=[1.0])
+    assert "Unknown model" in await blend([ids[0], "linear-missing"])
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "not available this round" in await blend(ids)
+
+
+@pytest.mark.asyncio
+async def test_train_linear_from_gram_matrices(numerai_data):
+    """Test that ridge fits on feature subsets reuse cached Gram matrices."""
+    train = model_training_tool()
+    first = await train("linear", ["feature_intelligence1"], {})
+    assert "Pearson, from Gram matrices" in first
+    assert (seed_path(42, numerai_data) / "training" / "gram").exists()
+
+    features = ["feature_wisdom1", "feature_charisma2"]
+    second = await train("linear", features, {"alpha": 10.0})
+    assert "Pearson, from Gram matrices" in second
+    no_intercept = await train("linear", ["feature_wisdom1"], {"fit_intercept": False})
+    assert "Numerai" in no_intercept
+
+
+@pytest.mark.asyncio
+async def test_train_model_cross_validation(numerai_data):
+    """Test era-wise cross-validation through the training tool."""
+    train = model_training_tool()
+    result = await train("linear", [], {}, cv_folds=3, purge_eras=1, embargo_eras=1)
+    assert "purge 1 / embargo 1" in result
+    assert "Fold 3: eras 9-12, trained on 7 eras" in result
+    assert result.count("per-era:") == 3
+    assert "Error" in await train("linear", [], {}, cv_folds=20)
+
+
+@pytest.mark.asyncio
+async def test_sweep_hyperparameters(numerai_data):
+    """Test a ranked successive-halving sweep, including a failing config."""
+    sweep = hyperparameter_sweep_tool()
+    result = await sweep(
+        "linear", [], {"alpha": [1.0, 100.0, 1e4], "bogus": [1]}, budget=3, purge_eras=1
+    )
+    assert "Schedule (successive halving, eta=3): 3 x 4 eras -> 1 x 9 eras" in result
+    assert "Scored on held-out eras 11-12" in result
+    assert result.count("failed") == 3
+
+    search_space = {"alpha": [1.0, 100.0, 1e4]}
+    result = await sweep("linear", [], search_space, budget=3, purge_eras=1)
+    table = result.split("Hyperparameters\n")[1].splitlines()
+    assert table[0].startswith("1 | 9 | ")
+    assert table[2].startswith("3 | 4 | ")
+    assert "Best: {'alpha'" in result
+    assert "Error" in await sweep("linear", [], {"alpha": []})
+
+
+@pytest.mark.asyncio
+async def test_train_model_continues_from_base(numerai_data):
+    """Test warm-start training on new eras with recorded lineage."""
+    train = model_training_tool()
+    features = ["feature_intelligence1", "feature_wisdom1"]
+    base = await train("hist_gbdt", features, {"max_iter": 5}, era_range="1-8")
+    base_id = _model_id(base)
+
+    continued = await train("hist_gbdt", [], {"max_iter": 3}, base_model_id=base_id)
+    assert "new rows, eras 9-12" in continued
+    lineage = f"Continued From: {base_id} (1 prior models, eras 1-12 in total)"
+    assert lineage in continued
+    continued_id = _model_id(continued)
+    assert continued_id != base_id
+
+    assert "No new training eras" in await train(
+        "hist_gbdt", [], {}, base_model_id=continued_id
+    )
+    other_type = await train("linear", [], {}, base_model_id=base_id)
+    assert "is a hist_gbdt model" in other_type
+    unknown = await train("hist_gbdt", [], {}, base_model_id="hist_gbdt-x")
+    assert "Unknown model" in unknown
+
+    linear = await train("linear", features, {"alpha": 2.0}, era_range="1-8")
+    refit = await train(
+        "linear", [], {}, base_model_id=_model_id(linear)
+    )
+    assert "Continued From: linear-" in refit
+    assert "Hyperparameters: {'alpha': 2.0}" in refit
+
+
+@pytest.mark.asyncio
+async def test_train_model_on_several_targets(numerai_data):
+    """Test fitting one model on several targets and continuing it."""
+    train = model_training_tool()
+    evaluate = model_evaluation_tool()
+    features = ["feature_intelligence1", "feature_wisdom1"]
+    targets = ["target", "target_nomi_20"]
+    result = await train(
+        "hist_gbdt", features, {"max_iter": 5}, era_range="1-8", targets=targets
+    )
+    assert "Targets: 2 fitted jointly" in result
+    assert "Training Correlation per target: target " in result
+    model_id = _model_id(result)
+    single = await train("hist_gbdt", features, {"max_iter": 5}, era_range="1-8")
+    assert _model_id(single) != _model_id(result)
+    assert "Correlation (mean per era)" in await evaluate(model_id)
+
+    # Ridge on auxiliary targets bypasses the main-target Gram matrices.
+    aux = await train("linear", features, {}, targets=["target_jerome_20"])
+    assert "Target: target_jerome_20" in aux
+    assert "Numerai, mean per era" in aux
+
+    continued = await train("hist_gbdt", [], {"max_iter": 2}, base_model_id=model_id)
+    assert "Targets: 2 fitted jointly" in continued
+    assert "Targets must match" in await train(
+        "hist_gbdt", [], {}, base_model_id=model_id, targets=["target"]
+    )
+    bogus = await train("linear", features, {}, targets=["target_bogus"])
+    assert "Unknown targets" in bogus
+
+
+@pytest.mark.asyncio
+async def test_generate_predictions(numerai_data):
+    """Test storing live predictions once and era gating of the tournament split."""
+    train = model_training_tool()
+    predict = prediction_tool()
+    trained = await train("linear", ["feature_intelligence1"], {})
+    model_id = _model_id(trained)
+
+    first = await predict(model_id)
+    assert "Rows: 100 (eras 17-17), generated in 1 chunks" in first
+    assert "served from the prediction store" in await predict(model_id)
+    assert "Rows: 400" in await predict(model_id, "validation")
+    assert "Unknown model" in await predict("linear-missing")
+    assert "Unknown dataset type" in await predict(model_id, "bogus")
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "not available" in await predict(model_id)
+
+
+@pytest.mark.asyncio
+async def test_simulate_submission(numerai_data):
+    """Test replaying stored predictions as compounding payouts."""
+    train = model_training_tool()
+    simulate = submission_simulator_tool()
+    trained = await train("linear", ["feature_intelligence1", "feature_wisdom1"], {})
+    model_id = _model_id(trained)
+
+    result = await simulate(model_id, 100.0)
+    assert "Replayed: 4 validation eras (13-16)" in result
+    assert "Stake: 100.00 NMR, 50% at risk per round" in result
+    assert "Payout series (NMR): 13: " in result
+    assert "MMC (mean per era): " in result
+    final = float(result.split("Final Stake: ")[1].split(" NMR")[0])
+    total = float(result.split("Total Payout: ")[1].split(" NMR")[0])
+    assert final == pytest.approx(100.0 + total, abs=0.011)
+
+    assert "Final Stake: 100.00 NMR" in await simulate(model_id, 100.0, confidence=0.0)
+    window = await simulate(model_id, 10.0, era_range="13-14")
+    assert "2 validation eras (13-14)" in window
+    assert "Error" in await simulate(model_id, -1.0)
+    assert "Error" in await simulate(model_id, 10.0, confidence=1.5)
+    assert "Error" in await simulate("linear-missing", 10.0)
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "MMC: not scored" in await simulate(model_id, 100.0)
+
+
+@pytest.mark.asyncio
+async def test_simulate_stake_risk(numerai_data):
+    """Test comparing staking policies on bootstrapped paths."""
+    train = model_training_tool()
+    risk = stake_risk_tool()
+    trained = await train("linear", ["feature_intelligence1", "feature_wisdom1"], {})
+    model_id = _model_id(trained)
+
+    result = await risk(model_id, 100.0, n_paths=5_000)
+    assert (
+        "5,000 paths of 52 rounds from 4 validation eras (13-16), blocks of 2"
+        in result
+    )
+    assert "+ 2.0 × MMC" in result
+    table = result.split("Growth per Round\n")[1].split("\n\n")[0].splitlines()
+    levels = [row.split(" | ")[0] for row in table]
+    assert levels == ["10%", "25%", "50%", "75%", "100%"]
+    assert "of the stake at risk" in result or "put less of the stake at risk" in result
+
+    assert "2 validation eras (13-14)" in await risk(
+        model_id, 10.0, [0.5], n_paths=100, era_range="13-14"
+    )
+    assert "Error" in await risk(model_id, 10.0, [2.0])
+    assert "Error" in await risk(model_id, 10.0, n_paths=0)
+    assert "Unknown model" in await risk("linear-missing", 10.0)
+
+    store().set("data_config", _get_data_config(round_num=5, phase=1))
+    assert "MMC not available" in await risk(model_id, 10.0, n_paths=100)
+
+
+@pytest.mark.asyncio
+async def test_bankroll_ledger_tools(numerai_data):
+    """Test recording payouts and reading risk metrics of this sample."""
+    update = business_sim_tool()
+    risk = risk_metrics_tool()
+    assert "No bankroll updates" in await risk(1)
+
+    first = await update(1, 2.0, 100.0)
+    assert "Bankroll: 102.00 NMR" in first and "(+2.00%)" in first
+    await update(2, -5.0, 100.0)
+    await update(3, 1.0, 100.0)
+    metrics = await risk(3)
+    assert "Rounds Recorded: 3" in metrics
+    assert "Bankroll: 98.00 NMR (-2.00 NMR total payout)" in metrics
+    assert "Max Drawdown: 4.90%" in metrics
+    assert "as of round 2" in await risk(2)
+    assert "Error" in await update(3, 1.0, 100.0)
+    assert "Error" in await update(4, 1.0, -1.0)
+    # Only plain rows reach the store, and rejected rounds are not recorded.
+    state = json.loads(json.dumps(store().get("bankroll_ledger")))
+    assert [row[0] for row in state["rows"]] == [1, 2, 3]
+    assert BankrollLedger.from_state(state).metrics()["bankroll"] == 98.0
+
+    assert "Drawdown Duration: 2 rounds below peak (longest 2)" in metrics
+    assert "- 4 rounds: needs 4 recorded rounds" in metrics
+    assert "- 2 rounds: " in await risk(3, windows=[2, 3])
+    assert "Error" in await risk(3, windows=[1])
+    table = metrics.split("Total Payout\n")[1].splitlines()
+    assert [row.split(" | ")[0] for row in table] == ["stable", "drifting", "reversal"]
+    assert sum(int(row.split(" | ")[1]) for row in table) == 3
+
+    store().set("data_config", _get_data_config(round_num=25, phase=3))
+    assert "regime labels are not available" in await risk(3)
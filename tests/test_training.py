@@ -0,0 +1,135 @@
+"""Tests for model training backends."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from medallion_bench.store import open_store
+from medallion_bench.training import (
+    continue_model,
+    fit_model,
+    limit_threads,
+    resolve_engine,
+)
+
+
+@pytest.fixture
+def training(numerai_data):
+    """Feature codes and target of the small training split."""
+    era_store = open_store("training", data_dir=numerai_data)
+    return np.asarray(era_store.features()), np.asarray(era_store.target())
+
+
+@pytest.mark.parametrize(
+    "model_type, params",
+    [
+        ("hist_gbdt", {"n_estimators": 5}),
+        ("lightgbm", {"n_estimators": 5}),
+        ("linear", {}),
+    ],
+)
+def test_fit_model_measures_itself(training, model_type, params):
+    """Test that fits report measured time and size and can predict."""
+    X, y = training
+    model = fit_model(model_type, X, y, params, n_threads=1)
+    preds = model.predict(X)
+    assert preds.dtype == np.float32 and preds.shape == y.shape
+    assert model.train_seconds > 0
+    assert model.size_bytes > 0
+    assert model.n_threads == 1
+
+
+def test_fit_model_is_seeded(training):
+    """Test that the same seed reproduces the same model."""
+    X, y = training
+    params = {"n_estimators": 5, "max_features": 0.5}
+    a = fit_model("hist_gbdt", X, y, params, seed=3).predict(X)
+    b = fit_model("hist_gbdt", X, y, params, seed=3).predict(X)
+    np.testing.assert_array_equal(a, b)
+
+
+def test_unknown_inputs_rejected(training):
+    """Test that unknown model types and hyperparameters raise."""
+    X, y = training
+    with pytest.raises(ValueError):
+        resolve_engine("random_forest")
+    with pytest.raises(ValueError):
+        fit_model("hist_gbdt", X, y, {"not_a_param": 1})
+
+
+@pytest.mark.parametrize(
+    "model_type, params",
+    [
+        ("hist_gbdt", {"max_iter": 5}),
+        ("neural_net", {"max_iter": 5, "hidden_layer_sizes": (4,)}),
+    ],
+)
+def test_continue_model_on_new_rows(training, model_type, params):
+    """Test that continuing adds to a copy of the base model."""
+    X, y = training
+    base = fit_model(model_type, X[:600], y[:600], params, n_threads=1)
+    before = base.predict(X)
+    continued = continue_model(base, X[600:], y[600:], {"max_iter": 3}, n_threads=1)
+    np.testing.assert_array_equal(base.predict(X), before)
+    assert not np.array_equal(continued.predict(X), before)
+    assert continued.params["warm_start_iters"] == 3
+    if model_type == "hist_gbdt":
+        assert continued.estimator.n_iter_ == 8
+
+
+def test_continue_model_rejects_other_inputs(training):
+    """Test that only the iteration count can change when continuing."""
+    X, y = training
+    base = fit_model("hist_gbdt", X, y, {"max_iter": 2}, n_threads=1)
+    with pytest.raises(ValueError):
+        continue_model(base, X, y, {"learning_rate": 0.5})
+    with pytest.raises(ValueError):
+        continue_model(fit_model("linear", X, y), X, y)
+
+
+@pytest.mark.parametrize(
+    "model_type, params",
+    [
+        ("hist_gbdt", {"max_iter": 5}),
+        ("linear", {}),
+        ("neural_net", {"max_iter": 5, "hidden_layer_sizes": (4,)}),
+    ],
+)
+def test_fit_model_on_several_targets(numerai_data, model_type, params):
+    """Test that one model fits every target and predicts their mean."""
+    era_store = open_store("training", data_dir=numerai_data)
+    X = np.asarray(era_store.features())
+    Y = np.asarray(era_store.targets(["target", "target_nomi_20"]))
+    model = fit_model(model_type, X, Y, params, n_threads=1)
+    per_target = model.predict_targets(X)
+    assert per_target.shape == Y.shape and per_target.dtype == np.float32
+    np.testing.assert_allclose(model.predict(X), per_target.mean(axis=1), rtol=1e-6)
+    if model_type == "linear":
+        single = fit_model("linear", X, Y[:, 1], params, n_threads=1)
+        np.testing.assert_allclose(
+            per_target[:, 1], single.predict(X), rtol=1e-4, atol=1e-5
+        )
+    if model_type == "hist_gbdt":
+        continued = continue_model(model, X, Y, {"max_iter": 2}, n_threads=1)
+        assert [e.n_iter_ for e in continued.estimator.estimators_] == [7, 7]
+
+
+def test_thread_limits_are_serialized():
+    """Test that concurrent thread-limited blocks in one process take turns."""
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def limited(_):
+        with limit_threads(1):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(limited, range(8)))
+    assert peak[0] == 1